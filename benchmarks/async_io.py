@@ -0,0 +1,85 @@
+"""Benchmark event loop stalls while writing many core files
+
+Compares writing with write_standard_file called from a coroutine against
+awrite_standard_files, and reports the longest time the event loop was blocked.
+
+Usage: python benchmarks/async_io.py [--files N] [--concurrency N]
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Awaitable, Callable, List
+
+from aind_data_schema.core.quality_control import QCMetric, QualityControl, Stage, Status
+from aind_data_schema.utils.async_io import awrite_standard_files, map_bounded
+
+
+def quality_control(metric_count: int) -> QualityControl:
+    """Quality control with many metrics, slow enough to serialize to show up in loop latency"""
+    metric = {
+        "name": "metric",
+        "modality": {"name": "Extracellular electrophysiology", "abbreviation": "ecephys"},
+        "stage": Stage.PROCESSING,
+        "value": 1,
+        "status_history": [{"evaluator": "Automated", "timestamp": "2020-10-10T00:00:00Z", "status": Status.PASS}],
+        "tags": {"probe": "a"},
+    }
+    return QualityControl(
+        metrics=[QCMetric(**dict(metric, name=f"metric_{i}")) for i in range(metric_count)], default_grouping=["probe"]
+    )
+
+
+async def monitor_latency(stop: asyncio.Event) -> float:
+    """Longest gap between ticks of a 1 ms heartbeat, in seconds"""
+    longest = 0.0
+    last = time.perf_counter()
+    while not stop.is_set():
+        await asyncio.sleep(0.001)
+        now = time.perf_counter()
+        longest = max(longest, now - last - 0.001)
+        last = now
+    return longest
+
+
+async def measure(label: str, write: Callable[[], Awaitable[None]]) -> None:
+    """Run write while a heartbeat measures how long the loop was blocked"""
+    stop = asyncio.Event()
+    monitor = asyncio.ensure_future(monitor_latency(stop))
+    start = time.perf_counter()
+    await write()
+    elapsed = time.perf_counter() - start
+    stop.set()
+    print(f"{label:>16}: {elapsed:.3f} s total, longest loop stall {1000 * await monitor:.1f} ms")
+
+
+async def run(options: argparse.Namespace) -> None:
+    """Write the same files blocking and non blocking"""
+    model = quality_control(options.metrics)
+    with tempfile.TemporaryDirectory() as folder:
+        folders = [Path(folder) / str(i) for i in range(options.files)]
+        for output_directory in folders:
+            output_directory.mkdir()
+
+        async def write_blocking(output_directory: Path) -> None:
+            """Write from the event loop thread"""
+            model.write_standard_file(output_directory=output_directory)
+
+        await measure("blocking", lambda: map_bounded(write_blocking, folders, options.concurrency))
+        await measure("async", lambda: awrite_standard_files([(model, path) for path in folders], options.concurrency))
+
+
+def main(args: List[str]) -> None:
+    """Print total time and the longest event loop stall"""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=200)
+    parser.add_argument("--metrics", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    asyncio.run(run(parser.parse_args(args)))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,54 @@
+"""Benchmark validating many documents with 1, 2, 4 and 8 threads
+
+Validates copies of the ephys instrument example with validate_documents and reports
+throughput and speedup over one thread. Threads only run validation in parallel on
+free-threaded Python builds, with the GIL the speedup stays close to 1.
+
+Usage: PYTHONPATH=. python benchmarks/concurrent_validation.py [--documents N] [--repeat N]
+"""
+
+import argparse
+import sys
+import sysconfig
+import time
+from typing import List
+
+from aind_data_schema.core.instrument import Instrument
+from aind_data_schema.utils.concurrent_validation import validate_documents
+from examples.ephys_instrument import inst as instrument
+
+THREAD_COUNTS = [1, 2, 4, 8]
+
+
+def best_time(documents: List[str], threads: int, repeat: int) -> float:
+    """Best time in seconds to validate all documents"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        validate_documents(Instrument, documents, max_workers=threads)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(args: List[str]) -> None:
+    """Print throughput at each thread count"""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--documents", type=int, default=400)
+    parser.add_argument("--repeat", type=int, default=3)
+    options = parser.parse_args(args)
+
+    documents = [instrument.model_dump_json()] * options.documents
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, free-threaded build: {bool(sysconfig.get_config_var('Py_GIL_DISABLED'))}")
+    print(f"GIL enabled: {gil}, {options.documents} instrument documents")
+
+    validate_documents(Instrument, documents[:1])  # build the schemas
+    single = best_time(documents, 1, options.repeat)
+    print(f"{'threads':>8}{'docs/s':>10}{'speedup':>10}")
+    for threads in THREAD_COUNTS:
+        elapsed = single if threads == 1 else best_time(documents, threads, options.repeat)
+        print(f"{threads:>8}{options.documents / elapsed:>10.0f}{single / elapsed:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,69 @@
+"""Benchmark the time to import aind_data_schema modules in a fresh interpreter
+
+Usage: python benchmarks/import_time.py [module ...] [--repeat N]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from typing import List
+
+DEFAULT_MODULES = [
+    "aind_data_schema.components.coordinates",
+    "aind_data_schema.core.data_description",
+    "aind_data_schema.core.quality_control",
+    "aind_data_schema.core.instrument",
+    "aind_data_schema.core.metadata",
+]
+
+_SNIPPET = """
+import time
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+"""
+
+
+def import_time(module: str, repeat: int) -> List[float]:
+    """Import a module in `repeat` fresh interpreters and return the times in seconds"""
+    times = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", _SNIPPET.format(module=module)], check=True, capture_output=True, text=True
+        )
+        times.append(float(output.stdout.strip().splitlines()[-1]))
+    return times
+
+
+def library_build_time() -> float:
+    """Time to build every CoordinateSystemLibrary and AtlasLibrary constant on first access"""
+    snippet = """
+import time
+from aind_data_schema.components.coordinates import AtlasLibrary, CoordinateSystemLibrary
+start = time.perf_counter()
+for library in (CoordinateSystemLibrary, AtlasLibrary):
+    for name in dir(library):
+        if not name.startswith("_"):
+            getattr(library, name)
+print(time.perf_counter() - start)
+"""
+    output = subprocess.run([sys.executable, "-c", snippet], check=True, capture_output=True, text=True)
+    return float(output.stdout.strip().splitlines()[-1])
+
+
+def main(args: List[str]) -> None:
+    """Print the median and minimum import time of each module"""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--repeat", type=int, default=10)
+    options = parser.parse_args(args)
+
+    for module in options.modules:
+        times = import_time(module, options.repeat)
+        print(f"{module}: median {statistics.median(times) * 1000:.1f} ms, min {min(times) * 1000:.1f} ms")
+    print(f"Building all library constants on first access: {library_build_time() * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,58 @@
+"""Benchmark building, querying and reloading a LineageIndex
+
+Usage: python benchmarks/lineage_index.py [--raw N] [--derived N]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+from aind_data_schema.utils.lineage import LineageIndex
+
+
+def build(raw_count: int, derived_per_raw: int) -> LineageIndex:
+    """Index raw assets, each with a chain of derived assets"""
+    index = LineageIndex()
+    for i in range(raw_count):
+        raw = f"{100000 + i}_2024-01-01_10-00-00"
+        index.add(raw)
+        source = raw
+        for step in range(derived_per_raw):
+            derived = f"{raw}_step{step}_2024-01-02_10-00-00"
+            index.add(derived, [source])
+            source = derived
+    return index
+
+
+def timed(label: str, function):
+    """Run function and print its wall time"""
+    start = time.perf_counter()
+    result = function()
+    print(f"{label:>24}: {time.perf_counter() - start:.3f} s")
+    return result
+
+
+def main(args: List[str]) -> None:
+    """Print build, query and persistence times"""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--raw", type=int, default=100000)
+    parser.add_argument("--derived", type=int, default=3)
+    options = parser.parse_args(args)
+
+    index = timed("add assets", lambda: build(options.raw, options.derived))
+    timed("build adjacency", index._get_adjacency)
+    raw_names = [f"{100000 + i}_2024-01-01_10-00-00" for i in range(options.raw)]
+    timed("descendants of every raw", lambda: [index.descendants(name) for name in raw_names])
+    with tempfile.TemporaryDirectory() as folder:
+        path = Path(folder) / "lineage.json"
+        timed("save", lambda: index.save(path))
+        loaded = timed("load", lambda: LineageIndex.load(path))
+        timed("first query after load", lambda: loaded.descendants(raw_names[0]))
+    print(f"{len(index)} assets")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,105 @@
+"""Benchmark ingesting and querying metadata.nd.json files with MetadataCatalog
+
+Compares filtering through the catalog with loading every file into Metadata.
+
+Usage: python benchmarks/metadata_catalog.py [--files N]
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List
+
+from aind_data_schema_models.data_name_patterns import DataLevel
+from aind_data_schema_models.modalities import Modality
+from aind_data_schema_models.organizations import Organization
+
+from aind_data_schema.catalog import MetadataCatalog
+from aind_data_schema.components.identifiers import Code, Person
+from aind_data_schema.core.data_description import DataDescription, Funding
+from aind_data_schema.core.metadata import Metadata
+from aind_data_schema.core.processing import DataProcess, Processing, ProcessName, ProcessStage
+
+
+def write_files(root: Path, count: int) -> None:
+    """Write count metadata files, each with its own name and one of 100 subjects"""
+    data_description = DataDescription(
+        subject_id="0",
+        creation_time=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        institution=Organization.AIND,
+        funding_source=[Funding(funder=Organization.AI)],
+        data_level=DataLevel.RAW,
+        modalities=[Modality.ECEPHYS, Modality.BEHAVIOR_VIDEOS],
+        investigators=[Person(name="Jane Smith")],
+        project_name="Benchmark",
+    )
+    processing = Processing.create_with_sequential_process_graph(
+        data_processes=[
+            DataProcess(
+                experimenters=["Jane Smith"],
+                process_type=ProcessName.ANALYSIS,
+                stage=ProcessStage.ANALYSIS,
+                start_date_time=datetime(2024, 1, 2, tzinfo=timezone.utc),
+                code=Code(url="https://github.com/AllenNeuralDynamics/aind-data-schema"),
+            )
+        ]
+    )
+    template = {
+        "name": "",
+        "location": "",
+        "data_description": json.loads(data_description.model_dump_json()),
+        "processing": json.loads(processing.model_dump_json()),
+    }
+    for i in range(count):
+        template["name"] = template["location"] = f"asset_{i}"
+        template["data_description"]["subject_id"] = str(i % 100)
+        folder = root / f"asset_{i}"
+        folder.mkdir()
+        (folder / "metadata.nd.json").write_text(json.dumps(template))
+
+
+def timed(label: str, function):
+    """Run function and print its wall time"""
+    start = time.perf_counter()
+    result = function()
+    print(f"{label:>28}: {time.perf_counter() - start:.3f} s")
+    return result
+
+
+def validate_and_filter(root: Path) -> List[str]:
+    """Load every file into Metadata to filter on subject_id, the approach the catalog replaces"""
+    names = []
+    for path in root.rglob("metadata.nd.json"):
+        metadata = Metadata.model_validate_json(path.read_text())
+        if metadata.data_description.subject_id == "7":
+            names.append(metadata.name)
+    return names
+
+
+def main(args: List[str]) -> None:
+    """Print ingest and query times"""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=2000)
+    options = parser.parse_args(args)
+
+    with tempfile.TemporaryDirectory() as folder:
+        root = Path(folder)
+        write_files(root, options.files)
+        with MetadataCatalog(root / "catalog.sqlite") as catalog:
+            timed("ingest", lambda: catalog.ingest(root))
+            timed("ingest again, unchanged", lambda: catalog.ingest(root))
+            found = timed("query subject_id", lambda: catalog.query(["name"], subject_id="7"))
+            timed(
+                "query with projection",
+                lambda: catalog.query(["name", "data_description.investigators"], subject_id="7"),
+            )
+        expected = timed("validate every file", lambda: validate_and_filter(root))
+        assert sorted(row["name"] for row in found) == sorted(expected)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
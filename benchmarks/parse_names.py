@@ -0,0 +1,69 @@
+"""Benchmark parsing data asset names one at a time and in bulk
+
+Usage: python benchmarks/parse_names.py [--names N] [--repeat N]
+"""
+
+import argparse
+import re
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Callable, List
+
+from aind_data_schema_models.data_name_patterns import DataLevel, DataRegex, datetime_from_name_string
+
+from aind_data_schema.core.data_description import DataDescription
+
+
+def original_parse_name(name: str) -> dict:
+    """parse_name as it was before the patterns were compiled and cached"""
+    m = re.match(f"{DataRegex.DERIVED.value}", name)
+    if m is None:
+        raise ValueError(f"name({name}) does not match pattern")
+    return dict(
+        input=m.group("input"),
+        process_name=m.group("process_name"),
+        creation_time=datetime_from_name_string(m.group("c_datetime")),
+    )
+
+
+def derived_names(count: int) -> List[str]:
+    """Unique derived asset names"""
+    start = datetime(2024, 1, 1)
+    return [
+        f"{600000 + i}_{(start + timedelta(minutes=i)):%Y-%m-%d_%H-%M-%S}_processed_"
+        f"{(start + timedelta(minutes=i, hours=5)):%Y-%m-%d_%H-%M-%S}"
+        for i in range(count)
+    ]
+
+
+def best_time(function: Callable[[], object], repeat: int) -> float:
+    """Best wall time of function in seconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(args: List[str]) -> None:
+    """Print per-name parsing time for each approach"""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--names", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    options = parser.parse_args(args)
+
+    names = derived_names(options.names)
+    cases = {
+        "original parse_name": lambda: [original_parse_name(name) for name in names],
+        "parse_name": lambda: [DataDescription.parse_name(name, DataLevel.DERIVED) for name in names],
+        "parse_name, repeated name": lambda: [DataDescription.parse_name(names[0], DataLevel.DERIVED) for _ in names],
+        "parse_names": lambda: DataDescription.parse_names(names, DataLevel.DERIVED),
+    }
+    for label, function in cases.items():
+        print(f"{label:>26}: {best_time(function, options.repeat) / len(names) * 1e6:.2f} us/name")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,63 @@
+"""Benchmark per-item validation cost of DiscriminatedList fields as the union grows
+
+Usage: python benchmarks/union_dispatch.py [--items N] [--repeat N]
+"""
+
+import argparse
+import sys
+import time
+from typing import List, Union
+
+from pydantic import Field, create_model
+
+from aind_data_schema.base import DataModel, DiscriminatedList
+
+DEFAULT_UNION_SIZES = [1, 4, 16, 64]
+
+
+def build_union_model(size: int):
+    """Create `size` DataModel subclasses and a container with a DiscriminatedList of all of them"""
+    members = [
+        create_model(f"BenchmarkDevice{chr(65 + i // 26)}{chr(65 + i % 26)}", __base__=DataModel, name=(str, ...))
+        for i in range(size)
+    ]
+    union = Union[tuple(members)] if size > 1 else members[0]
+    container = create_model(
+        f"BenchmarkContainer{size}", __base__=DataModel, items=(DiscriminatedList[union], Field(...))
+    )
+    return members, container
+
+
+def per_item_time(size: int, items: int, repeat: int) -> float:
+    """Best per-item validation time in microseconds for a heterogeneous list"""
+    members, container = build_union_model(size)
+    payload = {
+        "items": [
+            {"object_type": members[i % size].model_fields["object_type"].default, "name": f"item {i}"}
+            for i in range(items)
+        ]
+    }
+    container.model_validate(payload)  # build the schema outside the timed region
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        container.model_validate(payload)
+        best = min(best, time.perf_counter() - start)
+    return best / items * 1e6
+
+
+def main(args: List[str]) -> None:
+    """Print per-item validation time for each union size"""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--sizes", type=int, nargs="*", default=DEFAULT_UNION_SIZES)
+    options = parser.parse_args(args)
+
+    for size in options.sizes:
+        print(f"union of {size:>3} types: {per_item_time(size, options.items, options.repeat):.2f} us/item")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,75 @@
+"""Benchmark upgrading an archive of legacy quality control files
+
+Usage: python benchmarks/upgrade_archive.py [--files N] [--metrics N] [--processes N]
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+import warnings
+from pathlib import Path
+from typing import List
+
+from aind_data_schema.core.quality_control import QualityControl
+from aind_data_schema.utils.migrations import upgrade_files
+
+
+def legacy_document(metric_count: int) -> dict:
+    """Quality control document in the v2.2 format, with tags as lists"""
+    metric = {
+        "object_type": "QC metric",
+        "name": "metric",
+        "modality": {"name": "Extracellular electrophysiology", "abbreviation": "ecephys"},
+        "stage": "Processing",
+        "value": 1,
+        "status_history": [{"evaluator": "Automated", "timestamp": "2020-10-10T00:00:00Z", "status": "Pass"}],
+        "tags": ["probe_a", "shank_1"],
+    }
+    return {
+        "object_type": "Quality control",
+        "schema_version": "2.2.1",
+        "metrics": [dict(metric, name=f"metric_{i}") for i in range(metric_count)],
+        "default_grouping": ["probe"],
+    }
+
+
+def validate_all(paths: List[Path]) -> None:
+    """Load and validate every file"""
+    for path in paths:
+        QualityControl.model_validate_json(path.read_text())
+
+
+def timed(label: str, function):
+    """Run function and print its wall time"""
+    start = time.perf_counter()
+    result = function()
+    print(f"{label:>28}: {time.perf_counter() - start:.3f} s")
+    return result
+
+
+def main(args: List[str]) -> None:
+    """Print load times before and after upgrading, and the upgrade time"""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=500)
+    parser.add_argument("--metrics", type=int, default=50)
+    parser.add_argument("--processes", type=int, default=1)
+    options = parser.parse_args(args)
+
+    warnings.simplefilter("ignore", DeprecationWarning)
+    with tempfile.TemporaryDirectory() as folder:
+        paths = [Path(folder) / f"quality_control_{i}.json" for i in range(options.files)]
+        document = json.dumps(legacy_document(options.metrics))
+        for path in paths:
+            path.write_text(document)
+
+        timed("validate legacy files", lambda: validate_all(paths))
+        timed("upgrade archive", lambda: list(upgrade_files(paths, processes=options.processes)))
+        timed("validate upgraded files", lambda: validate_all(paths))
+        timed("upgrade again (no changes)", lambda: list(upgrade_files(paths, processes=options.processes)))
+    print(f"{options.files} files, {options.metrics} metrics each")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,62 @@
+"""Benchmark validating a metadata document at each validation tier
+
+Validates the ephys example core files, and a Metadata document built from the
+examples that describe the same asset, at the structural, model and cross-file tiers.
+
+Usage: PYTHONPATH=. python benchmarks/validation_tiers.py [--repeat N]
+"""
+
+import argparse
+import json
+import sys
+import time
+import warnings
+from typing import Any, Dict, List, Type
+
+from pydantic import BaseModel
+
+from aind_data_schema.core.metadata import Metadata
+from aind_data_schema.utils.validation_tiers import VALIDATION_TIER, ValidationTier
+from examples.data_description import d as data_description
+from examples.ephys_acquisition import acquisition
+from examples.ephys_instrument import inst as instrument
+from examples.procedures import p as procedures
+from examples.subject import s as subject
+
+
+def best_time(model: Type[BaseModel], document: Dict[str, Any], tier: ValidationTier, repeat: int) -> float:
+    """Best validation time in milliseconds, each run validates a fresh copy of the document"""
+    contents = json.dumps(document)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        model.model_validate_json(contents, context={VALIDATION_TIER: tier})
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main(args: List[str]) -> None:
+    """Print validation time at each tier"""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=20)
+    options = parser.parse_args(args)
+
+    cores = [data_description, subject, procedures, instrument, acquisition]
+    documents = [(type(core), json.loads(core.model_dump_json())) for core in cores]
+    metadata = {"name": data_description.name, "location": "s3://bucket/asset"}
+    # The instrument and acquisition examples don't describe the same asset as the others
+    metadata.update(
+        {core.default_filename().removesuffix(".json"): document for core, (_, document) in zip(cores[:3], documents)}
+    )
+    documents.append((Metadata, metadata))
+
+    warnings.simplefilter("ignore")
+    tiers = list(ValidationTier)
+    print(f"{'':>16}" + "".join(f"{tier.name.lower():>12}" for tier in tiers))
+    for model, document in documents:
+        times = [best_time(model, document, tier, options.repeat) for tier in tiers]
+        print(f"{model.__name__:>16}" + "".join(f"{t:>9.2f} ms" for t in times))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -37,9 +37,9 @@ from aind_data_schema.components.coordinates import (
 t = datetime(2022, 7, 12, 7, 00, 00, tzinfo=timezone.utc)
 t2 = datetime(2022, 9, 23, 10, 22, 00, tzinfo=timezone.utc)
 
-coordinate_system = CoordinateSystemLibrary.BREGMA_RASD
-coordinate_system.name = "LAMBDA_RASD"
-coordinate_system.origin = Origin.LAMBDA
+coordinate_system = CoordinateSystemLibrary.BREGMA_RASD.model_copy(
+    update={"name": "LAMBDA_RASD", "origin": Origin.LAMBDA}, deep=True
+)
 
 probe = EphysProbe(
     name="Probe A",
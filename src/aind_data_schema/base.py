@@ -1,11 +1,14 @@
 """generic base class with supporting validators and fields for basic AIND schema"""
 
+import asyncio
+import contextvars
 import json
 import logging
 import re
-import warnings
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Annotated, Any, ClassVar, List, Literal, Optional, TypeVar, get_args
+from typing import Annotated, Any, Callable, ClassVar, Dict, List, Literal, Optional, Sequence, TypeVar, Union, get_args
 
 from pydantic import (
     AwareDatetime,
@@ -23,6 +26,10 @@ from pydantic import (
 )
 from pydantic.functional_validators import WrapValidator
 
+from aind_data_schema.utils.diagnostics import report
+from aind_data_schema.utils.json_projection import field_adapter, read_json_paths
+from aind_data_schema.utils.trusted import construct_trusted
+from aind_data_schema.utils.validation_tiers import VALIDATION_TIER, ValidationTier, get_validation_tier, tiered
 from aind_data_schema.utils.validators import recursive_check_paths, recursive_coord_system_check
 
 logger = logging.getLogger(__name__)
@@ -30,6 +37,29 @@ logger = logging.getLogger(__name__)
 MAX_FILE_SIZE = 500 * 1024  # 500KB
 
 
+def _run_in_executor(executor: Optional[Executor], function: Callable[..., Any], *args: Any) -> asyncio.Future:
+    """
+    Run a function in an executor, in a copy of the caller's context if the executor runs threads
+
+    Executors don't carry contextvars into the call by themselves, so the validation tier
+    and the diagnostics collector of the caller would be lost. Contexts can't be sent to
+    worker processes, callers pass what they need as arguments.
+    """
+    if not isinstance(executor, ProcessPoolExecutor):
+        function, args = contextvars.copy_context().run, (function, *args)
+    return asyncio.get_running_loop().run_in_executor(executor, function, *args)
+
+
+def _write_standard_contents(filename: Union[str, Path], contents: str) -> None:
+    """Write a serialized model, warning if it is larger than MAX_FILE_SIZE"""
+    with open(filename, "w") as f:
+        f.write(contents)
+
+    # Check that size doesn't exceed the maximum
+    if len(contents) > MAX_FILE_SIZE:
+        logger.warning(f"File size exceeds {MAX_FILE_SIZE / 1024} KB: {filename}")
+
+
 def _coerce_naive_datetime(v: Any, handler: ValidatorFunctionWrapHandler) -> AwareDatetime:
     """Validator to wrap around AwareDatetime to set a default timezone as user's locale"""
     try:
@@ -83,18 +113,39 @@ class _GenericModel(BaseModel, extra="allow"):
     """Base class for generic types that can be used in AIND schema"""
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.MODEL)
     def validate_fieldnames(self):
         """Warn users when field names contain forbidden characters
         These characters will cause issues with MongoDB queries
         """
         model_dict = json.loads(self.model_dump_json(by_alias=True))
         if is_dict_corrupt(model_dict):
-            warnings.warn("MongoDB queries may not work as expected for fields that contain '.' or '$'")
+            report(
+                "generic.forbidden_key_characters",
+                "MongoDB queries may not work as expected for fields that contain '.' or '$'",
+            )
         return self
 
 
 GenericModel = SerializeAsAny[_GenericModel]
 
+
+@lru_cache(maxsize=None)
+def _object_type_from_class_name(class_name: str) -> str:
+    """Convert a class name to an object_type, cached because it runs on every validation"""
+    # add spaces when a lowercase letter is followed by a capital letter
+    name_with_prespaces = re.sub(r"(?<=[a-z])(?=[A-Z])", " ", class_name)
+    # add spaces before the last capital letter in a series of capitals is followed by a lowercase letter
+    name_with_spaces = re.sub(r"(?<=\w)(?=[A-Z][a-z])", " ", name_with_prespaces)
+    name_split = name_with_spaces.split(" ", 1)
+    first_part = name_split[0]
+    if len(name_split) > 1:
+        second_part = " " + name_split[1].lower()
+    else:
+        second_part = ""
+    return first_part + second_part
+
+
 T = TypeVar("T")
 Discriminated = Annotated[T, Field(discriminator="object_type")]
 DiscriminatedList = List[Discriminated[T]]
@@ -106,7 +157,10 @@ class DataModel(BaseModel):
     Also performs validation checks / coercion / upgrades where necessary
     """
 
-    model_config = ConfigDict(extra="forbid", use_enum_values=True)
+    # defer_build: core schemas are built on first validation/serialization instead of at import.
+    # Set on every model, not only the large ones: each nested class would otherwise build its own
+    # schema at import, and importing metadata would cost as much as without deferring at all.
+    model_config = ConfigDict(extra="forbid", use_enum_values=True, defer_build=True)
     object_type: ClassVar[str]  # This prevents Pydantic from treating it as a normal field
 
     def __init_subclass__(cls, **kwargs):
@@ -116,15 +170,28 @@ class DataModel(BaseModel):
         cls.__annotations__["object_type"] = Literal[object_type_value]  # Set literal type annotation
         cls.object_type = object_type_value  # Set the value on the class itself
 
+    @classmethod
+    def model_construct(cls, _fields_set: Optional[set] = None, **values: Any):
+        """Build this class's deferred schema before the first instance created without validation
+
+        Validation builds the schemas of the classes it creates, model_construct doesn't, and an
+        instance of a class without a serializer can't be serialized through a union or SerializeAsAny.
+        """
+        if not cls.__pydantic_complete__:
+            cls.model_rebuild()
+        return super().model_construct(_fields_set, **values)
+
     @model_validator(mode="before")
     def coerce_object_type(cls, values):
         """Ensure that object_type is set to the correct value
 
         This ensures that subclasses/parent classes can be deserialized correctly
         """
-        cls_object_type = cls._object_type_from_name()
-        if values and "object_type" in values and values["object_type"] != cls_object_type:
-            values["object_type"] = cls_object_type
+        if isinstance(values, dict) and "object_type" in values:
+            cls_object_type = cls._object_type_from_name()
+            if values["object_type"] != cls_object_type:
+                # A copy, the caller's input may be shared with other documents or threads
+                values = {**values, "object_type": cls_object_type}
         return values
 
     @classmethod
@@ -136,19 +203,10 @@ class DataModel(BaseModel):
 
         Then makes everything after the first space lowercase
         """
-        # add spaces when a lowercase letter is followed by a capital letter
-        name_with_prespaces = re.sub(r"(?<=[a-z])(?=[A-Z])", " ", cls.__name__)
-        # add spaces before the last capital letter in a series of capitals is followed by a lowercase letter
-        name_with_spaces = re.sub(r"(?<=\w)(?=[A-Z][a-z])", " ", name_with_prespaces)
-        name_split = name_with_spaces.split(" ", 1)
-        first_part = name_split[0]
-        if len(name_split) > 1:
-            second_part = " " + name_split[1].lower()
-        else:
-            second_part = ""
-        return first_part + second_part
+        return _object_type_from_class_name(cls.__name__)
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.MODEL)
     def unit_validator(self):
         """Ensure that all fields matching the pattern variable_unit are set if
         they have a matching variable that is set (!= None)
@@ -214,6 +272,46 @@ class DataCoreModel(DataModel):
 
         return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower() + cls._FILE_EXTENSION.default
 
+    @classmethod
+    def load_fields(cls, path: Union[str, Path], fields: Sequence[str], validate: bool = True) -> Dict[str, Any]:
+        """
+        Read a few fields of a saved file without loading the whole document
+
+        Parameters
+        ----------
+        path : Union[str, Path]
+            File written by write_standard_file
+        fields : Sequence[str]
+            Dotted field paths, e.g. "acquisition.acquisition_start_time"
+        validate : bool
+            Validate each value against its field's type and constraints. Model validators
+            that look at other fields are not run. Each part of a path before the last must
+            then be a field holding a single model.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Value of each field, None if it is missing from the file
+        """
+        with open(path, "r") as f:
+            values = read_json_paths(f.read(), fields)
+        if validate:
+            for field, value in values.items():
+                if value is not None:
+                    values[field] = field_adapter(cls, field).validate_python(value)
+        return values
+
+    @classmethod
+    def load_trusted(cls, path: Union[str, Path]):
+        """
+        Read a file from a store of validated documents without validating it again
+
+        Nested models are built with their declared types and validators are skipped,
+        see utils.trusted for sampled verification and promoting the result.
+        """
+        with open(path, "r") as f:
+            return construct_trusted(cls, json.load(f))
+
     def write_standard_file(
         self,
         output_directory: Optional[Path] = None,
@@ -242,9 +340,59 @@ class DataCoreModel(DataModel):
             Default: None
         """
 
-        # Go through the subfields recursively and check whether paths exist
-        recursive_check_paths(self, output_directory)
+        filename = self._standard_file_path(output_directory, prefix, filename_suffix, suffix)
+        _write_standard_contents(filename, self._serialize_standard_file(output_directory))
+
+    async def awrite_standard_file(
+        self,
+        output_directory: Optional[Path] = None,
+        prefix: Optional[str] = None,
+        filename_suffix: Optional[str] = None,
+        suffix: Optional[str] = None,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        """
+        Writes schema to standard json file without blocking the event loop, see write_standard_file
+
+        Parameters
+        ----------
+        executor: Optional[Executor]
+            Executor that checks asset paths and serializes the model, e.g. a
+            ProcessPoolExecutor for large models. The file is written in the
+            loop's default executor.
+            Default: None, the loop's default executor
+        """
+        contents = await _run_in_executor(executor, self._serialize_standard_file, output_directory)
+        filename = self._standard_file_path(output_directory, prefix, filename_suffix, suffix)
+        await _run_in_executor(None, _write_standard_contents, filename, contents)
 
+    @classmethod
+    async def aload(cls, path: Union[str, Path], executor: Optional[Executor] = None):
+        """
+        Read and validate a file without blocking the event loop
+
+        Parameters
+        ----------
+        path : Union[str, Path]
+            File written by write_standard_file
+        executor : Optional[Executor]
+            Executor that validates the contents, e.g. a ProcessPoolExecutor. The file
+            is read in the loop's default executor. The caller's validation tier applies
+            in any executor, its diagnostics collector only in thread executors.
+            Default: None, the loop's default executor
+        """
+        contents = await _run_in_executor(None, Path(path).read_text)
+        validate = partial(cls.model_validate_json, context={VALIDATION_TIER: get_validation_tier()})
+        return await _run_in_executor(executor, validate, contents)
+
+    def _standard_file_path(
+        self,
+        output_directory: Optional[Path],
+        prefix: Optional[str],
+        filename_suffix: Optional[str],
+        suffix: Optional[str],
+    ) -> Union[str, Path]:
+        """Path of the standard file, see write_standard_file"""
         filename = self.default_filename()
         if prefix:
             filename = str(prefix) + "_" + filename
@@ -257,15 +405,16 @@ class DataCoreModel(DataModel):
         if output_directory is not None:
             output_directory = Path(output_directory)
             filename = output_directory / filename
+        return filename
 
-        with open(filename, "w") as f:
-            f.write(self.model_dump_json(indent=3))
-
-        # Check that size doesn't exceed the maximum
-        if len(self.model_dump_json(indent=3)) > MAX_FILE_SIZE:
-            logger.warning(f"File size exceeds {MAX_FILE_SIZE / 1024} KB: {filename}")
+    def _serialize_standard_file(self, output_directory: Optional[Path]) -> str:
+        """Check that asset paths exist and serialize the model for its standard file"""
+        # Go through the subfields recursively and check whether paths exist
+        recursive_check_paths(self, output_directory)
+        return self.model_dump_json(indent=3)
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.MODEL)
     def coordinate_system_validator(self):
         """Validate that all coordinates match the defined coordinate system"""
 
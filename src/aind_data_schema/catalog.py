@@ -0,0 +1,327 @@
+"""Local SQLite catalog of metadata.nd.json files with indexed columns for fast queries"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import zlib
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from aind_data_schema.core.quality_control import Stage, Status
+
+logger = logging.getLogger(__name__)
+
+METADATA_FILE_PATTERN = "*metadata.nd.json"
+DEFAULT_BATCH_SIZE = 500
+
+# Columns extracted from each document, in table order
+CATALOG_COLUMNS = (
+    "name",
+    "subject_id",
+    "modalities",
+    "data_level",
+    "acquisition_start_time",
+    "acquisition_end_time",
+    "instrument_id",
+    "project_name",
+    "qc_status",
+)
+INDEXED_COLUMNS = [column for column in CATALOG_COLUMNS if column != "modalities"]
+FILE_COLUMNS = ("path", "mtime_ns", "size", "sha256")
+_STAGES = {stage.value for stage in Stage}
+
+_SCHEMA = [
+    "CREATE TABLE IF NOT EXISTS assets ("
+    "path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, sha256 TEXT, "
+    + ", ".join(f"{column} TEXT" for column in CATALOG_COLUMNS)
+    + ", document BLOB)",
+    "CREATE TABLE IF NOT EXISTS asset_modalities ("
+    "path TEXT REFERENCES assets(path) ON DELETE CASCADE, modality TEXT, PRIMARY KEY (path, modality))",
+    "CREATE INDEX IF NOT EXISTS idx_asset_modalities_modality ON asset_modalities (modality)",
+    *[f"CREATE INDEX IF NOT EXISTS idx_assets_{column} ON assets ({column})" for column in INDEXED_COLUMNS],
+]
+
+
+def _get(document: Any, *keys: str) -> Any:
+    """Nested value of a JSON document, or None if any key is missing"""
+    for key in keys:
+        if not isinstance(document, dict):
+            return None
+        document = document.get(key)
+    return document
+
+
+def _utc_timestamp(value: Any) -> Optional[str]:
+    """ISO timestamp converted to UTC, so stored times compare correctly as strings"""
+    if not isinstance(value, str):
+        return None
+    try:
+        timestamp = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return value
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc)
+    return timestamp.isoformat()
+
+
+def qc_overall_status(quality_control: Optional[dict]) -> Optional[str]:
+    """
+    Overall QC status from the computed status mapping of a QualityControl document
+
+    Every metric has a stage, so the worst stage status is the overall status.
+    """
+    statuses = _get(quality_control, "status")
+    if not isinstance(statuses, dict):
+        return None
+    stage_statuses = [status for key, status in statuses.items() if key in _STAGES]
+    if not stage_statuses:
+        return None
+    for status in (Status.FAIL, Status.PENDING):
+        if status.value in stage_statuses:
+            return status.value
+    return Status.PASS.value
+
+
+def extract_columns(document: dict) -> Dict[str, Any]:
+    """
+    Catalog columns of a metadata document, read directly from its JSON without validation
+
+    Parameters
+    ----------
+    document : dict
+        Contents of a metadata.nd.json file
+
+    Returns
+    -------
+    Dict[str, Any]
+        Value of each of CATALOG_COLUMNS. Modalities are a comma separated list of abbreviations.
+    """
+    modalities = _get(document, "data_description", "modalities") or []
+    abbreviations = [_get(modality, "abbreviation") for modality in modalities]
+    return {
+        "name": _get(document, "name"),
+        "subject_id": _get(document, "subject", "subject_id") or _get(document, "data_description", "subject_id"),
+        "modalities": ",".join(sorted(str(abbreviation) for abbreviation in abbreviations if abbreviation)),
+        "data_level": _get(document, "data_description", "data_level"),
+        "acquisition_start_time": _utc_timestamp(_get(document, "acquisition", "acquisition_start_time")),
+        "acquisition_end_time": _utc_timestamp(_get(document, "acquisition", "acquisition_end_time")),
+        "instrument_id": _get(document, "acquisition", "instrument_id")
+        or _get(document, "instrument", "instrument_id"),
+        "project_name": _get(document, "data_description", "project_name"),
+        "qc_status": qc_overall_status(_get(document, "quality_control")),
+    }
+
+
+def find_metadata_files(directory: Union[str, Path]) -> Iterator[Path]:
+    """metadata.nd.json files anywhere under a directory"""
+    return Path(directory).rglob(METADATA_FILE_PATTERN)
+
+
+class MetadataCatalog:
+    """
+    SQLite catalog of metadata.nd.json files
+
+    Indexed columns are extracted from each document's JSON without validating it,
+    and the full document is kept zlib compressed. Ingestion is incremental: files
+    whose modification time and size are unchanged are skipped, and files whose
+    content hash is unchanged are not parsed again.
+    """
+
+    def __init__(self, database: Union[str, Path] = ":memory:") -> None:
+        """Open or create a catalog
+
+        Parameters
+        ----------
+        database : Union[str, Path]
+            SQLite database file, or ":memory:" for a temporary catalog
+        """
+        self.connection = sqlite3.connect(str(database))
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        with self.connection:
+            for statement in _SCHEMA:
+                self.connection.execute(statement)
+
+    def __enter__(self) -> "MetadataCatalog":
+        """Use the catalog as a context manager"""
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Close the database connection"""
+        self.close()
+
+    def close(self) -> None:
+        """Close the database connection"""
+        self.connection.close()
+
+    def __len__(self) -> int:
+        """Number of cataloged files"""
+        return self.connection.execute("SELECT COUNT(*) FROM assets").fetchone()[0]
+
+    def _known_files(self) -> Dict[str, Tuple[int, int, str]]:
+        """Modification time, size and hash of every cataloged file"""
+        rows = self.connection.execute("SELECT path, mtime_ns, size, sha256 FROM assets")
+        return {path: (mtime_ns, size, sha256) for path, mtime_ns, size, sha256 in rows}
+
+    @staticmethod
+    def _read(path: str, stat: os.stat_result, known: Optional[Tuple[int, int, str]]) -> Tuple[str, Optional[tuple]]:
+        """Classify a file as unchanged, touched or changed, and build its row if it changed"""
+        if known is not None and known[:2] == (stat.st_mtime_ns, stat.st_size):
+            return "unchanged", None
+        content = Path(path).read_bytes()
+        sha256 = hashlib.sha256(content).hexdigest()
+        if known is not None and known[2] == sha256:
+            return "touched", (stat.st_mtime_ns, stat.st_size, path)
+        columns = extract_columns(json.loads(content))
+        row = (
+            path,
+            stat.st_mtime_ns,
+            stat.st_size,
+            sha256,
+            *(columns[column] for column in CATALOG_COLUMNS),
+            zlib.compress(content),
+        )
+        return "changed", row
+
+    def _write_batch(self, changed: List[tuple], touched: List[tuple]) -> None:
+        """Insert or replace changed rows and update the file times of touched ones in one transaction"""
+        placeholders = ", ".join("?" * (len(FILE_COLUMNS) + len(CATALOG_COLUMNS) + 1))
+        modalities_column = len(FILE_COLUMNS) + CATALOG_COLUMNS.index("modalities")
+        with self.connection:
+            self.connection.executemany(f"INSERT OR REPLACE INTO assets VALUES ({placeholders})", changed)
+            self.connection.executemany("DELETE FROM asset_modalities WHERE path = ?", [(row[0],) for row in changed])
+            self.connection.executemany(
+                "INSERT INTO asset_modalities VALUES (?, ?)",
+                [(row[0], modality) for row in changed for modality in row[modalities_column].split(",") if modality],
+            )
+            self.connection.executemany("UPDATE assets SET mtime_ns = ?, size = ? WHERE path = ?", touched)
+        changed.clear()
+        touched.clear()
+
+    def ingest(
+        self,
+        paths: Union[str, Path, Iterable[Union[str, Path]]],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        prune: bool = False,
+    ) -> Dict[str, int]:
+        """
+        Add or update metadata files in the catalog
+
+        Parameters
+        ----------
+        paths : Union[str, Path, Iterable[Union[str, Path]]]
+            A directory to search for metadata.nd.json files, or a list of files
+        batch_size : int
+            Number of files written per transaction
+        prune : bool
+            Remove cataloged files that no longer exist
+
+        Returns
+        -------
+        Dict[str, int]
+            Number of files that were added or changed, unchanged, or failed to load, and rows removed
+        """
+        if isinstance(paths, (str, Path)) and Path(paths).is_dir():
+            paths = find_metadata_files(paths)
+        elif isinstance(paths, (str, Path)):
+            paths = [paths]
+
+        known = self._known_files()
+        counts = {"changed": 0, "unchanged": 0, "failed": 0, "removed": 0}
+        batches = {"changed": [], "touched": []}
+        for path in paths:
+            path = str(Path(path).resolve())
+            try:
+                state, row = self._read(path, os.stat(path), known.get(path))
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not catalog {path}: {e}")
+                counts["failed"] += 1
+                continue
+            counts["changed" if state == "changed" else "unchanged"] += 1
+            if row is not None:
+                batches[state].append(row)
+            if len(batches["changed"]) + len(batches["touched"]) >= batch_size:
+                self._write_batch(batches["changed"], batches["touched"])
+        self._write_batch(batches["changed"], batches["touched"])
+
+        if prune:
+            missing = [(path,) for path in known if not os.path.exists(path)]
+            with self.connection:
+                self.connection.executemany("DELETE FROM assets WHERE path = ?", missing)
+            counts["removed"] = len(missing)
+        return counts
+
+    @staticmethod
+    def _where(filters: Dict[str, Any], modality: Optional[str]) -> Tuple[str, List[Any]]:
+        """SQL WHERE clause and parameters for column filters"""
+        clauses, parameters = [], []
+        for column, value in filters.items():
+            if column not in CATALOG_COLUMNS or column == "modalities":
+                raise ValueError(f"Cannot filter on {column}, use one of {INDEXED_COLUMNS} or modality")
+            if isinstance(value, (list, tuple, set)):
+                clauses.append(f"{column} IN ({', '.join('?' * len(value))})")
+                parameters.extend(value)
+            else:
+                clauses.append(f"{column} = ?")
+                parameters.append(value)
+        if modality is not None:
+            clauses.append("path IN (SELECT path FROM asset_modalities WHERE modality = ?)")
+            parameters.append(modality)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", parameters
+
+    def query(
+        self,
+        fields: Optional[Sequence[str]] = None,
+        modality: Optional[str] = None,
+        acquired_after: Optional[datetime] = None,
+        acquired_before: Optional[datetime] = None,
+        **filters: Any,
+    ) -> List[Dict[str, Any]]:
+        """
+        Find cataloged assets without validating their metadata
+
+        Parameters
+        ----------
+        fields : Optional[Sequence[str]]
+            Fields to return. Catalog columns are read from the index, other fields are
+            dotted paths into the stored document, e.g. "subject.subject_id".
+            Defaults to the catalog columns.
+        modality : Optional[str]
+            Only assets with this modality abbreviation, e.g. "ecephys"
+        acquired_after, acquired_before : Optional[datetime]
+            Only assets whose acquisition started in this range
+        filters
+            Catalog column values to match, a list matches any of its values
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            One dict of the requested fields per asset, ordered by name
+        """
+        fields = list(fields or CATALOG_COLUMNS)
+        where, parameters = self._where(filters, modality)
+        for operator, bound in ((">=", acquired_after), ("<", acquired_before)):
+            if bound is not None:
+                where += (" AND " if where else " WHERE ") + f"acquisition_start_time {operator} ?"
+                parameters.append(_utc_timestamp(bound.isoformat()))
+
+        columns = [field for field in fields if field in CATALOG_COLUMNS or field in FILE_COLUMNS]
+        needs_document = len(columns) < len(fields)
+        selected = columns + (["document"] if needs_document else [])
+        rows = self.connection.execute(f"SELECT {', '.join(selected)} FROM assets{where} ORDER BY name", parameters)
+
+        results = []
+        for row in rows:
+            values = dict(zip(selected, row))
+            document = json.loads(zlib.decompress(values.pop("document"))) if needs_document else None
+            results.append(
+                {field: values[field] if field in values else _get(document, *field.split(".")) for field in fields}
+            )
+        return results
+
+    def get_document(self, name: str) -> Optional[dict]:
+        """Full metadata document of an asset, or None if it isn't cataloged"""
+        row = self.connection.execute("SELECT document FROM assets WHERE name = ?", (name,)).fetchone()
+        return None if row is None else json.loads(zlib.decompress(row[0]))
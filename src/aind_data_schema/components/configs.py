@@ -34,6 +34,7 @@ from aind_data_schema.components.coordinates import (
 from aind_data_schema.components.devices import DevicePosition
 from aind_data_schema.components.identifiers import Code
 from aind_data_schema.components.wrappers import AssetPath
+from aind_data_schema.utils.validation_tiers import ValidationTier, tiered
 
 
 class PowerFunction(str, Enum):
@@ -289,6 +290,7 @@ class PlanarImage(Image):
     planes: DiscriminatedList[Plane | CoupledPlane | Slap2Plane] = Field(..., title="Imaging planes")
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.MODEL)
     def limit_plane_to_one(self):
         """Check that only one plane is defined"""
 
@@ -347,6 +349,7 @@ class ImagingConfig(DeviceConfig):
     )
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.MODEL)
     def check_image_channels(self):
         """Check that the required channels are present for the images"""
 
@@ -359,6 +362,7 @@ class ImagingConfig(DeviceConfig):
         return self
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.MODEL)
     def require_cs_images(self):
         """Check that a coordinate system is present if any images are Image"""
 
@@ -404,6 +408,7 @@ class LickSpoutConfig(DeviceConfig):
     notes: Optional[str] = Field(default=None, title="Notes", validate_default=True)
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.MODEL)
     def validate_other(self):
         """Validator for other/notes"""
 
@@ -580,6 +585,7 @@ class MRIScan(DeviceConfig):
     notes: Optional[str] = Field(default=None, title="Notes", validate_default=True)
 
     @field_validator("notes", mode="after")
+    @tiered(ValidationTier.MODEL)
     def validate_other(cls, value: Optional[str], info: ValidationInfo) -> Optional[str]:
         """Validator for other/notes"""
 
@@ -591,6 +597,7 @@ class MRIScan(DeviceConfig):
         return value
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.MODEL)
     def validate_non_setup(self):
         """Validate that non-setup scans have affine_transform and resolution fields"""
 
@@ -1,7 +1,8 @@
 """Classes to define device positions, orientations, and coordinates"""
 
 import math
-from typing import List, Union
+import threading
+from typing import TYPE_CHECKING, Callable, List, Tuple, Union
 
 from aind_data_schema_models.atlas import AtlasName
 from aind_data_schema_models.coordinates import AxisName, Direction, Origin
@@ -11,6 +12,9 @@ from pydantic import Field
 from aind_data_schema.base import DataModel, DiscriminatedList
 from aind_data_schema.components.wrappers import AssetPath
 
+if TYPE_CHECKING:  # pragma: no cover
+    import numpy as np
+
 
 class Axis(DataModel):
     """Linked direction and axis"""
@@ -28,6 +32,18 @@ class Scale(DataModel):
 
     scale: List[float] = Field(..., title="Scale parameters")
 
+    def to_numpy(self) -> "np.ndarray":
+        """Return the affine scale matrix as a read-only ndarray
+
+        Returns
+        -------
+        np.ndarray
+            (N+1)x(N+1) affine scale matrix
+        """
+        from aind_data_schema.utils.transforms import scale_matrix
+
+        return scale_matrix(tuple(self.scale))
+
     def to_matrix(self) -> List[List[float]]:
         """Return the affine scale matrix for arbitrary sized lists
 
@@ -51,6 +67,18 @@ class Translation(DataModel):
 
     translation: List[float] = Field(..., title="Translation parameters")
 
+    def to_numpy(self) -> "np.ndarray":
+        """Return the affine translation matrix as a read-only ndarray
+
+        Returns
+        -------
+        np.ndarray
+            (N+1)x(N+1) affine translation matrix
+        """
+        from aind_data_schema.utils.transforms import translation_matrix
+
+        return translation_matrix(tuple(self.translation))
+
     def to_matrix(self) -> List[List[float]]:
         """Return the affine translation matrix for arbitrary sized lists.
 
@@ -85,6 +113,24 @@ class Rotation(DataModel):
     )
     angles_unit: AngleUnit = Field(default=AngleUnit.DEG, title="Angle unit")
 
+    def _angles_in_radians(self) -> Tuple[float, ...]:
+        """Return the angles as a tuple in radians"""
+        if self.angles_unit == AngleUnit.RAD:
+            return tuple(self.angles)
+        return tuple(math.radians(angle) for angle in self.angles)
+
+    def to_numpy(self) -> "np.ndarray":
+        """Return the 4x4 affine rotation matrix as a read-only ndarray
+
+        Returns
+        -------
+        np.ndarray
+            Affine rotation matrix.
+        """
+        from aind_data_schema.utils.transforms import rotation_matrix
+
+        return rotation_matrix(self._angles_in_radians())
+
     def to_matrix(self) -> List[List[float]]:
         """Return the affine rotation matrix for arbitrary sized lists.
 
@@ -93,21 +139,9 @@ class Rotation(DataModel):
         List[List[float]]
             Affine rotation matrix.
         """
-        try:
-            from scipy.spatial.transform import Rotation as R
-        except ImportError:  # pragma: no cover
-            raise ImportError(
-                "Please run `pip install aind-data-schema[transforms]` to "
-                "install necessary dependencies for Rotation.to_matrix"
-            )
-
-        # Prepare the angles and axes for scipy Rotation
-        angles = [angle if self.angles_unit == AngleUnit.RAD else math.radians(angle) for angle in self.angles]
-
-        # Create the rotation matrix
-        order = "xyz"[: len(self.angles)]
-        rotation = R.from_euler(order, angles)
-        rotation_matrix = rotation.as_matrix().tolist()
+        from aind_data_schema.utils.transforms import euler_rotation_matrix
+
+        rotation_matrix = euler_rotation_matrix(self._angles_in_radians()).tolist()
 
         size = len(self.angles)
         rotation_matrix = [row + [0.0] for row in rotation_matrix] + [[0.0] * size + [1.0]]
@@ -123,6 +157,18 @@ class Affine(DataModel):
         title="Affine transform matrix",
     )
 
+    def to_numpy(self) -> "np.ndarray":
+        """Return the affine transform matrix as a read-only ndarray
+
+        Returns
+        -------
+        np.ndarray
+            Affine transform matrix
+        """
+        from aind_data_schema.utils.transforms import affine_matrix
+
+        return affine_matrix(tuple(tuple(row) for row in self.affine_transform))
+
     def to_matrix(self) -> List[List[float]]:
         """Return the affine transform matrix
 
@@ -147,38 +193,11 @@ class Affine(DataModel):
         Affine
             Composed transform
         """
-        try:
-            import numpy as np
-        except ImportError:  # pragma: no cover
-            raise ImportError(
-                "Please run `pip install aind-data-schema[transforms]` "
-                "to install necessary dependencies for rotation support"
-            )
-
-        matrices = [t.to_matrix() for t in transform]
-
-        # Check that all the transforms are the same size
-        def get_shape(list_of_lists):
-            """Get the shape of a list of lists"""
-            len0 = len(list_of_lists)
-            len1 = len(list_of_lists[0])
+        from aind_data_schema.utils.transforms import compose_matrices
 
-            # Check that all the lists are the same size
-            if not all(len(lst) == len1 for lst in list_of_lists):  # pragma: no cover
-                raise ValueError("Cannot get the shape of a non-rectangular list of lists")
+        transform_matrix = compose_matrices([t.to_numpy() for t in transform])
 
-            return (len0, len1)
-
-        shape = get_shape(matrices[0])
-        if not all(get_shape(matrix) == shape for matrix in matrices):
-            raise ValueError("All transforms must be the same size")
-
-        transform_matrix = matrices[0]
-
-        for matrix in matrices[1:]:
-            transform_matrix = np.matmul(transform_matrix, matrix).tolist()
-
-        return Affine(affine_transform=transform_matrix)
+        return Affine(affine_transform=transform_matrix.tolist())
 
 
 class NonlinearTransform(DataModel):
@@ -193,6 +212,27 @@ TRANSFORM_TYPES = DiscriminatedList[Translation | Rotation | Scale | Affine]
 TRANSFORM_TYPES_NONLINEAR = DiscriminatedList[Translation | Rotation | Scale | Affine | NonlinearTransform]
 
 
+class _LazyConstant:
+    """Descriptor that builds a library constant on first access and caches it
+
+    Keeps importing this module cheap: library entries are only validated when used.
+    """
+
+    def __init__(self, factory: Callable[[], DataModel]) -> None:
+        """Initialize with a factory that builds the constant"""
+        self._factory = factory
+        self._value = None
+        self._lock = threading.Lock()
+
+    def __get__(self, instance, owner) -> DataModel:
+        """Build the constant on first access"""
+        if self._value is None:
+            with self._lock:
+                if self._value is None:
+                    self._value = self._factory()
+        return self._value
+
+
 class CoordinateSystem(DataModel):
     """Definition of a coordinate system relative to a brain"""
 
@@ -231,204 +271,238 @@ class CoordinateSystemLibrary:
     """
 
     # Standard coordinates
-    BREGMA_ARI = CoordinateSystem(
-        name="BREGMA_ARI",
-        origin=Origin.BREGMA,
-        axis_unit=SizeUnit.MM,
-        axes=[
-            Axis(name=AxisName.AP, direction=Direction.PA),
-            Axis(name=AxisName.ML, direction=Direction.LR),
-            Axis(name=AxisName.SI, direction=Direction.SI),
-        ],
+    BREGMA_ARI = _LazyConstant(
+        lambda: CoordinateSystem(
+            name="BREGMA_ARI",
+            origin=Origin.BREGMA,
+            axis_unit=SizeUnit.MM,
+            axes=[
+                Axis(name=AxisName.AP, direction=Direction.PA),
+                Axis(name=AxisName.ML, direction=Direction.LR),
+                Axis(name=AxisName.SI, direction=Direction.SI),
+            ],
+        )
     )
-    BREGMA_RAS = CoordinateSystem(
-        name="BREGMA_RAS",
-        origin=Origin.BREGMA,
-        axis_unit=SizeUnit.MM,
-        axes=[
-            Axis(name=AxisName.ML, direction=Direction.LR),
-            Axis(name=AxisName.AP, direction=Direction.PA),
-            Axis(name=AxisName.SI, direction=Direction.IS),
-        ],
+    BREGMA_RAS = _LazyConstant(
+        lambda: CoordinateSystem(
+            name="BREGMA_RAS",
+            origin=Origin.BREGMA,
+            axis_unit=SizeUnit.MM,
+            axes=[
+                Axis(name=AxisName.ML, direction=Direction.LR),
+                Axis(name=AxisName.AP, direction=Direction.PA),
+                Axis(name=AxisName.SI, direction=Direction.IS),
+            ],
+        )
     )
 
     # Standard surface coordinates (with depth)
-    BREGMA_ARID = CoordinateSystem(
-        name="BREGMA_ARID",
-        origin=Origin.BREGMA,
-        axis_unit=SizeUnit.MM,
-        axes=[
-            Axis(name=AxisName.AP, direction=Direction.PA),
-            Axis(name=AxisName.ML, direction=Direction.LR),
-            Axis(name=AxisName.SI, direction=Direction.SI),
-            Axis(name=AxisName.DEPTH, direction=Direction.UD),
-        ],
+    BREGMA_ARID = _LazyConstant(
+        lambda: CoordinateSystem(
+            name="BREGMA_ARID",
+            origin=Origin.BREGMA,
+            axis_unit=SizeUnit.MM,
+            axes=[
+                Axis(name=AxisName.AP, direction=Direction.PA),
+                Axis(name=AxisName.ML, direction=Direction.LR),
+                Axis(name=AxisName.SI, direction=Direction.SI),
+                Axis(name=AxisName.DEPTH, direction=Direction.UD),
+            ],
+        )
     )
-    BREGMA_RASD = CoordinateSystem(
-        name="BREGMA_RASD",
-        origin=Origin.BREGMA,
-        axis_unit=SizeUnit.MM,
-        axes=[
-            Axis(name=AxisName.ML, direction=Direction.LR),
-            Axis(name=AxisName.AP, direction=Direction.PA),
-            Axis(name=AxisName.SI, direction=Direction.IS),
-            Axis(name=AxisName.DEPTH, direction=Direction.UD),
-        ],
+    BREGMA_RASD = _LazyConstant(
+        lambda: CoordinateSystem(
+            name="BREGMA_RASD",
+            origin=Origin.BREGMA,
+            axis_unit=SizeUnit.MM,
+            axes=[
+                Axis(name=AxisName.ML, direction=Direction.LR),
+                Axis(name=AxisName.AP, direction=Direction.PA),
+                Axis(name=AxisName.SI, direction=Direction.IS),
+                Axis(name=AxisName.DEPTH, direction=Direction.UD),
+            ],
+        )
     )
 
     # Arena
-    ARENA_RBT = CoordinateSystem(
-        name="ARENA_RBT",
-        origin=Origin.ARENA_CENTER,
-        axis_unit=SizeUnit.CM,
-        axes=[
-            Axis(name=AxisName.X, direction=Direction.LR),
-            Axis(name=AxisName.Y, direction=Direction.FB),
-            Axis(name=AxisName.Z, direction=Direction.DU),
-        ],
+    ARENA_RBT = _LazyConstant(
+        lambda: CoordinateSystem(
+            name="ARENA_RBT",
+            origin=Origin.ARENA_CENTER,
+            axis_unit=SizeUnit.CM,
+            axes=[
+                Axis(name=AxisName.X, direction=Direction.LR),
+                Axis(name=AxisName.Y, direction=Direction.FB),
+                Axis(name=AxisName.Z, direction=Direction.DU),
+            ],
+        )
     )
 
-    SIPE_CAMERA_RBF = CoordinateSystem(
-        name="SIPE_CAMERA_RBF",
-        origin=Origin.FRONT_CENTER,
-        axis_unit=SizeUnit.MM,
-        axes=[
-            Axis(name=AxisName.X, direction=Direction.LR),
-            Axis(name=AxisName.Y, direction=Direction.UD),
-            Axis(name=AxisName.Z, direction=Direction.BF),
-        ],
+    SIPE_CAMERA_RBF = _LazyConstant(
+        lambda: CoordinateSystem(
+            name="SIPE_CAMERA_RBF",
+            origin=Origin.FRONT_CENTER,
+            axis_unit=SizeUnit.MM,
+            axes=[
+                Axis(name=AxisName.X, direction=Direction.LR),
+                Axis(name=AxisName.Y, direction=Direction.UD),
+                Axis(name=AxisName.Z, direction=Direction.BF),
+            ],
+        )
     )
 
-    SIPE_MONITOR_RTF = CoordinateSystem(
-        name="SIPE_MONITOR_RTF",
-        origin=Origin.FRONT_CENTER,
-        axis_unit=SizeUnit.MM,
-        axes=[
-            Axis(name=AxisName.X, direction=Direction.LR),
-            Axis(name=AxisName.Y, direction=Direction.DU),
-            Axis(name=AxisName.Z, direction=Direction.BF),
-        ],
+    SIPE_MONITOR_RTF = _LazyConstant(
+        lambda: CoordinateSystem(
+            name="SIPE_MONITOR_RTF",
+            origin=Origin.FRONT_CENTER,
+            axis_unit=SizeUnit.MM,
+            axes=[
+                Axis(name=AxisName.X, direction=Direction.LR),
+                Axis(name=AxisName.Y, direction=Direction.DU),
+                Axis(name=AxisName.Z, direction=Direction.BF),
+            ],
+        )
     )
 
-    SIPE_SPEAKER_LTF = CoordinateSystem(
-        name="SIPE_SPEAKER_LTF",
-        origin=Origin.FRONT_CENTER,
-        axis_unit=SizeUnit.MM,
-        axes=[
-            Axis(name=AxisName.X, direction=Direction.RL),
-            Axis(name=AxisName.Y, direction=Direction.DU),
-            Axis(name=AxisName.Z, direction=Direction.FB),
-        ],
+    SIPE_SPEAKER_LTF = _LazyConstant(
+        lambda: CoordinateSystem(
+            name="SIPE_SPEAKER_LTF",
+            origin=Origin.FRONT_CENTER,
+            axis_unit=SizeUnit.MM,
+            axes=[
+                Axis(name=AxisName.X, direction=Direction.RL),
+                Axis(name=AxisName.Y, direction=Direction.DU),
+                Axis(name=AxisName.Z, direction=Direction.FB),
+            ],
+        )
     )
 
-    MPM_MANIP_RFB = CoordinateSystem(
-        name="MPM_MANIP_RFB",
-        origin=Origin.TIP,
-        axis_unit=SizeUnit.MM,
-        axes=[
-            Axis(name=AxisName.X, direction=Direction.LR),
-            Axis(name=AxisName.Y, direction=Direction.BF),
-            Axis(name=AxisName.Z, direction=Direction.UD),
-        ],
+    MPM_MANIP_RFB = _LazyConstant(
+        lambda: CoordinateSystem(
+            name="MPM_MANIP_RFB",
+            origin=Origin.TIP,
+            axis_unit=SizeUnit.MM,
+            axes=[
+                Axis(name=AxisName.X, direction=Direction.LR),
+                Axis(name=AxisName.Y, direction=Direction.BF),
+                Axis(name=AxisName.Z, direction=Direction.UD),
+            ],
+        )
     )
 
-    PINPOINT_PROBE_RSAB = CoordinateSystem(
-        name="PINPOINT_PROBE_RSAB",
-        origin=Origin.TIP,
-        axis_unit=SizeUnit.MM,
-        axes=[
-            Axis(name=AxisName.X, direction=Direction.LR),
-            Axis(name=AxisName.Y, direction=Direction.IS),
-            Axis(name=AxisName.Z, direction=Direction.PA),
-            Axis(name=AxisName.DEPTH, direction=Direction.UD),
-        ],
+    PINPOINT_PROBE_RSAB = _LazyConstant(
+        lambda: CoordinateSystem(
+            name="PINPOINT_PROBE_RSAB",
+            origin=Origin.TIP,
+            axis_unit=SizeUnit.MM,
+            axes=[
+                Axis(name=AxisName.X, direction=Direction.LR),
+                Axis(name=AxisName.Y, direction=Direction.IS),
+                Axis(name=AxisName.Z, direction=Direction.PA),
+                Axis(name=AxisName.DEPTH, direction=Direction.UD),
+            ],
+        )
     )
 
-    SPIM_IJK = CoordinateSystem(
-        name="SPIM_IJK",
-        origin=Origin.ORIGIN,
-        axis_unit=SizeUnit.PX,
-        axes=[
-            Axis(name=AxisName.X, direction=Direction.POS),
-            Axis(name=AxisName.Y, direction=Direction.POS),
-            Axis(name=AxisName.Z, direction=Direction.POS),
-        ],
+    SPIM_IJK = _LazyConstant(
+        lambda: CoordinateSystem(
+            name="SPIM_IJK",
+            origin=Origin.ORIGIN,
+            axis_unit=SizeUnit.PX,
+            axes=[
+                Axis(name=AxisName.X, direction=Direction.POS),
+                Axis(name=AxisName.Y, direction=Direction.POS),
+                Axis(name=AxisName.Z, direction=Direction.POS),
+            ],
+        )
     )
 
-    SPIM_RPI = CoordinateSystem(
-        name="SPIM_RPI",
-        origin=Origin.ORIGIN,
-        axis_unit=SizeUnit.MM,
-        axes=[
-            Axis(name=AxisName.X, direction=Direction.LR),
-            Axis(name=AxisName.Y, direction=Direction.AP),
-            Axis(name=AxisName.Z, direction=Direction.SI),
-        ],
+    SPIM_RPI = _LazyConstant(
+        lambda: CoordinateSystem(
+            name="SPIM_RPI",
+            origin=Origin.ORIGIN,
+            axis_unit=SizeUnit.MM,
+            axes=[
+                Axis(name=AxisName.X, direction=Direction.LR),
+                Axis(name=AxisName.Y, direction=Direction.AP),
+                Axis(name=AxisName.Z, direction=Direction.SI),
+            ],
+        )
     )
 
-    SPIM_LPS = CoordinateSystem(
-        name="SPIM_LPS",
-        origin=Origin.ORIGIN,
-        axis_unit=SizeUnit.MM,
-        axes=[
-            Axis(name=AxisName.X, direction=Direction.RL),
-            Axis(name=AxisName.Y, direction=Direction.AP),
-            Axis(name=AxisName.Z, direction=Direction.IS),
-        ],
+    SPIM_LPS = _LazyConstant(
+        lambda: CoordinateSystem(
+            name="SPIM_LPS",
+            origin=Origin.ORIGIN,
+            axis_unit=SizeUnit.MM,
+            axes=[
+                Axis(name=AxisName.X, direction=Direction.RL),
+                Axis(name=AxisName.Y, direction=Direction.AP),
+                Axis(name=AxisName.Z, direction=Direction.IS),
+            ],
+        )
     )
 
-    MRI_LPS = CoordinateSystem(
-        name="MRI_LPS",
-        origin=Origin.ORIGIN,
-        axis_unit=SizeUnit.MM,
-        axes=[
-            Axis(name=AxisName.X, direction=Direction.RL),
-            Axis(name=AxisName.Y, direction=Direction.AP),
-            Axis(name=AxisName.Z, direction=Direction.IS),
-        ],
+    MRI_LPS = _LazyConstant(
+        lambda: CoordinateSystem(
+            name="MRI_LPS",
+            origin=Origin.ORIGIN,
+            axis_unit=SizeUnit.MM,
+            axes=[
+                Axis(name=AxisName.X, direction=Direction.RL),
+                Axis(name=AxisName.Y, direction=Direction.AP),
+                Axis(name=AxisName.Z, direction=Direction.IS),
+            ],
+        )
     )
 
-    IMAGE_XYZ = CoordinateSystem(
-        name="IMAGE_XYZ",
-        origin=Origin.ORIGIN,
-        axis_unit=SizeUnit.PX,
-        axes=[
-            Axis(name=AxisName.X, direction=Direction.POS),
-            Axis(name=AxisName.Y, direction=Direction.POS),
-            Axis(name=AxisName.Z, direction=Direction.POS),
-        ],
+    IMAGE_XYZ = _LazyConstant(
+        lambda: CoordinateSystem(
+            name="IMAGE_XYZ",
+            origin=Origin.ORIGIN,
+            axis_unit=SizeUnit.PX,
+            axes=[
+                Axis(name=AxisName.X, direction=Direction.POS),
+                Axis(name=AxisName.Y, direction=Direction.POS),
+                Axis(name=AxisName.Z, direction=Direction.POS),
+            ],
+        )
     )
 
 
 class AtlasLibrary:
     """Library of common atlases"""
 
-    CCFv3_10um = Atlas(
-        name=AtlasName.CCF,
-        version="3",
-        origin=Origin.ORIGIN,
-        axis_unit=SizeUnit.UM,
-        axes=[
-            Axis(name=AxisName.AP, direction=Direction.AP),
-            Axis(name=AxisName.SI, direction=Direction.SI),
-            Axis(name=AxisName.ML, direction=Direction.LR),
-        ],
-        size=[1320, 800, 1140],
-        resolution=[10, 10, 10],
-        resolution_unit=SizeUnit.UM,
+    CCFv3_10um = _LazyConstant(
+        lambda: Atlas(
+            name=AtlasName.CCF,
+            version="3",
+            origin=Origin.ORIGIN,
+            axis_unit=SizeUnit.UM,
+            axes=[
+                Axis(name=AxisName.AP, direction=Direction.AP),
+                Axis(name=AxisName.SI, direction=Direction.SI),
+                Axis(name=AxisName.ML, direction=Direction.LR),
+            ],
+            size=[1320, 800, 1140],
+            resolution=[10, 10, 10],
+            resolution_unit=SizeUnit.UM,
+        )
     )
 
-    CCFv3_25um = Atlas(
-        name=AtlasName.CCF,
-        version="3",
-        origin=Origin.ORIGIN,
-        axis_unit=SizeUnit.UM,
-        axes=[
-            Axis(name=AxisName.AP, direction=Direction.AP),
-            Axis(name=AxisName.SI, direction=Direction.SI),
-            Axis(name=AxisName.ML, direction=Direction.LR),
-        ],
-        size=[528, 320, 456],
-        resolution=[25, 25, 25],
-        resolution_unit=SizeUnit.UM,
+    CCFv3_25um = _LazyConstant(
+        lambda: Atlas(
+            name=AtlasName.CCF,
+            version="3",
+            origin=Origin.ORIGIN,
+            axis_unit=SizeUnit.UM,
+            axes=[
+                Axis(name=AxisName.AP, direction=Direction.AP),
+                Axis(name=AxisName.SI, direction=Direction.SI),
+                Axis(name=AxisName.ML, direction=Direction.LR),
+            ],
+            size=[528, 320, 456],
+            resolution=[25, 25, 25],
+            resolution_unit=SizeUnit.UM,
+        )
     )
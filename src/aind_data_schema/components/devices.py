@@ -5,7 +5,6 @@ from decimal import Decimal
 from enum import Enum
 import logging
 from typing import List, Literal, Optional
-import warnings
 
 from aind_data_schema_models.coordinates import AnatomicalRelative
 from aind_data_schema_models.devices import (
@@ -45,6 +44,8 @@ from pydantic import Field, ValidationInfo, field_validator, model_validator
 from aind_data_schema.base import DataModel, Discriminated, GenericModel
 from aind_data_schema.components.coordinates import TRANSFORM_TYPES, AxisName, CoordinateSystem, Scale
 from aind_data_schema.components.identifiers import Software
+from aind_data_schema.utils.diagnostics import report
+from aind_data_schema.utils.validation_tiers import ValidationTier, tiered
 
 logger = logging.getLogger(__name__)
 
@@ -85,6 +86,7 @@ class Device(DataModel):
     notes: Optional[str] = Field(default=None, title="Notes")
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.MODEL)
     def validate_manufacturer_notes(self):
         """Ensure that notes are not empty if manufacturer is 'other'"""
 
@@ -112,6 +114,7 @@ class DevicePosition(DataModel):
     )
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.MODEL)
     def validate_transform_and_cs(self):
         """Ensure that transform and coordinate system are either both set or both unset"""
         transform = self.transform
@@ -172,6 +175,7 @@ class Detector(Device):
     driver_version: Optional[str] = Field(default=None, title="Driver version")
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.MODEL)
     def validate_other(self):
         """Validator for other/notes"""
 
@@ -219,6 +223,7 @@ class Filter(Device):
     wavelength_unit: SizeUnit = Field(default=SizeUnit.NM, title="Wavelength unit")
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.MODEL)
     def validate_multi_filters(self):
         """Check for multiband/multinotch filters and make sure center_wavelength is a list"""
 
@@ -262,6 +267,7 @@ class Objective(Device):
     objective_type: Optional[ObjectiveType] = Field(default=None, title="Objective type")
 
     @field_validator("immersion", mode="after")
+    @tiered(ValidationTier.MODEL)
     def validate_other(cls, value: Optional[str], info: ValidationInfo) -> Optional[str]:
         """Validator for other/notes"""
 
@@ -301,12 +307,15 @@ class DAQChannel(DataModel):
     )
 
     @field_validator("channel_index", mode="after")
+    @tiered(ValidationTier.MODEL)
     def deprecated_channel_index(cls, value: Optional[int]) -> Optional[int]:
         """Warn if channel_index is used (deprecated)"""
         if value is not None:
-            warnings.warn(
+            report(
+                "daq_channel.channel_index_deprecated",
                 "DAQChannel.channel_index is deprecated. Use DAQChannel.port instead.",
-                DeprecationWarning,
+                path="channel_index",
+                category=DeprecationWarning,
             )
         return value
 
@@ -336,6 +345,7 @@ class HarpDevice(DAQDevice):
     is_clock_generator: bool = Field(..., title="Is Clock Generator")
 
     @field_validator("data_interface", mode="after")
+    @tiered(ValidationTier.MODEL)
     def validate_other(cls, value: Optional[str], info: ValidationInfo) -> Optional[str]:
         """Validator for other/notes"""
 
@@ -634,12 +644,22 @@ class Monitor(Device, DevicePosition):
         """
 
         if "contrast" in data and data["contrast"] is not None and "contrast_unit" not in data:
-            logger.warning("Adding default unit 'percent' for Monitor.contrast_unit")
-            data["contrast_unit"] = UnitlessUnit.PERCENT
+            report(
+                "monitor.default_unit",
+                "Adding default unit 'percent' for Monitor.contrast_unit",
+                path="contrast_unit",
+                log=logger.warning,
+            )
+            data = {**data, "contrast_unit": UnitlessUnit.PERCENT}
 
         if "brightness" in data and data["brightness"] is not None and "brightness_unit" not in data:
-            logger.warning("Adding default unit 'percent' for Monitor.brightness_unit")
-            data["brightness_unit"] = UnitlessUnit.PERCENT
+            report(
+                "monitor.default_unit",
+                "Adding default unit 'percent' for Monitor.brightness_unit",
+                path="brightness_unit",
+                log=logger.warning,
+            )
+            data = {**data, "brightness_unit": UnitlessUnit.PERCENT}
 
         return data
 
@@ -709,6 +729,7 @@ class AdditionalImagingDevice(Device):
     imaging_device_type: ImagingDeviceType = Field(..., title="Device type")
 
     @field_validator("imaging_device_type", mode="after")
+    @tiered(ValidationTier.MODEL)
     def validate_other(cls, value: Optional[str], info: ValidationInfo) -> Optional[str]:
         """Validator for other/notes"""
 
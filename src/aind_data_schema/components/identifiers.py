@@ -6,11 +6,12 @@ from typing import Dict, List, Optional
 
 from aind_data_schema_models.registries import Registry
 from pydantic import Field, BaseModel, model_validator
-import warnings
 
 from typing import Annotated
 from pydantic import StringConstraints
 from aind_data_schema.base import DataModel, DiscriminatedList, GenericModel
+from aind_data_schema.utils.diagnostics import report
+from aind_data_schema.utils.validation_tiers import ValidationTier, tiered
 
 
 class Database(str, Enum):
@@ -119,12 +120,14 @@ class Code(DataModel):
     )
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.MODEL)
     def _ensure_commit_hash_or_version(self) -> "Code":
         """Ensure that at least one of commit_hash or version is provided for code identification"""
         if not self.commit_hash and not self.version:
-            warnings.warn(
+            report(
+                "code.missing_version",
                 "Neither commit_hash nor version provided for Code. "
                 "It's recommended to provide at least one to ensure reproducibility. "
-                "In the future, we will require at least one of these fields."
+                "In the future, we will require at least one of these fields.",
             )
         return self
@@ -13,6 +13,7 @@ from pydantic import Field, model_validator
 from aind_data_schema.base import DataModel, DiscriminatedList
 from aind_data_schema.components.identifiers import ProtocolMixin
 from aind_data_schema.components.reagent import Reagent
+from aind_data_schema.utils.validation_tiers import ValidationTier, tiered
 
 
 class VirusPrepType(str, Enum):
@@ -96,6 +97,7 @@ class InjectionDynamics(DataModel):
     alternating_current: Optional[str] = Field(default=None, title="Alternating current")
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.MODEL)
     def check_volume_or_current(self):
         """Check that either volume or injection_current is provided"""
         if not self.volume and not self.injection_current:
@@ -10,6 +10,7 @@ from aind_data_schema.base import AwareDatetimeWithDefault, DataModel, Discrimin
 from aind_data_schema.components.configs import DeviceConfig
 from aind_data_schema.components.identifiers import ProtocolMixin
 from aind_data_schema.components.reagent import Reagent
+from aind_data_schema.utils.validation_tiers import ValidationTier, tiered
 from aind_data_schema.utils.validators import TimeValidation
 
 
@@ -35,6 +36,7 @@ class CalibrationFit(DataModel):
     )
 
     @model_validator(mode="before")
+    @tiered(ValidationTier.MODEL)
     def validate_fit_type(cls, values):
         """Ensure that parameters are provided for linear and other fits"""
         fit_type = values.get("fit_type")
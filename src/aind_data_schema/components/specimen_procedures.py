@@ -1,6 +1,5 @@
 """Specimen procedures module for AIND data schema."""
 
-import warnings
 from datetime import date
 from enum import Enum
 from typing import Dict, List, Optional, Union
@@ -15,7 +14,9 @@ from aind_data_schema.base import AwareDatetimeWithDefault, DataModel, Discrimin
 from aind_data_schema.components.coordinates import Atlas, CoordinateSystem, Translation
 from aind_data_schema.components.identifiers import ProtocolListMixin
 from aind_data_schema.components.reagent import FluorescentStain, GeneProbeSet, ProbeReagent, Reagent, Solution
+from aind_data_schema.utils.diagnostics import report
 from aind_data_schema.utils.exceptions import OneOfError
+from aind_data_schema.utils.validation_tiers import ValidationTier, tiered
 
 
 class SectionOrientation(str, Enum):
@@ -60,6 +61,7 @@ class Section(DataModel):
     )
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.MODEL)
     def deprecated_coordinate_fields(self):
         """Warn if deprecated coordinate fields are used"""
         deprecated_fields = []
@@ -77,12 +79,11 @@ class Section(DataModel):
             deprecated_fields.append("partial_slice")
 
         if deprecated_fields:
-            warnings.warn(
-                (
-                    f"Section fields {deprecated_fields} are deprecated. "
-                    "Use PlanarSection for sections with coordinate data."
-                ),
-                DeprecationWarning,
+            report(
+                "section.deprecated_fields",
+                f"Section fields {deprecated_fields} are deprecated. "
+                "Use PlanarSection for sections with coordinate data.",
+                category=DeprecationWarning,
             )
 
         return self
@@ -105,6 +106,7 @@ class PlanarSection(Section):
     )
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.MODEL)
     def check_one_of_end_thickness(self):
         """Ensure that either end_coordinate or thickness is provided"""
 
@@ -188,6 +190,7 @@ class SpecimenProcedure(ProtocolListMixin, DataModel):
     notes: Optional[str] = Field(default=None, title="Notes")
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.MODEL)
     def validate_procedure_type(self):
         """Adds a validation check on procedure_type"""
 
@@ -13,6 +13,8 @@ from pydantic_core.core_schema import ValidationInfo
 
 from aind_data_schema.base import DataModel
 from aind_data_schema.components.devices import Device
+from aind_data_schema.utils.diagnostics import report
+from aind_data_schema.utils.validation_tiers import ValidationTier, tiered
 from aind_data_schema.utils.validators import TimeValidation
 
 
@@ -92,11 +94,11 @@ class BreedingInfo(DataModel):
     def warn_breeding_group_deprecated(cls, v: Optional[str]) -> Optional[str]:
         """Validator to warn about deprecated breeding_group field"""
         if v:
-            import warnings
-
-            warnings.warn(
+            report(
+                "breeding_info.breeding_group_deprecated",
                 "The 'breeding_group' field is deprecated and will be removed. The field's value has been cleared.",
-                DeprecationWarning,
+                path="breeding_group",
+                category=DeprecationWarning,
             )
         return None
 
@@ -134,6 +136,7 @@ class MouseSubject(DataModel):
     )
 
     @field_validator("source", mode="after")
+    @tiered(ValidationTier.MODEL)
     def validate_inhouse_breeding_info(cls, v: Organization.ONE_OF, info: ValidationInfo):
         """Validator for inhouse mice breeding info"""
 
@@ -143,6 +146,7 @@ class MouseSubject(DataModel):
         return v
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.MODEL)
     def validate_species_strain(self):
         """Ensure that the species and strain.species match"""
 
@@ -166,6 +170,7 @@ class HumanSubject(DataModel):
     )
 
     @field_validator("species", mode="before")
+    @tiered(ValidationTier.MODEL)
     def validate_species_is_human(cls, v):
         """Ensure species is always human for HumanSubject"""
         if v != Species.HUMAN:
@@ -188,6 +193,7 @@ class NonHumanPrimateSubject(DataModel):
     )
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.MODEL)
     def validate_date_year_consistency(self):
         """Ensure that date_of_birth year matches year_of_birth when date_of_birth is provided"""
 
@@ -16,6 +16,7 @@ from aind_data_schema.components.coordinates import TRANSFORM_TYPES, Translation
 from aind_data_schema.components.devices import Catheter, EphysProbe, FiberProbe, MyomatrixArray
 from aind_data_schema.components.identifiers import ProtocolMixin
 from aind_data_schema.components.injection_procedures import Injection
+from aind_data_schema.utils.validation_tiers import ValidationTier, tiered
 
 
 class ProtectiveMaterial(str, Enum):
@@ -106,6 +107,7 @@ class Craniotomy(ProtocolMixin, DataModel):
     dura_removed: Optional[bool] = Field(default=None, title="Dura removed")
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.MODEL)
     def check_system_if_position(self):
         """Ensure that coordinate_system_name is provided if position is provided"""
 
@@ -114,6 +116,7 @@ class Craniotomy(ProtocolMixin, DataModel):
         return self
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.MODEL)
     def check_position(self):
         """Ensure a position is provided for certain craniotomy types"""
 
@@ -124,6 +127,7 @@ class Craniotomy(ProtocolMixin, DataModel):
         return self
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.MODEL)
     def validate_size(self):
         """Ensure that size is provided for certain craniotomy types"""
 
@@ -177,6 +181,7 @@ class BrainInjection(Injection):
     targeted_structure: Optional[BrainStructureModel] = Field(default=None, title="Injection targeted brain structure")
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.MODEL)
     def check_lengths(self):
         """Validator for list length of injection volumes and depths"""
 
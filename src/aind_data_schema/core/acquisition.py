@@ -48,6 +48,7 @@ from aind_data_schema.utils.merge import (
     merge_str_alphabetical,
     remove_duplicates,
 )
+from aind_data_schema.utils.validation_tiers import ValidationTier, tiered
 from aind_data_schema.utils.validators import (
     TimeValidation,
     extract_timezone_from_datetime,
@@ -169,6 +170,7 @@ class DataStream(DataModel):
     )
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.MODEL)
     def check_modality_config_requirements(self):
         """Check that the required devices are present for the modalities"""
         for modality in self.modalities:
@@ -188,6 +190,7 @@ class DataStream(DataModel):
         return self
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.MODEL)
     def check_connections(self):
         """Check that every device in a Connection is present in the active_devices list"""
         for connection in self.connections:
@@ -484,6 +487,7 @@ class Acquisition(ProtocolListMixin, DataCoreModel):
         return self
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.MODEL)
     def check_subject_specimen_id(self):
         """Check that the subject and specimen IDs match"""
         if self.specimen_id and self.subject_id:
@@ -495,6 +499,7 @@ class Acquisition(ProtocolListMixin, DataCoreModel):
         return self
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.MODEL)
     def instrument_id_required_for_data_streams(self):
         """Require instrument_id when any standard DataStream is present"""
         if not hasattr(self, "data_streams"):
@@ -505,6 +510,7 @@ class Acquisition(ProtocolListMixin, DataCoreModel):
         return self
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.MODEL)
     def specimen_required(self):
         """Check if specimen ID is required for in vitro imaging modalities"""
 
@@ -2,14 +2,14 @@
 
 import re
 from datetime import datetime, timezone
-from typing import Any, List, Literal, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Literal, Optional, Tuple
 
 from aind_data_schema_models.data_name_patterns import (
     DataLevel,
     DataRegex,
     Group,
     build_data_name,
-    datetime_from_name_string,
     datetime_to_name_string,
 )
 from aind_data_schema_models.licenses import License
@@ -20,6 +20,55 @@ from pydantic_core import PydanticUndefined
 
 from aind_data_schema.base import AwareDatetimeWithDefault, DataCoreModel, DataModel
 from aind_data_schema.components.identifiers import Person
+from aind_data_schema.utils.validation_tiers import ValidationTier, tiered
+
+NAME_CACHE_SIZE = 4096
+
+# Compiled name patterns, and the regex groups parse_name returns for each data level
+_NAME_PATTERNS = {
+    DataLevel.RAW: re.compile(DataRegex.DATA.value),
+    DataLevel.DERIVED: re.compile(DataRegex.DERIVED.value),
+}
+_NAME_GROUPS = {
+    DataLevel.RAW: ("c_datetime", "label"),
+    DataLevel.DERIVED: ("input", "process_name", "c_datetime"),
+}
+_NAME_FIELDS = {
+    level: tuple("creation_time" if group == "c_datetime" else group for group in groups)
+    for level, groups in _NAME_GROUPS.items()
+}
+_NAME_DATA_LEVELS = {level.value: level for level in _NAME_PATTERNS}
+
+
+def _name_data_level(data_level) -> DataLevel:
+    """Check that names of this data level can be parsed"""
+    level = _NAME_DATA_LEVELS.get(getattr(data_level, "value", data_level))
+    if level is None:
+        raise ValueError(f"DataLevel({data_level}) not supported")
+    return level
+
+
+def _datetime_from_name_string(value: str) -> datetime:
+    """Faster datetime_from_name_string for strings that already matched RegexParts.DATETIME"""
+    return datetime.fromisoformat(f"{value[:10]}T{value[11:].replace('-', ':')}")
+
+
+def _name_values(match: re.Match, data_level: DataLevel) -> Tuple[Any, ...]:
+    """Values of the _NAME_FIELDS of a matched name"""
+    groups = _NAME_GROUPS[data_level]
+    return tuple(
+        _datetime_from_name_string(value) if group == "c_datetime" else value
+        for group, value in zip(groups, match.group(*groups))
+    )
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def _parse_name(name: str, data_level: DataLevel) -> Tuple[Any, ...]:
+    """Memoized name parsing, validators parse the same asset names repeatedly"""
+    m = _NAME_PATTERNS[data_level].match(name)
+    if m is None:
+        raise ValueError(f"name({name}) does not match pattern")
+    return _name_values(m, data_level)
 
 
 class Funding(DataModel):
@@ -122,31 +171,52 @@ class DataDescription(DataCoreModel):
     def parse_name(cls, name, data_level: DataLevel = DataLevel.RAW):
         """Decompose a DataDescription name string into component parts"""
 
-        if data_level == DataLevel.RAW:
-            m = re.match(f"{DataRegex.DATA.value}", name)
-        elif data_level == DataLevel.DERIVED:
-            m = re.match(f"{DataRegex.DERIVED.value}", name)
-        else:
-            raise ValueError(f"DataLevel({data_level}) not supported")
+        data_level = _name_data_level(data_level)
+        return dict(zip(_NAME_FIELDS[data_level], _parse_name(name, data_level)))
+
+    @classmethod
+    def parse_names(
+        cls, names: Iterable[str], data_level: DataLevel = DataLevel.RAW, strict: bool = True
+    ) -> Dict[str, List[Any]]:
+        """
+        Decompose many DataDescription names at once
 
-        if m is None:
-            raise ValueError(f"name({name}) does not match pattern")
+        Parameters
+        ----------
+        names : Iterable[str]
+            Names to parse
+        data_level : DataLevel
+            Data level of all the names, RAW or DERIVED
+        strict : bool
+            Raise a ValueError for names that do not match the pattern or hold an
+            invalid date, otherwise their values are None
 
-        creation_time = datetime_from_name_string(m.group("c_datetime"))
+        Returns
+        -------
+        Dict[str, List[Any]]
+            One list per component, with the same keys as parse_name and one entry per name
+        """
 
-        if data_level == DataLevel.RAW:
-            return dict(
-                creation_time=creation_time,
-                label=m.group("label"),
-            )
-        elif data_level == DataLevel.DERIVED:
-            return dict(
-                input=m.group("input"),
-                process_name=m.group("process_name"),
-                creation_time=creation_time,
-            )
+        data_level = _name_data_level(data_level)
+        fields = _NAME_FIELDS[data_level]
+        match = _NAME_PATTERNS[data_level].match
+        missing = (None,) * len(fields)
+        rows = []
+        for name in names:
+            m = match(name)
+            try:
+                if m is None:
+                    raise ValueError(f"name({name}) does not match pattern")
+                rows.append(_name_values(m, data_level))
+            except ValueError:
+                if strict:
+                    raise
+                rows.append(missing)
+        columns = zip(*rows) if rows else [()] * len(fields)
+        return {field: list(column) for field, column in zip(fields, columns)}
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.MODEL)
     def subject_id_when_raw(self):
         """Ensure that a subject_id is provided when data_level is RAW"""
         if self.data_level == DataLevel.RAW and self.subject_id is None:
@@ -160,12 +230,13 @@ class DataDescription(DataCoreModel):
             self.name = build_data_name(self.subject_id, creation_datetime=self.creation_time)
 
         # check that the name matches the name regex
-        if not re.match(DataRegex.DATA.value, self.name):
+        if not _NAME_PATTERNS[DataLevel.RAW].match(self.name):
             raise ValueError(f"Name({self.name}) does not match allowed Regex pattern")
 
         return self
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.MODEL)
     def source_data_when_raw(self):
         """Ensure that source_data is not provided when data_level is RAW"""
         if self.data_level == DataLevel.RAW and self.source_data is not None:
@@ -226,7 +297,7 @@ class DataDescription(DataCoreModel):
         # Upgrade name
         original_name = data_description.name
         derived_name = f"{original_name}_{process_name}_{datetime_to_name_string(creation_time)}"
-        if not re.match(DataRegex.DERIVED.value, derived_name):  # pragma: no cover
+        if not _NAME_PATTERNS[DataLevel.DERIVED].match(derived_name):  # pragma: no cover
             raise ValueError(f"Derived name({derived_name}) does not match allowed Regex pattern")
 
         return cls(
@@ -313,7 +384,7 @@ class DataDescription(DataCoreModel):
 
         # Create new derived name using the original input (not the full derived name)
         derived_name = f"{original_input}_{process_name}_{datetime_to_name_string(creation_time)}"
-        if not re.match(DataRegex.DERIVED.value, derived_name):  # pragma: no cover
+        if not _NAME_PATTERNS[DataLevel.DERIVED].match(derived_name):  # pragma: no cover
             raise ValueError(f"Derived name({derived_name}) does not match allowed Regex pattern")
 
         return cls(
@@ -54,7 +54,9 @@ from aind_data_schema.components.devices import (
     Wheel,
 )
 from aind_data_schema.components.measurements import CALIBRATIONS
+from aind_data_schema.utils.diagnostics import report
 from aind_data_schema.utils.merge import merge_notes, merge_optional_list, merge_str_alphabetical
+from aind_data_schema.utils.validation_tiers import ValidationTier, tiered
 from aind_data_schema.utils.validators import recursive_get_all_names
 
 logger = logging.getLogger(__name__)
@@ -187,6 +189,7 @@ class Instrument(DataCoreModel):
         return sorted(value, key=lambda x: x["abbreviation"] if isinstance(x, dict) else x.abbreviation)
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.MODEL)
     def validate_cameras_other(self):
         """check if any CameraAssemblies contain an 'other' field"""
 
@@ -201,6 +204,7 @@ class Instrument(DataCoreModel):
         return self
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.MODEL)
     def validate_unique_component_names(self):
         """Warn if any component names are duplicated"""
         names = self.get_component_names()
@@ -211,10 +215,16 @@ class Instrument(DataCoreModel):
                 if name in seen:
                     duplicates.add(name)
                 seen.add(name)
-            logger.warning(f"Duplicate component names found: {sorted(duplicates)}")
+            report(
+                "instrument.duplicate_component_names",
+                f"Duplicate component names found: {sorted(duplicates)}",
+                path="components",
+                log=logger.warning,
+            )
         return self
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.MODEL)
     def validate_connections(self):
         """validate that all connections map between devices that actually exist"""
         device_names = self.get_component_names()
@@ -233,6 +243,7 @@ class Instrument(DataCoreModel):
         return self
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.MODEL)
     def validate_modality_device_dependencies(self):
         """
         Validate that devices exist for the modalities specified.
@@ -3,8 +3,9 @@
 import inspect
 import json
 import logging
-import warnings
-from typing import Dict, Literal, Optional, get_args
+from datetime import datetime
+from functools import cached_property
+from typing import Any, Dict, List, Literal, Optional, Set, Type, get_args
 
 from aind_data_schema_models.modalities import Modality
 from pydantic import (
@@ -19,6 +20,7 @@ from pydantic import (
 )
 
 from aind_data_schema.base import DataCoreModel
+from aind_data_schema.components.connections import Connection
 from aind_data_schema.components.identifiers import DatabaseIdentifiers
 from aind_data_schema.components.subject_procedures import TrainingProtocol
 from aind_data_schema.components.subjects import CalibrationObject
@@ -31,6 +33,9 @@ from aind_data_schema.core.processing import Processing
 from aind_data_schema.core.quality_control import QualityControl
 from aind_data_schema.core.subject import Subject
 from aind_data_schema.utils.compatibility_check import InstrumentAcquisitionCompatibility
+from aind_data_schema.utils.diagnostics import report
+from aind_data_schema.utils.rule_registry import RuleRegistry
+from aind_data_schema.utils.validation_tiers import ValidationTier, tiered
 from aind_data_schema.utils.validators import recursive_time_validation_check, validate_creation_time_after_midnight
 
 logger = logging.getLogger(__name__)
@@ -46,6 +51,18 @@ CORE_FILES = [
     "model",
 ]
 
+# Core model of each CORE_FILES field
+CORE_FILE_MODELS: Dict[str, Type[DataCoreModel]] = {
+    "subject": Subject,
+    "data_description": DataDescription,
+    "procedures": Procedures,
+    "instrument": Instrument,
+    "processing": Processing,
+    "acquisition": Acquisition,
+    "quality_control": QualityControl,
+    "model": Model,
+}
+
 # Files present must include at least one of these "file set" keys,
 # and all files listed in any of the matched sets
 REQUIRED_FILE_SETS = {
@@ -60,6 +77,94 @@ REQUIRED_FILE_SETS = {
 }
 
 
+def _group_by_type(items: List[Any]) -> Dict[type, List[Any]]:
+    """Items grouped by their class, in order"""
+    grouped: Dict[type, List[Any]] = {}
+    for item in items:
+        grouped.setdefault(type(item), []).append(item)
+    return grouped
+
+
+# Cross-file rules for some modalities or core files only, modalities are read from the data description
+METADATA_RULES = RuleRegistry()
+
+
+class CrossFileContext:
+    """
+    Data read by the Metadata cross-file validators, collected once per validation
+
+    Each value is computed the first time a validator reads it and then shared, so the
+    validators don't walk the same core files again for each check.
+    """
+
+    def __init__(self, metadata: "Metadata") -> None:
+        """Data of the core files of a Metadata"""
+        self.metadata = metadata
+        acquisition = metadata.acquisition
+        self.acquisition_start_time: Optional[datetime] = getattr(acquisition, "acquisition_start_time", None)
+        self.acquisition_end_time: Optional[datetime] = getattr(acquisition, "acquisition_end_time", None)
+
+    @cached_property
+    def component_names(self) -> List[str]:
+        """Names of the instrument components, including the instrument ID"""
+        return self.metadata.instrument.get_component_names() if self.metadata.instrument else []
+
+    @cached_property
+    def device_names(self) -> Set[str]:
+        """Names of the instrument components and of the devices implanted in procedures"""
+        device_names = set(self.component_names)
+        if self.metadata.procedures:
+            device_names.update(self.metadata.procedures.get_device_names())
+        return device_names
+
+    @cached_property
+    def data_streams(self) -> List[DataStream]:
+        """Acquisition data streams, without external data streams"""
+        if not self.metadata.acquisition:
+            return []
+        return [stream for stream in self.metadata.acquisition.data_streams if isinstance(stream, DataStream)]
+
+    @cached_property
+    def active_devices(self) -> List[str]:
+        """Active devices of all data streams"""
+        return [device for data_stream in self.data_streams for device in data_stream.active_devices]
+
+    @cached_property
+    def connections(self) -> List[Connection]:
+        """Connections of all data streams"""
+        return [connection for data_stream in self.data_streams for connection in data_stream.connections]
+
+    @cached_property
+    def modalities(self) -> Set[str]:
+        """Abbreviations of the data description modalities"""
+        if not self.metadata.data_description:
+            return set()
+        return {getattr(modality, "abbreviation", None) for modality in self.metadata.data_description.modalities}
+
+    @cached_property
+    def subject_procedures(self) -> Dict[type, List[Any]]:
+        """Subject procedures by type"""
+        if not self.metadata.procedures:
+            return {}
+        return _group_by_type(self.metadata.procedures.subject_procedures)
+
+    @cached_property
+    def surgery_procedures(self) -> Dict[type, List[Any]]:
+        """Procedures of all surgeries by type"""
+        surgeries = self.procedures_of_type(Surgery, subject=True)
+        return _group_by_type([procedure for surgery in surgeries for procedure in surgery.procedures])
+
+    def procedures_of_type(self, procedure_type: type, subject: bool = False) -> List[Any]:
+        """Surgery procedures, or subject procedures if subject is True, that are instances of a type"""
+        by_type = self.subject_procedures if subject else self.surgery_procedures
+        return [
+            procedure
+            for cls, procedures in by_type.items()
+            if issubclass(cls, procedure_type)
+            for procedure in procedures
+        ]
+
+
 class Metadata(DataCoreModel):
     """The records in the Data Asset Collection needs to contain certain fields
     to easily query and index the data."""
@@ -70,6 +175,8 @@ class Metadata(DataCoreModel):
     # The models base on this schema will be saved to metadata.nd.json as
     # default
     _FILE_EXTENSION = PrivateAttr(default=".nd.json")
+    # Set while the cross-file validators run, see cross_file_context
+    _cross_file_context = PrivateAttr(default=None)
 
     _DESCRIBED_BY_URL = DataCoreModel._DESCRIBED_BY_BASE_URL.default + "aind_data_schema/core/metadata.py"
     describedBy: str = Field(default=_DESCRIBED_BY_URL, json_schema_extra={"const": _DESCRIBED_BY_URL})
@@ -127,15 +234,34 @@ class Metadata(DataCoreModel):
 
         if isinstance(value, dict):
             try:
-                core_model = field_class.model_validate(value)
+                core_model = field_class.model_validate(value, context=info.context)
             except ValidationError as e:
-                logger.warning(f"Error in validating {field_name}: {e}")
+                report(
+                    "metadata.invalid_core_file",
+                    f"Error in validating {field_name}: {e}",
+                    path=field_name,
+                    log=logger.warning,
+                )
                 core_model = field_class.model_construct(**value)
         else:
             core_model = value
         return core_model
 
+    def cross_file_context(self) -> CrossFileContext:
+        """Data shared by the cross-file validators, collected once per validation"""
+        if self._cross_file_context is None:
+            return CrossFileContext(self)
+        return self._cross_file_context
+
     @model_validator(mode="after")
+    @tiered(ValidationTier.CROSS_FILE)
+    def collect_cross_file_context(self):
+        """Collect the data shared by the cross-file validators below"""
+        self._cross_file_context = CrossFileContext(self)
+        return self
+
+    @model_validator(mode="after")
+    @tiered(ValidationTier.CROSS_FILE)
     def validate_subject_details_if_not_specimen(self):
         """Check that subject details are present if an in vivo experiment"""
 
@@ -146,6 +272,7 @@ class Metadata(DataCoreModel):
         return self
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.CROSS_FILE)
     def validate_expected_files_by_modality(self):
         """Validator warns users if required files are missing"""
 
@@ -160,11 +287,16 @@ class Metadata(DataCoreModel):
                             and all(isinstance(s, ExternalDataStream) for s in self.acquisition.data_streams)
                         ):
                             continue
-                        warnings.warn(f"Metadata missing required file: {required_file}")
+                        report(
+                            "metadata.missing_file",
+                            f"Metadata missing required file: {required_file}",
+                            path=required_file,
+                        )
 
         return self
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.CROSS_FILE)
     def validate_required_files(self):
         """Validator to ensure that one of the key files from the file sets is present."""
 
@@ -176,70 +308,46 @@ class Metadata(DataCoreModel):
         return self
 
     @model_validator(mode="after")
-    def validate_smartspim_metadata(self):
-        """Validator for smartspim metadata"""
-
-        if (
-            self.data_description
-            and any([modality == Modality.SPIM for modality in self.data_description.modalities])
-            and self.procedures
-            and any(
-                isinstance(surgery, Injection) and getattr(surgery, "injection_materials", None) is None
-                for subject_procedure in self.procedures.subject_procedures
-                if isinstance(subject_procedure, Surgery)
-                for surgery in subject_procedure.procedures
-            )
-        ):
-            raise ValueError("Injection is missing injection_materials.")
+    @tiered(ValidationTier.CROSS_FILE)
+    def validate_modality_rules(self):
+        """Run the METADATA_RULES that apply to the asset's modalities and core files"""
+        core_files = [file for file in CORE_FILES if getattr(self, file)]
+        METADATA_RULES.run(self, self.cross_file_context().modalities, core_files)
+        return self
 
+    def validate_smartspim_metadata(self):
+        """Check the injection materials of a SmartSPIM asset, validate_modality_rules runs this check"""
+        if Modality.SPIM.abbreviation in self.cross_file_context().modalities:
+            validate_injection_materials(self)
         return self
 
-    @model_validator(mode="after")
     def validate_ecephys_metadata(self):
-        """Validator for metadata"""
-        if (
-            self.data_description
-            and any([modality == Modality.ECEPHYS for modality in self.data_description.modalities])
-            and self.procedures
-            and any(
-                isinstance(surgery, Injection) and getattr(surgery, "injection_materials", None) is None
-                for subject_procedure in self.procedures.subject_procedures
-                if isinstance(subject_procedure, Surgery)
-                for surgery in subject_procedure.procedures
-            )
-        ):
-            raise ValueError("Injection is missing injection_materials.")
+        """Check the injection materials of an ecephys asset, validate_modality_rules runs this check"""
+        if Modality.ECEPHYS.abbreviation in self.cross_file_context().modalities:
+            validate_injection_materials(self)
         return self
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.CROSS_FILE)
     def validate_instrument_acquisition_compatibility(self):
         """Validator for metadata"""
         if self.instrument and self.acquisition:
-            check = InstrumentAcquisitionCompatibility(self.instrument, self.acquisition)
+            check = InstrumentAcquisitionCompatibility(
+                self.instrument, self.acquisition, component_names=self.cross_file_context().component_names
+            )
             check.run_compatibility_check()
         return self
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.CROSS_FILE)
     def validate_acquisition_active_devices(self):
         """Ensure that all Acquisition.data_streams.active_devices exist in either the instrument or procedures."""
 
-        active_devices = []
-
-        if self.acquisition:
-            for data_stream in self.acquisition.data_streams:
-                if isinstance(data_stream, DataStream):
-                    active_devices.extend(data_stream.active_devices)
-
-        device_names = []
-
-        if self.instrument:
-            device_names.extend(self.instrument.get_component_names())
-        if self.procedures:
-            device_names.extend(self.procedures.get_device_names())
+        context = self.cross_file_context()
 
         # Check if all active devices are in the available devices
-        if not all(device in device_names for device in active_devices):
-            missing_devices = set(active_devices) - set(device_names)
+        missing_devices = set(context.active_devices) - context.device_names
+        if missing_devices:
             raise ValueError(
                 f"Active devices '{missing_devices}' were not found in either the Instrument.components or "
                 f"in an individual procedure's implanted_device field."
@@ -248,40 +356,32 @@ class Metadata(DataCoreModel):
         return self
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.CROSS_FILE)
     def validate_acquisition_connections(self):
         """Validate for Acquisition.data_streams.connections that all connections map between devices either in the
         instrument OR procedures"""
 
-        device_names = []
-
-        if self.instrument:
-            device_names.extend(self.instrument.get_component_names())
-        if self.procedures:
-            device_names.extend(self.procedures.get_device_names())
+        context = self.cross_file_context()
 
         # Check if all connection devices are in the available devices
-        if self.acquisition:
-            data_streams = self.acquisition.data_streams
-            for data_stream in data_streams:
-                if not isinstance(data_stream, DataStream):
-                    continue
-                for connection in data_stream.connections:
-                    # Check both source and target devices exist
-                    missing_devices = []
-                    if connection.source_device not in device_names:
-                        missing_devices.append(connection.source_device)
-                    if connection.target_device not in device_names:
-                        missing_devices.append(connection.target_device)
-
-                    if missing_devices:
-                        raise ValueError(
-                            f"Connection from '{connection.source_device}' to '{connection.target_device}' "
-                            f"contains devices not found in instrument or procedures: {missing_devices}"
-                        )
+        for connection in context.connections:
+            # Check both source and target devices exist
+            missing_devices = []
+            if connection.source_device not in context.device_names:
+                missing_devices.append(connection.source_device)
+            if connection.target_device not in context.device_names:
+                missing_devices.append(connection.target_device)
+
+            if missing_devices:
+                raise ValueError(
+                    f"Connection from '{connection.source_device}' to '{connection.target_device}' "
+                    f"contains devices not found in instrument or procedures: {missing_devices}"
+                )
 
         return self
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.CROSS_FILE)
     def validate_calibration_object_tags(self):
         """Validator to ensure 'calibration' tag is present when subject is a CalibrationObject"""
 
@@ -291,88 +391,62 @@ class Metadata(DataCoreModel):
             and isinstance(self.subject.subject_details, CalibrationObject)
             and self.data_description
         ):
-            if self.data_description.tags is None:
-                # Initialize tags list if it doesn't exist
-                self.data_description.tags = []
-
-            if "calibration" not in self.data_description.tags:
-                warnings.warn(
+            tags = self.data_description.tags or []
+            if "calibration" not in tags:
+                report(
+                    "metadata.calibration_tag_added",
                     "Subject is a CalibrationObject but 'calibration' tag is missing from data_description.tags. "
-                    "Adding 'calibration' tag automatically."
+                    "Adding 'calibration' tag automatically.",
+                    path="data_description.tags",
                 )
-                self.data_description.tags.append("calibration")
+                # Replace rather than modify the data description, the caller may share it with other documents
+                self.data_description = self.data_description.model_copy(update={"tags": [*tags, "calibration"]})
 
         return self
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.CROSS_FILE)
     def validate_training_protocol_references(self):
         """Validate that training_protocol_name in StimulusEpoch matches a TrainingProtocol in procedures"""
 
         if self.acquisition and self.procedures:
             # Get all training protocol names from procedures
-            training_protocol_names = []
-            for procedure in self.procedures.subject_procedures:
-                if isinstance(procedure, TrainingProtocol):
-                    training_protocol_names.append(procedure.training_name)
+            training_protocols = self.cross_file_context().procedures_of_type(TrainingProtocol, subject=True)
+            training_protocol_names = [procedure.training_name for procedure in training_protocols]
 
             # Check each stimulus epoch's training_protocol_name
             for stimulus_epoch in self.acquisition.stimulus_epochs:
                 if stimulus_epoch.training_protocol_name:
                     if stimulus_epoch.training_protocol_name not in training_protocol_names:
-                        warnings.warn(
+                        report(
+                            "metadata.unknown_training_protocol",
                             f"Training protocol '{stimulus_epoch.training_protocol_name}' in StimulusEpoch "
-                            f"not found in Procedures. Available protocols: {training_protocol_names}"
+                            f"not found in Procedures. Available protocols: {training_protocol_names}",
+                            path="acquisition.stimulus_epochs",
                         )
 
         return self
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.CROSS_FILE)
     def validate_time_constraints(self):
         """Validate that all fields with TimeValidation annotations respect acquisition time bounds
         (if acquisition is present)"""
-        if self.acquisition:
-            acquisition_start_time = None
-            acquisition_end_time = None
-            if hasattr(self.acquisition, "acquisition_start_time") and hasattr(
-                self.acquisition, "acquisition_end_time"
-            ):
-                acquisition_start_time = self.acquisition.acquisition_start_time
-                acquisition_end_time = self.acquisition.acquisition_end_time
-
+        context = self.cross_file_context()
+        # Fields are only checked against both bounds, so there is nothing to check without them
+        if self.acquisition and context.acquisition_start_time and context.acquisition_end_time:
+            # One walk over all the core files, in the order they were checked in before
+            cores = [self.acquisition, self.processing, self.subject, self.instrument, self.procedures]
             recursive_time_validation_check(
-                self.acquisition,
-                acquisition_start_time=acquisition_start_time,
-                acquisition_end_time=acquisition_end_time,
+                [core for core in cores if core],
+                acquisition_start_time=context.acquisition_start_time,
+                acquisition_end_time=context.acquisition_end_time,
             )
 
-            if self.processing:
-                recursive_time_validation_check(
-                    self.processing,
-                    acquisition_start_time=acquisition_start_time,
-                    acquisition_end_time=acquisition_end_time,
-                )
-            if self.subject:
-                recursive_time_validation_check(
-                    self.subject,
-                    acquisition_start_time=acquisition_start_time,
-                    acquisition_end_time=acquisition_end_time,
-                )
-            if self.instrument:
-                recursive_time_validation_check(
-                    self.instrument,
-                    acquisition_start_time=acquisition_start_time,
-                    acquisition_end_time=acquisition_end_time,
-                )
-            if self.procedures:
-                recursive_time_validation_check(
-                    self.procedures,
-                    acquisition_start_time=acquisition_start_time,
-                    acquisition_end_time=acquisition_end_time,
-                )
-
         return self
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.CROSS_FILE)
     def validate_data_description_name_time_consistency(self):
         """Validate that the creation_time from data_description.name is on or after midnight
         on the same day as acquisition.acquisition_end_time"""
@@ -391,14 +465,33 @@ class Metadata(DataCoreModel):
                         validate_creation_time_after_midnight(name_creation_time, self.acquisition.acquisition_end_time)
                     except ValueError:
                         # Issue a warning instead of raising an error
-                        warnings.warn(
+                        report(
+                            "metadata.name_time_mismatch",
                             f"Creation time from data_description.name ({name_creation_time}) "
                             f"should be close to the acquisition end time "
-                            f"({self.acquisition.acquisition_end_time})"
+                            f"({self.acquisition.acquisition_end_time})",
+                            path="data_description.name",
                         )
 
         return self
 
+    @model_validator(mode="after")
+    @tiered(ValidationTier.CROSS_FILE)
+    def release_cross_file_context(self):
+        """Drop the shared data once the cross-file validators above have run"""
+        self._cross_file_context = None
+        return self
+
+
+@METADATA_RULES.register(modalities=[Modality.SPIM, Modality.ECEPHYS], core_files=["procedures"])
+def validate_injection_materials(metadata: Metadata) -> None:
+    """Injections of SmartSPIM and ecephys assets must list their injection materials"""
+    if any(
+        getattr(injection, "injection_materials", None) is None
+        for injection in metadata.cross_file_context().procedures_of_type(Injection)
+    ):
+        raise ValueError("Injection is missing injection_materials.")
+
 
 def create_metadata_json(
     name: str,
@@ -1,6 +1,5 @@
 """schema for various Procedures"""
 
-import warnings
 from typing import List, Literal, Optional
 
 from pydantic import Field, SkipValidation, model_validator
@@ -16,7 +15,9 @@ from aind_data_schema.components.subject_procedures import (
     WaterRestriction,
     NonSurgicalInjection,
 )
+from aind_data_schema.utils.diagnostics import report
 from aind_data_schema.utils.merge import merge_coordinate_systems, merge_notes
+from aind_data_schema.utils.validation_tiers import ValidationTier, tiered
 from aind_data_schema.utils.validators import subject_specimen_id_compatibility
 
 
@@ -75,22 +76,24 @@ class Procedures(DataCoreModel):
         return list(device_names)
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.MODEL)
     def reject_injections(self):
         """Raise a warning for injections since they should now be wrapped
         in a Surgery or NonSurgicalInjection procedure
         """
 
-        for procedure in self.subject_procedures:
+        for index, procedure in enumerate(self.subject_procedures):
             if isinstance(procedure, Injection):
-                warnings.warn(
+                report(
+                    "procedures.unwrapped_injection",
                     "Injection procedures should be wrapped in a Surgery or NonSurgicalInjection procedure.",
-                    UserWarning,
-                    stacklevel=2,
+                    path=f"subject_procedures.{index}",
                 )
 
         return self
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.MODEL)
     def validate_subject_specimen_ids(self):
         """Validate that the subject_id and specimen_id match"""
 
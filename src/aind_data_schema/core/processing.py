@@ -13,6 +13,7 @@ from aind_data_schema.base import AwareDatetimeWithDefault, DataCoreModel, DataM
 from aind_data_schema.components.identifiers import Code
 from aind_data_schema.components.wrappers import AssetPath
 from aind_data_schema.utils.merge import merge_notes, merge_optional_list, merge_process_graph
+from aind_data_schema.utils.validation_tiers import ValidationTier, tiered
 from aind_data_schema.utils.validators import TimeValidation
 
 
@@ -76,6 +77,7 @@ class DataProcess(DataModel):
     resources: Optional[ResourceUsage] = Field(default=None, title="Process resource usage")
 
     @field_validator("notes", mode="after")
+    @tiered(ValidationTier.MODEL)
     def validate_other(cls, value: Optional[str], info: ValidationInfo) -> Optional[str]:
         """Validator for other/notes"""
 
@@ -154,8 +156,8 @@ class Processing(DataCoreModel):
         # Check if any processes are out of order
         start_times = [process.start_date_time for process in self.data_processes]
         if not all(start_times[i] <= start_times[i + 1] for i in range(len(start_times) - 1)):
-            # Sort processes by start_date_time
-            self.data_processes.sort(key=lambda x: x.start_date_time)
+            # Sort a copy rather than in place, the list may be shared with other documents
+            self.data_processes = sorted(self.data_processes, key=lambda x: x.start_date_time)
             self.notes = (
                 "Processes were reordered by start_date_time"
                 if not self.notes
@@ -177,6 +179,7 @@ class Processing(DataCoreModel):
         return cls(dependency_graph=dependency_graph, data_processes=data_processes, **kwargs)
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.MODEL)
     def validate_process_graph(self):
         """Check that the same processes are represented in data_processes and dependency_graph"""
 
@@ -206,6 +209,7 @@ class Processing(DataCoreModel):
         return self
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.MODEL)
     def validate_pipeline_names(self):
         """Ensure that all pipeline names in the processes are in the pipelines list"""
 
@@ -1,6 +1,5 @@
 """Schemas for Quality Metrics"""
 
-import warnings
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, List, Literal, Optional, Union
@@ -9,7 +8,9 @@ from aind_data_schema_models.modalities import Modality
 from pydantic import Field, SkipValidation, model_validator
 
 from aind_data_schema.base import AwareDatetimeWithDefault, DataCoreModel, DataModel, DiscriminatedList
+from aind_data_schema.utils.diagnostics import report
 from aind_data_schema.utils.merge import merge_notes, merge_optional_list, merge_str_tuple_lists, remove_duplicates
+from aind_data_schema.utils.validation_tiers import ValidationTier, tiered
 
 
 class Status(str, Enum):
@@ -77,6 +78,7 @@ class QCMetric(DataModel):
         return self.status_history[-1]
 
     @model_validator(mode="after")
+    @tiered(ValidationTier.MODEL)
     def validate_multi_asset(self):
         """Ensure that evaluated_assets is set correctly for multi-asset metrics"""
         if self.stage == Stage.MULTI_ASSET and (not self.evaluated_assets or len(self.evaluated_assets) == 0):
@@ -98,8 +100,13 @@ class QCMetric(DataModel):
             return self
         tags = self["tags"]
         if isinstance(tags, list):
-            warnings.warn("QCMetric 'tags' field is now a dict. Converting from list to dict", DeprecationWarning)
-            self["tags"] = {f"tag_{i+1}": tag for i, tag in enumerate(tags)}
+            report(
+                "qc_metric.tag_list",
+                "QCMetric 'tags' field is now a dict. Converting from list to dict",
+                path="tags",
+                category=DeprecationWarning,
+            )
+            return {**self, "tags": {f"tag_{i+1}": tag for i, tag in enumerate(tags)}}
         return self
 
 
@@ -308,7 +315,7 @@ class QualityControl(DataCoreModel):
             first_metric = value["metrics"][0]
             if isinstance(first_metric, dict) and "tags" in first_metric:
                 if isinstance(first_metric["tags"], list):
-                    value["default_grouping"] = [["modality"], ["tag_1"]]
+                    return {**value, "default_grouping": [["modality"], ["tag_1"]]}
 
         return value
 
@@ -0,0 +1,87 @@
+"""Bulk async reading and writing of core model files with bounded concurrency"""
+
+import asyncio
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import Awaitable, Callable, Iterable, List, Optional, Tuple, Type, TypeVar, Union
+
+from aind_data_schema.base import DataCoreModel
+
+DEFAULT_MAX_CONCURRENCY = 16
+
+T = TypeVar("T")
+R = TypeVar("R")
+CoreModel = TypeVar("CoreModel", bound=DataCoreModel)
+
+
+async def map_bounded(function: Callable[[T], Awaitable[R]], items: Iterable[T], max_concurrency: int) -> List[R]:
+    """
+    Await function on every item with at most max_concurrency calls in flight
+
+    Items are taken from the iterable as calls finish, so it may be a lazy stream.
+    Results are in item order. The first error cancels the remaining calls and is raised.
+    """
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be at least 1, not {max_concurrency}")
+    items = enumerate(items)
+    results = {}
+
+    async def worker() -> None:
+        """Take the next item until none are left"""
+        for index, item in items:
+            results[index] = await function(item)
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(max_concurrency)]
+    try:
+        await asyncio.gather(*workers)
+    finally:
+        for task in workers:
+            task.cancel()
+    return [results[index] for index in range(len(results))]
+
+
+async def aload_files(
+    model: Type[CoreModel],
+    paths: Iterable[Union[str, Path]],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    executor: Optional[Executor] = None,
+) -> List[CoreModel]:
+    """
+    Read and validate many files of a core model, see DataCoreModel.aload
+
+    Parameters
+    ----------
+    model : Type[CoreModel]
+        Core model of the files
+    paths : Iterable[Union[str, Path]]
+        Files to read
+    max_concurrency : int
+        Files read and validated at once
+    executor : Optional[Executor]
+        Executor that validates the contents, the loop's default executor if None
+    """
+    return await map_bounded(lambda path: model.aload(path, executor), paths, max_concurrency)
+
+
+async def awrite_standard_files(
+    models: Iterable[Tuple[DataCoreModel, Optional[Path]]],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    executor: Optional[Executor] = None,
+) -> None:
+    """
+    Write many models to the standard file in their output directory, see DataCoreModel.awrite_standard_file
+
+    Parameters
+    ----------
+    models : Iterable[Tuple[DataCoreModel, Optional[Path]]]
+        Each model and its output directory
+    max_concurrency : int
+        Models serialized and written at once
+    executor : Optional[Executor]
+        Executor that serializes the models, the loop's default executor if None
+    """
+    await map_bounded(
+        lambda item: item[0].awrite_standard_file(output_directory=item[1], executor=executor),
+        models,
+        max_concurrency,
+    )
@@ -1,10 +1,11 @@
 """Utility methods to check compatibility"""
 
 import logging
-from typing import Optional
+from typing import List, Optional
 
 from aind_data_schema.core.acquisition import Acquisition
 from aind_data_schema.core.instrument import Instrument
+from aind_data_schema.utils.diagnostics import report
 
 logger = logging.getLogger(__name__)
 
@@ -12,10 +13,22 @@ logger = logging.getLogger(__name__)
 class InstrumentAcquisitionCompatibility:
     """Class of methods to check compatibility between instrument and acquisition"""
 
-    def __init__(self, instrument: Instrument, acquisition: Acquisition) -> None:
-        """Initiate InstrumentAcquisitionCompatibility class"""
+    def __init__(
+        self, instrument: Instrument, acquisition: Acquisition, component_names: Optional[List[str]] = None
+    ) -> None:
+        """Initiate InstrumentAcquisitionCompatibility class
+
+        component_names are the instrument's component names, if the caller already has them
+        """
         self.inst = instrument
         self.acquisition = acquisition
+        self._component_names = component_names
+
+    def _instrument_component_names(self) -> List[str]:
+        """Component names of the instrument, collected once"""
+        if self._component_names is None:
+            self._component_names = self.inst.get_component_names()
+        return self._component_names
 
     def _compare_instrument_id(self) -> Optional[ValueError]:
         """Compares instrument_id"""
@@ -34,7 +47,7 @@ class InstrumentAcquisitionCompatibility:
             for stimulus_epoch in getattr(self.acquisition, "stimulus_epochs", [])
             for stimulus_device_name in getattr(stimulus_epoch, "active_devices")
         ]
-        instrument_component_names = self.inst.get_component_names()
+        instrument_component_names = self._instrument_component_names()
 
         if any(device not in instrument_component_names for device in acquisition_stimulus_devices):
             return ValueError(
@@ -52,7 +65,7 @@ class InstrumentAcquisitionCompatibility:
             for data_stream in self.acquisition.data_streams:
                 active_devices.extend(data_stream.active_devices)
 
-        instrument_component_names = self.inst.get_component_names()
+        instrument_component_names = self._instrument_component_names()
 
         # Find devices that are not in instrument (they might be in procedures)
         missing_from_instrument = [device for device in active_devices if device not in instrument_component_names]
@@ -64,9 +77,12 @@ class InstrumentAcquisitionCompatibility:
                     f"Note: These devices may be valid if they exist in Procedures."
                 )
             else:
-                logger.error(
+                report(
+                    "compatibility.missing_active_devices",
                     f"Active devices {set(missing_from_instrument)} were not found in Instrument.components. "
-                    f"Note: These devices may be valid if they exist in Procedures."
+                    f"Note: These devices may be valid if they exist in Procedures.",
+                    path="acquisition.data_streams",
+                    log=logger.error,
                 )
 
         return None
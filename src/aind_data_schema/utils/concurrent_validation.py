@@ -0,0 +1,100 @@
+"""Validate many documents of a model with a thread pool
+
+Validation keeps no state shared between documents: validators only replace fields
+of the model they are building, the validation tier travels in the validation
+context, and each document's diagnostics are recorded in its own collector.
+
+Schemas are built lazily on first use (defer_build), so validate_documents builds
+the schemas of the model and every model nested in it before spreading the work
+over threads, instead of having several threads race to build the same schema.
+"""
+
+import typing
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Generic, List, Optional, Sequence, Set, Type, TypeVar, Union
+
+from pydantic import BaseModel
+
+from aind_data_schema.utils.diagnostics import Diagnostic, collect_diagnostics
+from aind_data_schema.utils.validation_tiers import VALIDATION_TIER, get_validation_tier
+
+ModelType = TypeVar("ModelType", bound=BaseModel)
+Document = Union[str, bytes, Dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class ValidatedDocument(Generic[ModelType]):
+    """A validated model and the diagnostics reported while validating it"""
+
+    model: ModelType
+    diagnostics: List[Diagnostic]
+
+
+def _nested_models(annotation: Any, found: Set[Type[BaseModel]]) -> None:
+    """Add the models in an annotation, and the models nested in their fields, to found"""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        if annotation in found:
+            return
+        found.add(annotation)
+        for field_info in annotation.model_fields.values():
+            _nested_models(field_info.annotation, found)
+    for argument in typing.get_args(annotation):
+        _nested_models(argument, found)
+
+
+def build_schemas(model: Type[BaseModel]) -> None:
+    """Build the deferred schemas of a model and of every model nested in it"""
+    found: Set[Type[BaseModel]] = set()
+    _nested_models(model, found)
+    for nested in found:
+        if not nested.__pydantic_complete__:
+            nested.model_rebuild()
+
+
+def validate_document(
+    model: Type[ModelType], document: Document, context: Optional[Dict[str, Any]] = None
+) -> ValidatedDocument[ModelType]:
+    """Validate a JSON string or a dictionary, recording the diagnostics reported for this document only"""
+    with collect_diagnostics() as collector:
+        if isinstance(document, (str, bytes)):
+            validated = model.model_validate_json(document, context=context)
+        else:
+            validated = model.model_validate(document, context=context)
+    return ValidatedDocument(validated, collector.diagnostics)
+
+
+def validate_documents(
+    model: Type[ModelType],
+    documents: Sequence[Document],
+    max_workers: Optional[int] = None,
+    context: Optional[Dict[str, Any]] = None,
+) -> List[ValidatedDocument[ModelType]]:
+    """
+    Validate documents of a model on a thread pool
+
+    Threads run in parallel on free-threaded Python builds. On builds with the GIL
+    validation is CPU bound and gains little from more threads.
+
+    Parameters
+    ----------
+    model : Type[ModelType]
+        Model of the documents
+    documents : Sequence[Document]
+        JSON strings, or dictionaries
+    max_workers : Optional[int]
+        Threads to validate with, by default ThreadPoolExecutor's default
+    context : Optional[Dict[str, Any]]
+        Validation context. The validation tier of the calling thread is added to it
+        if it doesn't set one, since worker threads don't share the caller's tier.
+
+    Returns
+    -------
+    List[ValidatedDocument[ModelType]]
+        Results in document order. The first invalid document's error is raised.
+    """
+    context = dict(context or {})
+    context[VALIDATION_TIER] = get_validation_tier(context)
+    build_schemas(model)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda document: validate_document(model, document, context), documents))
@@ -0,0 +1,172 @@
+"""Conversion between coordinate systems that differ in axis order, direction and unit"""
+
+from functools import lru_cache
+from typing import Any, List, Tuple
+
+from aind_data_schema_models.coordinates import Direction
+from aind_data_schema_models.units import SizeUnit
+
+CONVERSION_CACHE_SIZE = 256
+
+# Lengths in nanometers, so that metric conversions are exact
+SIZE_UNIT_IN_NANOMETERS = {
+    SizeUnit.M: 1e9,
+    SizeUnit.CM: 1e7,
+    SizeUnit.MM: 1e6,
+    SizeUnit.UM: 1e3,
+    SizeUnit.NM: 1.0,
+    SizeUnit.IN: 2.54e7,
+}
+
+# Each anatomical/physical direction is a signed line through space
+_DIRECTION_LINES = {
+    Direction.LR: ("LR", 1),
+    Direction.RL: ("LR", -1),
+    Direction.AP: ("AP", 1),
+    Direction.PA: ("AP", -1),
+    Direction.IS: ("IS", 1),
+    Direction.SI: ("IS", -1),
+    Direction.FB: ("FB", 1),
+    Direction.BF: ("FB", -1),
+    Direction.UD: ("UD", 1),
+    Direction.DU: ("UD", -1),
+}
+
+SystemKey = Tuple[str, str, Tuple[Tuple[str, str], ...]]
+
+
+def size_unit_scale(from_unit: SizeUnit, to_unit: SizeUnit) -> float:
+    """Factor that converts a length in from_unit to to_unit"""
+    if from_unit == to_unit:
+        return 1.0
+    if SizeUnit.PX in (from_unit, to_unit):
+        raise ValueError(f"Cannot convert between {SizeUnit(from_unit).value} and {SizeUnit(to_unit).value}")
+    return SIZE_UNIT_IN_NANOMETERS[SizeUnit(from_unit)] / SIZE_UNIT_IN_NANOMETERS[SizeUnit(to_unit)]
+
+
+def _axis_line(name: str, direction: str) -> Tuple[str, int]:
+    """Return the (line, sign) an axis points along
+
+    Anatomical and physical directions identify the line on their own. Positive/Negative
+    directions only carry meaning together with the axis name.
+    """
+    direction = Direction(direction)
+    if direction == Direction.POS:
+        return f"axis {name}", 1
+    if direction == Direction.NEG:
+        return f"axis {name}", -1
+    if direction not in _DIRECTION_LINES:
+        raise ValueError(f"Cannot convert axis {name} with direction {direction.value}")
+    return _DIRECTION_LINES[direction]
+
+
+def system_key(coordinate_system: Any) -> SystemKey:
+    """Hashable summary of the parts of a CoordinateSystem that define its geometry"""
+    return (
+        coordinate_system.origin,
+        coordinate_system.axis_unit,
+        tuple((axis.name, axis.direction) for axis in coordinate_system.axes),
+    )
+
+
+class CoordinateSystemConversion:
+    """Axis permutation, sign flip and unit scale that map one coordinate system onto another
+
+    A point ``p`` in the source system is ``q[i] = signs[i] * scale * p[permutation[i]]``
+    in the target system.
+    """
+
+    def __init__(self, permutation: Tuple[int, ...], signs: Tuple[int, ...], scale: float) -> None:
+        """Initialize the conversion"""
+        self.permutation = permutation
+        self.signs = signs
+        self.scale = scale
+        self._factors = None
+
+    @property
+    def is_identity(self) -> bool:
+        """True when the two systems describe the same axes in the same unit"""
+        return (
+            self.scale == 1.0
+            and self.permutation == tuple(range(len(self.permutation)))
+            and all(sign == 1 for sign in self.signs)
+        )
+
+    def to_matrix(self) -> List[List[float]]:
+        """Return the conversion as a homogeneous affine matrix"""
+        size = len(self.permutation)
+        matrix = [[0.0] * (size + 1) for _ in range(size + 1)]
+        for i, (j, sign) in enumerate(zip(self.permutation, self.signs)):
+            matrix[i][j] = sign * self.scale
+        matrix[size][size] = 1.0
+        return matrix
+
+    def convert(self, points: Any) -> Any:
+        """Convert a single point of length D or an N x D array of points to the target system"""
+        import numpy as np
+
+        if self._factors is None:
+            self._factors = np.array(self.signs, dtype=float) * self.scale
+        points = np.asarray(points, dtype=float)
+        if points.ndim not in (1, 2) or points.shape[-1] != len(self.permutation):
+            raise ValueError(f"Expected points with {len(self.permutation)} columns, got shape {points.shape}")
+        return points[..., self.permutation] * self._factors
+
+
+@lru_cache(maxsize=CONVERSION_CACHE_SIZE)
+def _conversion_between(source: SystemKey, target: SystemKey) -> CoordinateSystemConversion:
+    """Derive the conversion between two system keys"""
+    source_origin, source_unit, source_axes = source
+    target_origin, target_unit, target_axes = target
+
+    if source_origin != target_origin:
+        raise ValueError(f"Cannot convert between coordinate systems with origins {source_origin} and {target_origin}")
+    if len(source_axes) != len(target_axes):
+        raise ValueError(
+            f"Cannot convert between coordinate systems with {len(source_axes)} and {len(target_axes)} axes"
+        )
+
+    source_lines = {}
+    for index, (name, direction) in enumerate(source_axes):
+        line, sign = _axis_line(name, direction)
+        if line in source_lines:
+            raise ValueError(f"Coordinate system has more than one axis along {line}")
+        source_lines[line] = (index, sign)
+
+    permutation = []
+    signs = []
+    for name, direction in target_axes:
+        line, sign = _axis_line(name, direction)
+        if line not in source_lines:
+            raise ValueError(f"Source coordinate system has no axis along {line}")
+        source_index, source_sign = source_lines[line]
+        permutation.append(source_index)
+        signs.append(sign * source_sign)
+
+    return CoordinateSystemConversion(tuple(permutation), tuple(signs), size_unit_scale(source_unit, target_unit))
+
+
+def get_conversion(source: Any, target: Any) -> CoordinateSystemConversion:
+    """Return the cached conversion from one CoordinateSystem to another
+
+    Raises a ValueError if the systems have different origins, a different number of
+    axes, axes that do not correspond, or units that cannot be converted.
+    """
+    return _conversion_between(system_key(source), system_key(target))
+
+
+def convert_points(points: Any, source: Any, target: Any) -> Any:
+    """Convert points from one CoordinateSystem to another, e.g. BREGMA_ARI to BREGMA_RAS"""
+    return get_conversion(source, target).convert(points)
+
+
+def coordinate_systems_equivalent(system1: Any, system2: Any) -> bool:
+    """True if two coordinate systems describe the same geometry, regardless of their names"""
+    key1 = system_key(system1)
+    key2 = system_key(system2)
+    if key1 == key2:
+        return True
+    try:
+        return _conversion_between(key1, key2).is_identity
+    except ValueError:
+        return False
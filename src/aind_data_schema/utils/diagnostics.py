@@ -0,0 +1,154 @@
+"""Collect the warnings raised by validators as structured diagnostics
+
+Validators report non-fatal problems through report(). Outside a collector these are
+warned or logged as before. Inside collect_diagnostics() they are recorded instead,
+once per distinct (code, path, message) with a count, which is much cheaper than
+warnings.warn in batch jobs and doesn't repeat the same message thousands of times:
+
+    with collect_diagnostics() as collector:
+        for path in paths:
+            Acquisition.model_validate_json(Path(path).read_text())
+    for diagnostic, count in collector.counts().items():
+        print(diagnostic.code, count)
+
+The collector is active in the thread or task that entered the with block. Worker
+threads can share it by entering collect_diagnostics(collector) themselves.
+"""
+
+import logging
+import threading
+import warnings
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Type
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Diagnostic:
+    """
+    A non-fatal problem found during validation
+
+    code identifies the kind of problem, e.g. "metadata.missing_file", and path is
+    where it was found, relative to the model that reported it. category is the
+    warning class it is warned with, e.g. DeprecationWarning.
+    """
+
+    code: str
+    path: str
+    message: str
+    category: Type[Warning] = UserWarning
+
+
+Sink = Callable[[Diagnostic], None]
+
+
+def warnings_sink(diagnostic: Diagnostic) -> None:
+    """Sink warning each diagnostic"""
+    warnings.warn(f"[{diagnostic.code}] {diagnostic.message}", diagnostic.category)
+
+
+def logging_sink(log: logging.Logger = logger, level: int = logging.WARNING) -> Sink:
+    """Sink logging each diagnostic"""
+
+    def sink(diagnostic: Diagnostic) -> None:
+        """Log the diagnostic"""
+        log.log(level, f"[{diagnostic.code}] {diagnostic.path}: {diagnostic.message}")
+
+    return sink
+
+
+class DiagnosticsCollector:
+    """Thread-safe record of diagnostics, deduplicated with a count of each"""
+
+    def __init__(self, sink: Optional[Sink] = None) -> None:
+        """
+        Parameters
+        ----------
+        sink : Optional[Sink]
+            Called with the first occurrence of each distinct diagnostic, e.g. warnings_sink
+        """
+        self.sink = sink
+        self._counts: Dict[Diagnostic, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, code: str, message: str, path: str = "", category: Type[Warning] = UserWarning) -> None:
+        """Record a diagnostic"""
+        diagnostic = Diagnostic(code, path, message, category)
+        with self._lock:
+            count = self._counts.get(diagnostic, 0)
+            self._counts[diagnostic] = count + 1
+        if not count and self.sink is not None:
+            self.sink(diagnostic)
+
+    @property
+    def diagnostics(self) -> List[Diagnostic]:
+        """Distinct diagnostics, in the order they were first recorded"""
+        with self._lock:
+            return list(self._counts)
+
+    def counts(self, code: Optional[str] = None) -> Dict[Diagnostic, int]:
+        """Number of times each distinct diagnostic was recorded, optionally of one code only"""
+        with self._lock:
+            return {d: n for d, n in self._counts.items() if code is None or d.code == code}
+
+    def clear(self) -> None:
+        """Forget all diagnostics"""
+        with self._lock:
+            self._counts.clear()
+
+
+_active_collector: ContextVar[Optional[DiagnosticsCollector]] = ContextVar("diagnostics_collector", default=None)
+
+
+@contextmanager
+def collect_diagnostics(
+    collector: Optional[DiagnosticsCollector] = None, sink: Optional[Sink] = None
+) -> Iterator[DiagnosticsCollector]:
+    """
+    Record the diagnostics reported inside the with block, in this thread or task, in a collector
+
+    Parameters
+    ----------
+    collector : Optional[DiagnosticsCollector]
+        Collector to record in, e.g. one shared by worker threads. A new one if None.
+    sink : Optional[Sink]
+        Sink of the new collector, set the sink of an existing collector when creating it
+
+    Raises
+    ------
+    ValueError
+        If both a collector and a sink are given
+    """
+    if collector is not None and sink is not None:
+        raise ValueError("Pass the sink to the DiagnosticsCollector, not with an existing collector")
+    collector = collector or DiagnosticsCollector(sink)
+    token = _active_collector.set(collector)
+    try:
+        yield collector
+    finally:
+        _active_collector.reset(token)
+
+
+def report(
+    code: str,
+    message: str,
+    path: str = "",
+    category: Type[Warning] = UserWarning,
+    log: Optional[Callable[[str], None]] = None,
+) -> None:
+    """
+    Report a non-fatal problem found by a validator
+
+    Recorded in the active collector if there is one. Otherwise it is passed to log if
+    given, e.g. logger.warning, or warned with the category from the caller's line.
+    """
+    collector = _active_collector.get()
+    if collector is not None:
+        collector.record(code, message, path, category)
+    elif log is not None:
+        log(message)
+    else:
+        warnings.warn(message, category, stacklevel=2)
@@ -7,6 +7,7 @@ import json
 import os
 
 from aind_data_schema.core.metadata import CORE_FILES
+from aind_data_schema.utils.docs.utils import write_if_changed
 
 
 def process_core_file(core_file):
@@ -87,9 +88,8 @@ def process_core_file(core_file):
         replacement = replacement.replace(f"/{core_file}.md", "")
         combined_content = combined_content.replace(link, replacement)
 
-    # Write to the output file
-    with open(output_file_path, "w") as output_file:
-        output_file.write(combined_content)
+    # Write to the output file, unchanged files keep their timestamp for incremental Sphinx builds
+    write_if_changed(output_file_path, combined_content)
 
     print(f"Documentation generated for {core_file} with {len(md_files)} files: {output_file_path}")
 
@@ -158,8 +158,7 @@ def process_components(component_folder, output_rel_path):
     combined_content = combined_content.replace("(aind_data_schema_models/", "(../aind_data_schema_models/")
 
     # Write to the output file
-    with open(output_file_path, "w") as output_file:
-        output_file.write(combined_content)
+    write_if_changed(output_file_path, combined_content)
 
     print(f"Documentation generated for component {component_folder} with {len(md_files)} files: {output_file_path}")
 
@@ -231,8 +230,7 @@ def process_registry(registry_folder, output_rel_path):
         combined_content += f"{model_content}\n\n"
 
     # Write to the output file
-    with open(output_file_path, "w") as output_file:
-        output_file.write(combined_content)
+    write_if_changed(output_file_path, combined_content)
 
     print(f"Documentation generated for registry {registry_folder} with {len(md_files)} files: {output_file_path}")
 
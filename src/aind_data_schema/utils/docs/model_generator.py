@@ -1,17 +1,32 @@
 """Code to generate markdown tables for each model"""
 
+import argparse
+import ast
 import importlib.util
 import inspect
 import json
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
-from typing import Dict, List, Optional, Type, get_args, get_origin
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Set, Type, get_args, get_origin
 
 from pydantic import BaseModel
 
 from aind_data_schema.base import DataModel, _GenericModel
-from aind_data_schema.utils.docs.utils import generate_enum_table
+from aind_data_schema.utils.docs.utils import (
+    environment_hash,
+    generate_enum_table,
+    hash_files,
+    is_cache_entry_valid,
+    load_build_cache,
+    model_link,
+    save_build_cache,
+    write_if_changed,
+)
+
+BUILD_CACHE_NAME = "model_generator"
 
 special_cases = {
     "pydantic.types.AwareDatetime": "datetime (timezone-aware)",
@@ -198,9 +213,26 @@ def _handle_class_types(tp) -> Optional[str]:
 def get_type_string(tp) -> str:
     """Format the type into a readable string.
 
+    Results are memoized, the same annotations appear in many models.
+
     Args:
         tp: The type to format
     """
+    try:
+        return _cached_type_string(tp)
+    except TypeError:
+        # Annotations with unhashable metadata can't be cached
+        return _format_type_string(tp)
+
+
+@lru_cache(maxsize=None)
+def _cached_type_string(tp) -> str:
+    """Memoized _format_type_string"""
+    return _format_type_string(tp)
+
+
+def _format_type_string(tp) -> str:
+    """Format the type into a readable string, see get_type_string"""
     # Use get_origin and get_args for proper type inspection
     origin = get_origin(tp)
     args = get_args(tp)
@@ -277,16 +309,28 @@ def generate_markdown_table(model: Type[BaseModel], stop_at: Type[BaseModel]) ->
     return header + "\n".join(rows) + "\n"
 
 
-def clear_directory(path):
-    """Clear all files in the given directory."""
+def clear_directory(path, keep=()):
+    """Remove the files in the given directory, except those in keep.
+
+    Args:
+        path: Directory to clear
+        keep: Paths of files to leave in place
+    """
+    keep = {os.path.abspath(file) for file in keep}
     if os.path.exists(path):
         for root, dirs, files in os.walk(path):
             for file in files:
-                os.remove(os.path.join(root, file))
+                file_path = os.path.join(root, file)
+                if os.path.abspath(file_path) not in keep:
+                    os.remove(file_path)
 
 
-def process_module(module_name, module_path, src_folder, doc_folder, model_link_map):
-    """Process a single module to generate markdown documentation."""
+def process_module(module_name, module_path, src_folder, doc_folder, model_link_map) -> Optional[List[str]]:
+    """Process a single module to generate markdown documentation.
+
+    Files from a previous run that the module no longer produces are removed.
+    Returns the files written, relative to doc_folder, or None if the module could not be processed.
+    """
     try:
         spec = importlib.util.spec_from_file_location(module_name, module_path)
         module = importlib.util.module_from_spec(spec)
@@ -295,8 +339,7 @@ def process_module(module_name, module_path, src_folder, doc_folder, model_link_
         rel_dir_path = os.path.splitext(os.path.relpath(module_path, src_folder))[0]
 
         output_path = os.path.join(doc_folder, rel_dir_path)
-
-        clear_directory(output_path)
+        written = []
 
         for attr_name in dir(module):
             attr = getattr(module, attr_name)
@@ -308,75 +351,168 @@ def process_module(module_name, module_path, src_folder, doc_folder, model_link_
             try:
                 # Check if the attribute is a DataModel subclass, _GenericModel subclass, or an Enum
                 if issubclass(attr, DataModel) and attr is not DataModel:
-                    process_data_model(attr, rel_dir_path, doc_folder, model_link_map)
+                    written.append(process_data_model(attr, rel_dir_path, doc_folder, model_link_map))
                 elif issubclass(attr, _GenericModel) and attr is not _GenericModel:
-                    process_data_model(attr, rel_dir_path, doc_folder, model_link_map)
+                    written.append(process_data_model(attr, rel_dir_path, doc_folder, model_link_map))
                 elif issubclass(attr, Enum) and attr is not Enum:
-                    process_enum(attr, rel_dir_path, doc_folder, model_link_map)
+                    written.append(process_enum(attr, rel_dir_path, doc_folder, model_link_map))
             except TypeError:
                 continue
+
+        clear_directory(output_path, keep=[os.path.join(doc_folder, file) for file in written])
+        return written
     except Exception as e:
         print(f"Error processing {module_path}: {e}")
+        return None
 
 
-def process_data_model(attr, rel_dir_path, doc_folder, model_link_map):
-    """Generate markdown documentation for a DataModel or GenericModel subclass."""
-    markdown_output = generate_markdown_table(attr, BaseModel)
-
+def _write_model_doc(model_name, markdown_output, rel_dir_path, doc_folder, model_link_map) -> str:
+    """Write a model's markdown, add its link and return the file path relative to doc_folder."""
     target_dir = os.path.join(doc_folder, rel_dir_path)
     os.makedirs(target_dir, exist_ok=True)
 
-    output_file = os.path.join(target_dir, f"{attr.__name__}.md")
-    with open(output_file, "w") as f:
-        f.write(markdown_output)
-
-    doc_rel_path = rel_dir_path.replace(os.sep, "/")
-    link = f"[{attr.__name__}]({doc_rel_path}.md#{attr.__name__.lower()})"
-    link = link.replace("aind_data_schema/core/", "").replace("aind_data_schema/", "")
-    model_link_map[f"{{{attr.__name__}}}"] = link
+    output_file = os.path.join(target_dir, f"{model_name}.md")
+    write_if_changed(output_file, markdown_output)
 
+    model_link_map[f"{{{model_name}}}"] = model_link(model_name, rel_dir_path)
+    return os.path.relpath(output_file, doc_folder)
 
-def process_enum(attr, rel_dir_path, doc_folder, model_link_map):
-    """Generate markdown documentation for an Enum."""
-    markdown_output = generate_enum_table(attr)
 
-    target_dir = os.path.join(doc_folder, rel_dir_path)
-    os.makedirs(target_dir, exist_ok=True)
+def process_data_model(attr, rel_dir_path, doc_folder, model_link_map) -> str:
+    """Generate markdown documentation for a DataModel or GenericModel subclass."""
+    markdown_output = generate_markdown_table(attr, BaseModel)
+    return _write_model_doc(attr.__name__, markdown_output, rel_dir_path, doc_folder, model_link_map)
 
-    output_file = os.path.join(target_dir, f"{attr.__name__}.md")
-    with open(output_file, "w") as f:
-        f.write(markdown_output)
 
-    doc_rel_path = rel_dir_path.replace(os.sep, "/")
-    link = f"[{attr.__name__}]({doc_rel_path}.md#{attr.__name__.lower()})"
-    link = link.replace("aind_data_schema/core/", "").replace("aind_data_schema/", "")
-    model_link_map[f"{{{attr.__name__}}}"] = link
+def process_enum(attr, rel_dir_path, doc_folder, model_link_map) -> str:
+    """Generate markdown documentation for an Enum."""
+    markdown_output = generate_enum_table(attr)
+    return _write_model_doc(attr.__name__, markdown_output, rel_dir_path, doc_folder, model_link_map)
 
 
 def save_model_link_map(doc_folder, model_link_map):
     """Save the model link map as a JSON file."""
     link_map_path = os.path.join(doc_folder, "model_links.json")
-    with open(link_map_path, "w") as f:
-        json.dump(model_link_map, f, indent=2)
+    write_if_changed(link_map_path, json.dumps(model_link_map, indent=2))
     print(f"Model link map saved to {link_map_path}")
 
 
-if __name__ == "__main__":
-    src_folder = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../"))
-    doc_folder = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../docs/base/models"))
-    current_script_path = os.path.abspath(__file__)
+def _imported_modules(tree: ast.AST) -> Set[str]:
+    """Names of the aind_data_schema modules, or module members, imported in a parsed module"""
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            names.add(node.module)
+            names.update(f"{node.module}.{alias.name}" for alias in node.names)
+        elif isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+    return {name for name in names if name.split(".")[0] == "aind_data_schema"}
+
+
+@lru_cache(maxsize=None)
+def local_dependencies(module_path, src_folder) -> FrozenSet[str]:
+    """Source files of the aind_data_schema modules that a module imports directly"""
+    with open(module_path, "r") as f:
+        tree = ast.parse(f.read())
+    paths = set()
+    for name in _imported_modules(tree):
+        candidate = os.path.join(src_folder, *name.split("."))
+        for path in (f"{candidate}.py", os.path.join(candidate, "__init__.py")):
+            if os.path.exists(path):
+                paths.add(os.path.abspath(path))
+    return frozenset(paths)
+
+
+def module_definition_hash(module_path, src_folder) -> str:
+    """Hash of a module, every aind_data_schema module it imports transitively and the generator environment"""
+    seen = set()
+    pending = [os.path.abspath(module_path)]
+    while pending:
+        path = pending.pop()
+        if path not in seen:
+            seen.add(path)
+            pending.extend(local_dependencies(path, src_folder))
+    return hash_files(sorted(seen), extra=environment_hash())
+
+
+def build_module_docs(module_name, module_path, src_folder, doc_folder, cached: Optional[dict] = None) -> dict:
+    """Generate the documentation for one module, unless the cached build is still current.
+
+    Returns a build cache entry with the module's definition hash, the files it wrote and its model links.
+    """
+    key = module_definition_hash(module_path, src_folder)
+    if cached is not None and is_cache_entry_valid(cached, key, doc_folder):
+        print(f"Skipping unchanged module: {module_name}")
+        return cached
+
+    print(f"Processing module: {module_name}")
     model_link_map = {}
+    files = process_module(module_name, module_path, src_folder, doc_folder, model_link_map)
+    if files is None:
+        # Don't cache failures, retry them on the next run
+        return {"key": None, "files": [], "links": model_link_map}
+    return {"key": key, "files": files, "links": model_link_map}
+
 
+def find_modules(src_folder) -> List[tuple]:
+    """(module name, path) of each module to document, excluding this script"""
+    current_script_path = os.path.abspath(__file__)
+    modules = []
     for root, _, files in os.walk(src_folder):
-        for file in files:
-            if file.endswith(".py") and file != "__init__.py":
-                module_path = os.path.join(root, file)
+        for file in sorted(files):
+            module_path = os.path.join(root, file)
+            if file.endswith(".py") and file != "__init__.py" and os.path.abspath(module_path) != current_script_path:
+                module_name = os.path.splitext(os.path.relpath(module_path, src_folder))[0].replace(os.sep, ".")
+                modules.append((module_name, module_path))
+    return modules
 
-                if os.path.abspath(module_path) == current_script_path:
-                    continue
 
-                module_name = os.path.splitext(os.path.relpath(module_path, src_folder))[0].replace(os.sep, ".")
-                print(f"Processing module: {module_name}")
-                process_module(module_name, module_path, src_folder, doc_folder, model_link_map)
+def generate_model_docs(src_folder, doc_folder, processes: int = 1) -> Dict[str, str]:
+    """Generate markdown documentation for every module in src_folder.
 
+    Modules whose source, local imports and generator environment are unchanged since the
+    last run are skipped, and unchanged files are not rewritten.
+
+    Args:
+        src_folder: Folder containing the aind_data_schema package
+        doc_folder: Output folder for the markdown files
+        processes: Number of worker processes used to document modules
+    """
+    cache = load_build_cache(doc_folder, BUILD_CACHE_NAME)
+    modules = find_modules(src_folder)
+
+    if processes > 1:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            futures = [
+                executor.submit(build_module_docs, name, path, src_folder, doc_folder, cache.get(name))
+                for name, path in modules
+            ]
+            entries = {name: future.result() for (name, _), future in zip(modules, futures)}
+    else:
+        entries = {
+            name: build_module_docs(name, path, src_folder, doc_folder, cache.get(name)) for name, path in modules
+        }
+
+    # Remove the documentation of modules that no longer exist
+    for name in set(cache) - set(entries):
+        for file in cache[name].get("files", []):
+            if os.path.exists(os.path.join(doc_folder, file)):
+                os.remove(os.path.join(doc_folder, file))
+
+    model_link_map = {}
+    for entry in entries.values():
+        model_link_map.update(entry["links"])
+
+    save_build_cache(doc_folder, BUILD_CACHE_NAME, entries)
     save_model_link_map(doc_folder, model_link_map)
+    return model_link_map
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--processes", type=int, default=1, help="Number of worker processes")
+    args = parser.parse_args()
+
+    src_folder = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../"))
+    doc_folder = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../docs/base/models"))
+    generate_model_docs(src_folder, doc_folder, processes=args.processes)
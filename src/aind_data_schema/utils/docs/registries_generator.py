@@ -81,7 +81,18 @@ from aind_data_schema_models.units import (
     VolumeUnit,
 )
 
-from aind_data_schema.utils.docs.utils import generate_enum_table, save_model_info, update_model_links
+from aind_data_schema.utils.docs.utils import (
+    environment_hash,
+    generate_enum_table,
+    is_cache_entry_valid,
+    load_build_cache,
+    model_link,
+    save_build_cache,
+    save_model_info,
+    update_model_links,
+)
+
+BUILD_CACHE_NAME = "registries_generator"
 
 # Special case classes that should be processed as model schemas even if they don't contain model instances
 MODEL_SCHEMA_CLASSES = [
@@ -362,10 +373,33 @@ def detect_registry_type(registry):
     return "unknown"
 
 
-def generate_registry_docs():
-    """Generate markdown docs for registry models"""
-    doc_folder = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../docs/base/models"))
+def render_registry(registry):
+    """Generate the markdown for a registry, or None if its type is unknown"""
+    # Detect registry type
+    registry_type = detect_registry_type(registry)
+
+    # Generate the appropriate table based on registry type
+    if registry_type == "enum":
+        return generate_enum_table(registry)
+    elif registry_type == "model_instance":
+        return generate_model_instance_table(registry)
+    elif registry_type == "model_schema":
+        return generate_model_schema_table(registry)
+    print(f"Unknown registry type for {registry.__name__}")
+    return None
+
+
+def generate_registry_docs(doc_folder=None):
+    """Generate markdown docs for registry models
+
+    Registries are only rendered again when aind_data_schema_models, pydantic or the
+    documentation generators change, or when their output is missing.
+    """
+    if doc_folder is None:
+        doc_folder = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../docs/base/models"))
     model_link_map = {}
+    cache = load_build_cache(doc_folder, BUILD_CACHE_NAME)
+    key = environment_hash()
 
     for registry in registries:
         try:
@@ -373,26 +407,22 @@ def generate_registry_docs():
             module_name = registry.__module__
             rel_dir_path = module_name.replace(".", os.sep)
 
-            # Detect registry type
-            registry_type = detect_registry_type(registry)
+            if is_cache_entry_valid(cache.get(registry.__name__), key, doc_folder):
+                model_link_map[f"{{{registry.__name__}}}"] = model_link(registry.__name__, rel_dir_path)
+                continue
 
-            # Generate the appropriate table based on registry type
-            if registry_type == "enum":
-                output = generate_enum_table(registry)
-            elif registry_type == "model_instance":
-                output = generate_model_instance_table(registry)
-            elif registry_type == "model_schema":
-                output = generate_model_schema_table(registry)
-            else:
-                print(f"Unknown registry type for {registry.__name__}")
+            output = render_registry(registry)
+            if output is None:
                 continue
 
             # Save the model and update the link map
             save_model_info(registry.__name__, output, rel_dir_path, doc_folder, model_link_map)
+            cache[registry.__name__] = {"key": key, "files": [os.path.join(rel_dir_path, f"{registry.__name__}.md")]}
         except Exception as e:
             print(f"Error processing registry {registry.__name__}: {str(e)}")
 
     # Update the model links file
+    save_build_cache(doc_folder, BUILD_CACHE_NAME, cache)
     update_model_links(doc_folder, model_link_map)
     print("Registry documentation generated successfully.")
 
@@ -1,9 +1,17 @@
 """Shared utilities for documentation generation"""
 
+import hashlib
 import inspect
 import json
 import os
-from typing import Dict
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable
+
+import aind_data_schema_models
+import pydantic
+
+BUILD_CACHE_DIRNAME = ".build_cache"
 
 
 def generate_enum_table(enum_class) -> str:
@@ -22,6 +30,73 @@ def generate_enum_table(enum_class) -> str:
     return header + "\n".join(rows) + "\n"
 
 
+def write_if_changed(path: str, content: str) -> bool:
+    """Write content to path unless the file already holds it
+
+    Unchanged files keep their timestamps, so incremental Sphinx builds skip them.
+    Returns True if the file was written.
+    """
+    if os.path.exists(path):
+        with open(path, "r") as f:
+            if f.read() == content:
+                return False
+    with open(path, "w") as f:
+        f.write(content)
+    return True
+
+
+def hash_files(paths: Iterable, extra: str = "") -> str:
+    """Hash the contents of a list of files, together with an extra string"""
+    digest = hashlib.sha256(extra.encode())
+    for path in paths:
+        digest.update(Path(path).name.encode())
+        digest.update(Path(path).read_bytes())
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def environment_hash() -> str:
+    """Hash of the documentation generators, aind_data_schema_models and the pydantic version"""
+    models_root = Path(aind_data_schema_models.__file__).parent
+    generator_files = sorted(Path(__file__).parent.glob("*.py"))
+    return hash_files(generator_files + sorted(models_root.rglob("*.py")), extra=pydantic.VERSION)
+
+
+def load_build_cache(doc_folder: str, name: str) -> Dict[str, dict]:
+    """Load the build cache a generator saved in doc_folder, or an empty cache"""
+    cache_path = os.path.join(doc_folder, BUILD_CACHE_DIRNAME, f"{name}.json")
+    if not os.path.exists(cache_path):
+        return {}
+    with open(cache_path, "r") as f:
+        return json.load(f)
+
+
+def save_build_cache(doc_folder: str, name: str, cache: Dict[str, dict]) -> None:
+    """Save a generator's build cache in doc_folder"""
+    cache_dir = os.path.join(doc_folder, BUILD_CACHE_DIRNAME)
+    os.makedirs(cache_dir, exist_ok=True)
+    write_if_changed(os.path.join(cache_dir, f"{name}.json"), json.dumps(cache, indent=2, sort_keys=True))
+
+
+def is_cache_entry_valid(entry: dict, key: str, doc_folder: str) -> bool:
+    """True if a cache entry was built from the same key and all of its files still exist"""
+    return (
+        bool(entry)
+        and entry.get("key") == key
+        and all(os.path.exists(os.path.join(doc_folder, file)) for file in entry.get("files", []))
+    )
+
+
+def model_link(model_name: str, rel_dir_path: str) -> str:
+    """Markdown link to a model's documentation, e.g. [ClassName](path/to/directory.md#classname)"""
+    # Convert directory separators to forward slashes for URLs
+    doc_rel_path = rel_dir_path.replace(os.sep, "/")
+    link = f"[{model_name}]({doc_rel_path}.md#{model_name.lower()})"
+
+    # Strip out "aind_data_schema/" and "aind_data_schema/core/" from the links
+    return link.replace("aind_data_schema/core/", "").replace("aind_data_schema/", "")
+
+
 def save_model_info(
     model_name: str, output: str, rel_dir_path: str, doc_folder: str, model_link_map: Dict[str, str]
 ) -> None:
@@ -32,21 +107,10 @@ def save_model_info(
 
     # Save the file in the appropriate subdirectory
     output_file = os.path.join(target_dir, f"{model_name}.md")
-    with open(output_file, "w") as f:
-        f.write(output)
-
-    # Construct the relative documentation path for the link map
-    # Convert directory separators to forward slashes for URLs
-    doc_rel_path = rel_dir_path.replace(os.sep, "/")
-
-    # Create the link format: "[ClassName](path/to/directory#ClassName)"
-    link = f"[{model_name}]({doc_rel_path}.md#{model_name.lower()})"
-
-    # Strip out "aind_data_schema/" and "aind_data_schema/core/" from the links
-    link = link.replace("aind_data_schema/core/", "").replace("aind_data_schema/", "")
+    write_if_changed(output_file, output)
 
     # Add to our mapping dictionary using the format "{ClassName}" as the key
-    model_link_map[f"{{{model_name}}}"] = link
+    model_link_map[f"{{{model_name}}}"] = model_link(model_name, rel_dir_path)
 
 
 def update_model_links(doc_folder: str, model_link_map: Dict[str, str]) -> None:
@@ -61,5 +125,4 @@ def update_model_links(doc_folder: str, model_link_map: Dict[str, str]) -> None:
         model_link_map = existing_map
 
     # Save the updated model link map
-    with open(link_map_path, "w") as f:
-        json.dump(model_link_map, f, indent=2)
+    write_if_changed(link_map_path, json.dumps(model_link_map, indent=2))
@@ -1,21 +1,91 @@
 """script for re-generating all examples"""
 
+import argparse
+import hashlib
+import json
 import logging
 import os
+import runpy
 import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from glob import glob
 from pathlib import Path
+from typing import Dict, List, Optional
+
+from aind_data_schema.utils.json_writer import model_definitions_hash
 
 logger = logging.getLogger(__name__)
 
 CURRENT_DIR = Path(os.path.dirname(os.path.realpath(__file__)))
 ROOT_DIR = CURRENT_DIR.parents[2]
 EXAMPLES_DIR = ROOT_DIR / "examples"
+MANIFEST_FILENAME = ".examples_manifest.json"
+
+
+def _file_hash(path: Path) -> Optional[str]:
+    """Hash of a file's contents, or None if it does not exist"""
+    if not path.exists():
+        return None
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _example_arguments(output_directory=None) -> List[str]:
+    """Command line arguments passed to an example script"""
+    if output_directory is None:
+        return []
+    return ["--output-dir", str(output_directory)]
+
+
+def run_example_in_process(example_file, output_directory=None) -> None:
+    """Run an example script as __main__ in the current interpreter"""
+    saved_argv = sys.argv
+    sys.argv = [str(example_file)] + _example_arguments(output_directory)
+    try:
+        runpy.run_path(str(example_file), run_name="__main__")
+    finally:
+        sys.argv = saved_argv
 
 
 class ExamplesGenerator:
     """Class to generate example files from .py files in examples directory"""
 
+    def __init__(self, in_process: bool = True, processes: int = 1, skip_unchanged: bool = True) -> None:
+        """Initialize the generator
+
+        Parameters
+        ----------
+        in_process : bool
+            Run examples in this interpreter, or in worker processes when processes > 1,
+            instead of starting a new python subprocess for each one
+        processes : int
+            Number of worker processes used for in-process generation
+        skip_unchanged : bool
+            Skip examples whose source, schema code and output are unchanged since the last run
+        """
+        self.in_process = in_process
+        self.processes = processes
+        self.skip_unchanged = skip_unchanged
+
+    @staticmethod
+    def get_example_files() -> List[str]:
+        """Return the example scripts in EXAMPLES_DIR"""
+        return sorted(f for f in glob(str(EXAMPLES_DIR / "*.py")) if Path(f).name != "__init__.py")
+
+    @staticmethod
+    def _output_file(example_file, output_directory=None) -> Path:
+        """JSON file an example writes, examples are named after their output"""
+        directory = Path(output_directory) if output_directory is not None else Path.cwd()
+        return directory / Path(example_file).with_suffix(".json").name
+
+    @staticmethod
+    def _load_manifest(manifest_file: Path) -> Dict[str, dict]:
+        """Read the hashes recorded by the previous run"""
+        if not manifest_file.exists():
+            return {}
+        with open(manifest_file, "r") as f:
+            return json.load(f)
+
     def generate_all_examples(self, output_directory=None):
         """Generate all examples in EXAMPLES_DIR
 
@@ -23,14 +93,43 @@ class ExamplesGenerator:
         ----------
         output_directory : str or Path, optional
             Directory where generated JSON files should be written.
-            If None, defaults to the same directory as the example script.
+            If None, defaults to the current working directory.
         """
 
         logger.info(f"Running all examples in {EXAMPLES_DIR}")
-        for example_file in glob(str(EXAMPLES_DIR / "*.py")):
-            if Path(example_file).name == "__init__.py":
-                continue
-            self.generate_example(example_file, output_directory)
+        example_files = self.get_example_files()
+
+        definitions_hash = model_definitions_hash()
+        manifest_file = (Path(output_directory) if output_directory is not None else Path.cwd()) / MANIFEST_FILENAME
+        manifest = self._load_manifest(manifest_file) if self.skip_unchanged else {}
+        source_hashes = {f: f"{_file_hash(Path(f))}:{definitions_hash}" for f in example_files}
+
+        to_run = []
+        for example_file in example_files:
+            recorded = manifest.get(Path(example_file).name, {})
+            output_hash = _file_hash(self._output_file(example_file, output_directory))
+            if recorded.get("source") == source_hashes[example_file] and recorded.get("output") == output_hash:
+                logger.info(f"Skipping unchanged {example_file}")
+            else:
+                to_run.append(example_file)
+
+        if self.in_process and self.processes > 1 and len(to_run) > 1:
+            with ProcessPoolExecutor(max_workers=self.processes) as executor:
+                futures = [executor.submit(run_example_in_process, f, output_directory) for f in to_run]
+                for future in futures:
+                    future.result()
+        else:
+            for example_file in to_run:
+                self.generate_example(example_file, output_directory)
+
+        for example_file in to_run:
+            manifest[Path(example_file).name] = {
+                "source": source_hashes[example_file],
+                "output": _file_hash(self._output_file(example_file, output_directory)),
+            }
+        manifest_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(manifest_file, "w") as f:
+            json.dump(manifest, f, indent=3)
 
     def generate_example(self, example_file, output_directory=None):
         """Generate example from example_file
@@ -41,16 +140,26 @@ class ExamplesGenerator:
             Path to the example .py file to run
         output_directory : str or Path, optional
             Directory where generated JSON files should be written.
-            If None, defaults to the same directory as the example script.
+            If None, defaults to the current working directory.
         """
 
         logger.info(f"Running {example_file}")
-        cmd = ["python", example_file]
-        if output_directory is not None:
-            cmd.extend(["--output-dir", str(output_directory)])
-        subprocess.run(cmd, check=True)
+        if self.in_process:
+            run_example_in_process(example_file, output_directory)
+        else:
+            cmd = ["python", str(example_file)] + _example_arguments(output_directory)
+            subprocess.run(cmd, check=True)
 
 
 if __name__ == "__main__":
     """Run all examples in EXAMPLES_DIR"""
-    ExamplesGenerator().generate_all_examples()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--output-dir", default=None, help="Output directory for generated JSON files")
+    parser.add_argument("--processes", type=int, default=os.cpu_count(), help="Number of worker processes")
+    parser.add_argument("--subprocess", action="store_true", help="Run each example in a new python process")
+    parser.add_argument("--force", action="store_true", help="Regenerate examples even if they are unchanged")
+    args = parser.parse_args()
+
+    ExamplesGenerator(
+        in_process=not args.subprocess, processes=args.processes, skip_unchanged=not args.force
+    ).generate_all_examples(output_directory=args.output_dir)
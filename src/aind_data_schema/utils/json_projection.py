@@ -0,0 +1,153 @@
+"""Read selected fields from a JSON document without parsing all of it"""
+
+import json
+import re
+from functools import lru_cache
+from types import UnionType
+from typing import Annotated, Any, Dict, Optional, Sequence, Tuple, Union, get_args, get_origin
+
+from pydantic import BaseModel, TypeAdapter
+
+_DECODER = json.JSONDecoder()
+_LEAF = object()
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_STRING = re.compile(r'"(?:[^"\\]|\\.)*"', re.DOTALL)
+
+
+def _skip_whitespace(text: str, index: int) -> int:
+    """Index of the next non-whitespace character"""
+    return _WHITESPACE.match(text, index).end()
+
+
+def _expect(text: str, index: int, character: str) -> int:
+    """Index after a required character, skipping whitespace before it"""
+    index = _skip_whitespace(text, index)
+    if not text.startswith(character, index):
+        raise ValueError(f"Expected '{character}' at position {index}")
+    return index + 1
+
+
+def _skip_value(text: str, index: int) -> int:
+    """Index after the JSON value starting at index
+
+    The C decoder steps over values faster than a tokenizer written in Python can.
+    """
+    return _DECODER.raw_decode(text, index)[1]
+
+
+def _read_key(text: str, index: int) -> Tuple[str, int]:
+    """Object key starting at index and the index of its value"""
+    match = _STRING.match(text, index)
+    if match is None:
+        raise ValueError(f"Expected a key at position {index}")
+    token = match.group()
+    key = json.loads(token) if "\\" in token else token[1:-1]
+    return key, _skip_whitespace(text, _expect(text, match.end(), ":"))
+
+
+def _read_member(text: str, index: int, wanted: Any, path: str, found: Dict[str, Any], total: int) -> Optional[int]:
+    """Read or skip one member value, see _read_object"""
+    if wanted is _LEAF:
+        found[path], index = _DECODER.raw_decode(text, index)
+        return index
+    if isinstance(wanted, dict) and text.startswith("{", index):
+        return _read_object(text, index, wanted, f"{path}.", found, total)
+    return _skip_value(text, index)
+
+
+def _read_object(text: str, index: int, wanted: Dict[str, Any], prefix: str, found: Dict[str, Any], total: int):
+    """
+    Collect the wanted members of the object starting at index into found
+
+    wanted maps keys to _LEAF for values to return, or to a dict of wanted nested keys.
+    Returns the index after the object, or None once all `total` values have been found.
+    """
+    index = _skip_whitespace(text, _expect(text, index, "{"))
+    if text.startswith("}", index):
+        return index + 1
+    while True:
+        key, index = _read_key(text, index)
+        index = _read_member(text, index, wanted.get(key), prefix + key, found, total)
+        if index is None or len(found) == total:
+            return None
+        index = _skip_whitespace(text, index)
+        if text.startswith("}", index):
+            return index + 1
+        index = _skip_whitespace(text, _expect(text, index, ","))
+
+
+def _lookup(found: Dict[str, Any], path: str) -> Any:
+    """Value at path, from the value itself or from an enclosing value that was read instead"""
+    if path in found:
+        return found[path]
+    parts = path.split(".")
+    for length in range(len(parts) - 1, 0, -1):
+        value = found.get(".".join(parts[:length]))
+        if value is not None:
+            for part in parts[length:]:
+                value = value.get(part) if isinstance(value, dict) else None
+            return value
+    return None
+
+
+def read_json_paths(text: str, paths: Sequence[str]) -> Dict[str, Any]:
+    """
+    Read values at dotted paths from a JSON object, e.g. "acquisition.acquisition_start_time"
+
+    Only the objects on the way to the requested paths are walked key by key, other
+    values are stepped over, and reading stops once every path has been found. Paths
+    that are missing, or that pass through a value that isn't an object, are None.
+    """
+    wanted = {}
+    for path in sorted(paths, key=lambda path: path.count(".")):
+        node = wanted
+        *parents, leaf = path.split(".")
+        for part in parents:
+            node = node.setdefault(part, {})
+            if node is _LEAF:
+                break
+        else:
+            node[leaf] = _LEAF
+
+    found = {}
+    total = sum(1 for path in set(paths) if _is_leaf(wanted, path))
+    _read_object(text, _skip_whitespace(text, 0), wanted, "", found, total)
+    return {path: _lookup(found, path) for path in paths}
+
+
+def _is_leaf(wanted: Dict[str, Any], path: str) -> bool:
+    """True if path is read directly, rather than from an enclosing value"""
+    node = wanted
+    for part in path.split("."):
+        node = node.get(part) if isinstance(node, dict) else None
+    return node is _LEAF
+
+
+def _submodel(annotation: Any) -> Optional[type]:
+    """The model class of a model or Optional[model] annotation"""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    args = [arg for arg in get_args(annotation) if arg is not type(None)]
+    if get_origin(annotation) in (Union, UnionType) and len(args) == 1:
+        return _submodel(args[0])
+    return None
+
+
+@lru_cache(maxsize=None)
+def field_adapter(model: type, path: str) -> TypeAdapter:
+    """
+    TypeAdapter for the field at a dotted path of a model, including the field's constraints
+
+    Each part of the path before the last must be a field holding a single model.
+    """
+    *parents, name = path.split(".")
+    for part in parents:
+        field = model.model_fields.get(part)
+        submodel = _submodel(field.annotation) if field is not None else None
+        if submodel is None:
+            raise ValueError(f"Cannot validate {path}, {model.__name__}.{part} is not a model field")
+        model = submodel
+    field = model.model_fields.get(name)
+    if field is None:
+        raise ValueError(f"Cannot validate {path}, {model.__name__} has no field {name}")
+    return TypeAdapter(Annotated[field.annotation, field])
@@ -1,21 +1,187 @@
 """Utility method to write Pydantic schemas to JSON"""
 
 import argparse
+import hashlib
 import importlib
 import json
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
 from pathlib import Path
-from typing import Iterator
+from typing import Dict, Iterator, List, Optional, Sequence, Type
 
+import aind_data_schema_models
+import pydantic
+from pydantic.json_schema import GenerateJsonSchema, JsonSchemaMode, JsonSchemaValue
+from pydantic_core import CoreSchema
+
+import aind_data_schema
 from aind_data_schema import core
 from aind_data_schema.base import DataCoreModel
+from aind_data_schema.utils.schema_bundle import build_shared_definitions, definitions_filename, thin_schema
 
 # Import all modules in core package
 for mod in core.__loader__.get_resource_reader().contents():
     if "__" not in mod and mod.endswith(".py"):
         importlib.import_module(f"aind_data_schema.core.{mod.replace('.py', '')}")
 
+# Generated schemas, keyed by (model definitions hash, model path)
+_SCHEMA_CACHE: Dict[tuple, JsonSchemaValue] = {}
+
+# SharedDefinitionsJsonSchema relies on GenerateJsonSchema internals. Its output matched
+# model_json_schema() for every core model on these pydantic versions, [first, last).
+SHARED_DEFINITIONS_PYDANTIC_VERSIONS = ((2, 7), (2, 13))
+
+
+class SharedDefinitionsJsonSchema(GenerateJsonSchema):
+    """JSON schema generator that can be reused across several models
+
+    Definitions are generated once and shared between the models, while each call to
+    generate returns the same schema as model_json_schema() would for that model.
+    """
+
+    def generate(self, schema: CoreSchema, mode: JsonSchemaMode = "validation") -> JsonSchemaValue:
+        """Generate the JSON schema for one model, reusing definitions from previous calls"""
+        self._mode = mode
+        json_schema = self.generate_inner(schema)
+
+        # GenerateJsonSchema.generate renames definitions in place, so hand it a copy of the ones this model uses
+        used_refs = {self.json_to_defs_refs.get(json_ref) for json_ref in self.get_json_ref_counts(json_schema)}
+        shared_definitions = self.definitions
+        self.definitions = deepcopy({ref: value for ref, value in shared_definitions.items() if ref in used_refs})
+        self._used = False
+        try:
+            return super().generate(schema, mode=mode)
+        finally:
+            self.definitions = shared_definitions
+
+
+def model_definitions_hash() -> str:
+    """Hash of everything that can change a generated schema
+
+    Covers the source of aind_data_schema and aind_data_schema_models and the pydantic version.
+    """
+    digest = hashlib.sha256(pydantic.VERSION.encode())
+    for package in (aind_data_schema, aind_data_schema_models):
+        package_root = Path(package.__file__).parent
+        for source_file in sorted(package_root.rglob("*.py")):
+            digest.update(source_file.relative_to(package_root).as_posix().encode())
+            digest.update(source_file.read_bytes())
+    return digest.hexdigest()
+
+
+def _model_path(model: Type[DataCoreModel]) -> str:
+    """Importable path of a model class"""
+    return f"{model.__module__}.{model.__qualname__}"
+
+
+def _core_schema(model: Type[DataCoreModel]) -> CoreSchema:
+    """Core schema of a model, building it first if it was deferred"""
+    model.model_rebuild()
+    return model.__pydantic_core_schema__
+
+
+def _shared_definitions_supported() -> bool:
+    """True if SharedDefinitionsJsonSchema was checked against the installed pydantic version"""
+    version = tuple(int(part) for part in pydantic.VERSION.split(".")[:2])
+    first, last = SHARED_DEFINITIONS_PYDANTIC_VERSIONS
+    return first <= version < last
+
+
+def generate_schemas(models: Sequence[Type[DataCoreModel]]) -> List[JsonSchemaValue]:
+    """
+    Generate the JSON schema of each model, sharing definitions between them
+
+    Falls back to model_json_schema() for each model on pydantic versions outside
+    SHARED_DEFINITIONS_PYDANTIC_VERSIONS.
+    """
+    if not _shared_definitions_supported():
+        return [model.model_json_schema() for model in models]
+    generator = SharedDefinitionsJsonSchema()
+    return [generator.generate(_core_schema(model)) for model in models]
+
+
+def _generate_schemas_from_paths(model_paths: List[str]) -> List[JsonSchemaValue]:
+    """Import models by path and generate their schemas, run in worker processes"""
+    models = []
+    for model_path in model_paths:
+        module_name, class_name = model_path.rsplit(".", 1)
+        models.append(getattr(importlib.import_module(module_name), class_name))
+    return generate_schemas(models)
+
+
+def _generate_schemas_in_processes(models: Sequence[Type[DataCoreModel]], processes: int) -> List[JsonSchemaValue]:
+    """Split the models across a process pool and generate their schemas"""
+    batches = [list(models[i::processes]) for i in range(processes)]
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        results = list(
+            executor.map(_generate_schemas_from_paths, [[_model_path(model) for model in batch] for batch in batches])
+        )
+
+    schemas = {}
+    for batch, batch_schemas in zip(batches, results):
+        schemas.update(zip(batch, batch_schemas))
+    return [schemas[model] for model in models]
+
+
+def get_json_schemas(
+    models: Sequence[Type[DataCoreModel]], processes: int = 1, cache_dir: Optional[Path] = None
+) -> Dict[Type[DataCoreModel], JsonSchemaValue]:
+    """
+    Returns the JSON schema of each model, equal to model.model_json_schema()
+
+    Schemas are cached in memory, and in cache_dir if given, under a hash of the model
+    definitions so that they are only regenerated when the code changes. The returned
+    dictionaries are shared with the cache and should not be modified.
+
+    Parameters
+    ----------
+    models : Sequence[Type[DataCoreModel]]
+        Models to generate schemas for
+    processes : int
+        Number of worker processes used to generate missing schemas, 1 generates them in this process
+    cache_dir : Optional[Path]
+        Directory to persist generated schemas in between runs
+
+    Returns
+    -------
+    Dict[Type[DataCoreModel], JsonSchemaValue]
+        Mapping of each model to its JSON schema
+    """
+    definitions_hash = model_definitions_hash()
+    cache_path = Path(cache_dir) / definitions_hash if cache_dir is not None else None
+
+    missing = []
+    for model in models:
+        key = (definitions_hash, _model_path(model))
+        if key not in _SCHEMA_CACHE and cache_path is not None and (cache_path / f"{key[1]}.json").exists():
+            with open(cache_path / f"{key[1]}.json", "r") as f:
+                _SCHEMA_CACHE[key] = json.load(f)
+        if key not in _SCHEMA_CACHE:
+            missing.append(model)
+
+    if missing:
+        if processes > 1 and len(missing) > 1:
+            schemas = _generate_schemas_in_processes(missing, min(processes, len(missing)))
+        else:
+            schemas = generate_schemas(missing)
+        for model, schema in zip(missing, schemas):
+            _SCHEMA_CACHE[(definitions_hash, _model_path(model))] = schema
+            if cache_path is not None:
+                _write_cached_schema(cache_path / f"{_model_path(model)}.json", schema)
+
+    return {model: _SCHEMA_CACHE[(definitions_hash, _model_path(model))] for model in models}
+
+
+def _write_cached_schema(path: Path, schema: JsonSchemaValue) -> None:
+    """Write a schema to the cache directory, replacing the file atomically"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary_path = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(temporary_path, "w") as f:
+        json.dump(schema, f)
+    os.replace(temporary_path, path)
+
 
 class SchemaWriter:
     """Class to write Pydantic schemas to JSON"""
@@ -49,7 +215,30 @@ class SchemaWriter:
         )
         parser.set_defaults(attach_version=False)
 
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=1,
+            help="Number of worker processes used to generate schemas",
+        )
+
+        parser.add_argument(
+            "--cache-dir",
+            required=False,
+            default=None,
+            help="Directory to cache generated schemas in between runs",
+        )
+
+        parser.add_argument(
+            "--split",
+            action="store_true",
+            help="Write shared definitions to one file that the model schemas reference",
+        )
+        parser.set_defaults(split=False)
+
         optional_args = parser.parse_args(args)
+        if optional_args.split and (optional_args.processes != 1 or optional_args.cache_dir is not None):
+            parser.error("--processes and --cache-dir are not supported with --split")
 
         return optional_args
 
@@ -62,31 +251,53 @@ class SchemaWriter:
         for model in DataCoreModel.__subclasses__():
             yield model
 
-    def write_to_json(self) -> None:
+    def _get_output_file(self, schema: Type[DataCoreModel]) -> Path:
         """
-        Writes Pydantic models to JSON file.
+        Returns the path a model's schema is written to
         """
-        schemas_to_write = self.get_schemas()
         output_path = self.configs.output
-        for schema in schemas_to_write:
-            filename = schema.default_filename()
-            file_extension = "".join(Path(filename).suffixes)
-            schema_filename = filename.replace(file_extension, "_schema.json")
-            if self.configs.attach_version:
-                schema_version = schema.model_construct().schema_version
-                model_directory_name = schema_filename.replace("_schema.json", "")
-                sub_directory = Path(output_path) / model_directory_name / schema_version
-                output_file = sub_directory / schema_filename
-            else:
-                output_file = Path(output_path) / schema_filename
+        filename = schema.default_filename()
+        file_extension = "".join(Path(filename).suffixes)
+        schema_filename = filename.replace(file_extension, "_schema.json")
+        if self.configs.attach_version:
+            schema_version = schema.model_construct().schema_version
+            model_directory_name = schema_filename.replace("_schema.json", "")
+            sub_directory = Path(output_path) / model_directory_name / schema_version
+            return sub_directory / schema_filename
+        return Path(output_path) / schema_filename
 
-            if not os.path.exists(output_file.parent):
-                os.makedirs(output_file.parent)
+    @staticmethod
+    def _write_json(output_file: Path, contents: dict) -> None:
+        """
+        Writes a JSON document, creating the parent directory if needed
+        """
+        if not os.path.exists(output_file.parent):
+            os.makedirs(output_file.parent)
 
-            with open(output_file, "w") as f:
-                schema_json: dict = schema.model_json_schema()
-                schema_json_str: str = json.dumps(schema_json, indent=3)
-                f.write(schema_json_str)
+        with open(output_file, "w") as f:
+            schema_json_str: str = json.dumps(contents, indent=3)
+            f.write(schema_json_str)
+
+    def write_to_json(self) -> None:
+        """
+        Writes Pydantic models to JSON file.
+        """
+        models = list(self.get_schemas())
+        if self.configs.split:
+            definitions, model_definitions = build_shared_definitions(models)
+            definitions_file = Path(self.configs.output) / definitions_filename(definitions)
+            self._write_json(definitions_file, {"$defs": definitions})
+        else:
+            schemas = get_json_schemas(models, processes=self.configs.processes, cache_dir=self.configs.cache_dir)
+
+        for schema in models:
+            output_file = self._get_output_file(schema)
+            if self.configs.split:
+                definitions_uri = Path(os.path.relpath(definitions_file, output_file.parent)).as_posix()
+                schema_json = thin_schema(definitions, model_definitions[schema], definitions_uri)
+            else:
+                schema_json = schemas[schema]
+            self._write_json(output_file, schema_json)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,193 @@
+"""Index of data asset lineage built from DataDescription.source_data and derived asset names"""
+
+import json
+from array import array
+from collections import deque
+from itertools import accumulate
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from aind_data_schema_models.data_name_patterns import DataLevel
+
+from aind_data_schema.core.data_description import DataDescription
+
+LINEAGE_FORMAT_VERSION = 1
+_ID_TYPECODE = "l"
+
+
+class LineageIndex:
+    """
+    Graph of data assets and the source data they were derived from
+
+    Asset names are interned to integer IDs and edges are kept in flat arrays.
+    Adjacency arrays (CSR) for both directions are built on the first query
+    after assets are added, so ancestors and descendants are found in time
+    linear in the size of the result.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty index"""
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._edge_assets = array(_ID_TYPECODE)
+        self._edge_sources = array(_ID_TYPECODE)
+        self._adjacency: Optional[Tuple[Tuple[array, array], Tuple[array, array]]] = None
+
+    def __len__(self) -> int:
+        """Number of assets, including source assets that were only referenced"""
+        return len(self._names)
+
+    def __contains__(self, name: str) -> bool:
+        """True if the asset is in the index"""
+        return name in self._ids
+
+    def _intern(self, name: str) -> int:
+        """ID of an asset name, adding it if needed"""
+        asset_id = self._ids.get(name)
+        if asset_id is None:
+            asset_id = self._ids[name] = len(self._names)
+            self._names.append(name)
+        return asset_id
+
+    def _id(self, name: str) -> int:
+        """ID of an asset that must already be in the index"""
+        try:
+            return self._ids[name]
+        except KeyError:
+            raise KeyError(f"Asset {name} is not in the lineage index") from None
+
+    def add(self, name: str, source_data: Optional[Iterable[str]] = None) -> None:
+        """
+        Add an asset and the assets it was derived from
+
+        Parameters
+        ----------
+        name : str
+            Asset name
+        source_data : Optional[Iterable[str]]
+            Names of the assets it was derived from
+        """
+        asset_id = self._intern(name)
+        for source in source_data or []:
+            self._edge_assets.append(asset_id)
+            self._edge_sources.append(self._intern(source))
+        self._adjacency = None
+
+    def add_data_descriptions(self, data_descriptions: Iterable[DataDescription]) -> None:
+        """
+        Add assets from their DataDescriptions
+
+        Derived assets without source_data are linked to the input encoded in their name.
+        """
+        for data_description in data_descriptions:
+            source_data = data_description.source_data
+            if not source_data and data_description.data_level == DataLevel.DERIVED:
+                source_data = self._inputs_from_names([data_description.name])[0]
+            self.add(data_description.name, source_data)
+
+    def add_derived_names(self, names: Iterable[str]) -> None:
+        """
+        Add assets from names alone, linking derived names to the input encoded in the name
+
+        Names that don't follow the derived pattern are added without sources.
+        """
+        names = list(names)
+        for name, sources in zip(names, self._inputs_from_names(names)):
+            self.add(name, sources)
+
+    @staticmethod
+    def _inputs_from_names(names: List[str]) -> List[Optional[List[str]]]:
+        """Source asset of each derived name, or None for names that aren't derived"""
+        inputs = DataDescription.parse_names(names, DataLevel.DERIVED, strict=False)["input"]
+        return [None if source is None else [source] for source in inputs]
+
+    @staticmethod
+    def _csr(keys: array, values: array, size: int) -> Tuple[array, array]:
+        """Offsets and values of an adjacency array, values of key k are values[offsets[k]:offsets[k + 1]]"""
+        counts = [0] * (size + 1)
+        for key in keys:
+            counts[key + 1] += 1
+        offsets = array(_ID_TYPECODE, accumulate(counts))
+        position = offsets.tolist()
+        ordered = array(_ID_TYPECODE, bytes(len(values) * offsets.itemsize))
+        for key, value in zip(keys, values):
+            ordered[position[key]] = value
+            position[key] += 1
+        return offsets, ordered
+
+    def _get_adjacency(self) -> Tuple[Tuple[array, array], Tuple[array, array]]:
+        """Source and derived adjacency arrays, built when the index has changed"""
+        if self._adjacency is None:
+            size = len(self._names)
+            self._adjacency = (
+                self._csr(self._edge_assets, self._edge_sources, size),
+                self._csr(self._edge_sources, self._edge_assets, size),
+            )
+        return self._adjacency
+
+    def _neighbors(self, asset_id: int, direction: int) -> array:
+        """Sources (direction 0) or derived assets (direction 1) of an asset"""
+        offsets, values = self._get_adjacency()[direction]
+        start, end = offsets[asset_id], offsets[asset_id + 1]
+        return values[start:end]
+
+    def _traverse(self, name: str, direction: int) -> List[str]:
+        """Breadth first search from an asset, nearest assets first"""
+        start = self._id(name)
+        seen = {start}
+        queue = deque([start])
+        found = []
+        while queue:
+            for neighbor in self._neighbors(queue.popleft(), direction):
+                if neighbor not in seen:
+                    seen.add(neighbor)
+                    queue.append(neighbor)
+                    found.append(self._names[neighbor])
+        return found
+
+    def sources(self, name: str) -> List[str]:
+        """Assets an asset was directly derived from"""
+        return list(dict.fromkeys(self._names[i] for i in self._neighbors(self._id(name), 0)))
+
+    def derived(self, name: str) -> List[str]:
+        """Assets directly derived from an asset"""
+        return list(dict.fromkeys(self._names[i] for i in self._neighbors(self._id(name), 1)))
+
+    def ancestors(self, name: str) -> List[str]:
+        """All assets an asset was derived from, directly or indirectly"""
+        return self._traverse(name, 0)
+
+    def descendants(self, name: str) -> List[str]:
+        """All assets derived from an asset, directly or indirectly, e.g. every derived asset of a raw asset"""
+        return self._traverse(name, 1)
+
+    def roots(self, name: str) -> List[str]:
+        """The original assets an asset was derived from, those without sources of their own"""
+        return [ancestor for ancestor in self.ancestors(name) if not self._neighbors(self._ids[ancestor], 0)]
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the index to a JSON file"""
+        with open(path, "w") as f:
+            json.dump(
+                {
+                    "version": LINEAGE_FORMAT_VERSION,
+                    "names": self._names,
+                    "edge_assets": self._edge_assets.tolist(),
+                    "edge_sources": self._edge_sources.tolist(),
+                },
+                f,
+            )
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "LineageIndex":
+        """Read an index written by save"""
+        with open(path, "r") as f:
+            contents = json.load(f)
+        if contents.get("version") != LINEAGE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported lineage index version {contents.get('version')}")
+        index = cls()
+        index._names = contents["names"]
+        index._ids = {name: asset_id for asset_id, name in enumerate(index._names)}
+        index._edge_assets = array(_ID_TYPECODE, contents["edge_assets"])
+        index._edge_sources = array(_ID_TYPECODE, contents["edge_sources"])
+        return index
@@ -0,0 +1,323 @@
+"""Registry of migrations that upgrade raw documents written with older schema versions"""
+
+import json
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Type, Union
+
+from aind_data_schema.base import DataCoreModel
+from aind_data_schema.core.acquisition import Acquisition
+from aind_data_schema.core.instrument import Instrument
+from aind_data_schema.core.metadata import CORE_FILE_MODELS, CORE_FILES, Metadata
+from aind_data_schema.core.procedures import Procedures
+from aind_data_schema.core.quality_control import QualityControl
+
+DEFAULT_BATCH_SIZE = 64
+
+MigrationFunction = Callable[[Dict[str, Any]], Dict[str, Any]]
+Version = Tuple[int, ...]
+
+# Outcome of upgrading a file. Versions are None for files that aren't core documents and
+# for files that failed, error is why a file couldn't be read or upgraded, otherwise None.
+UpgradeResult = NamedTuple(
+    "UpgradeResult",
+    [("path", str), ("version_before", Optional[str]), ("version_after", Optional[str]), ("error", Optional[str])],
+)
+
+
+def parse_version(version: Any) -> Version:
+    """Version string as a tuple of ints, e.g. "2.3.0" -> (2, 3, 0)"""
+    try:
+        return tuple(int(part) for part in version.split("."))
+    except (AttributeError, ValueError):
+        raise ValueError(f"Invalid schema version {version!r}") from None
+
+
+def current_version(model: Type[DataCoreModel]) -> str:
+    """Schema version of a core model in this release"""
+    return model.model_fields["schema_version"].default
+
+
+@dataclass(frozen=True)
+class Migration:
+    """
+    Upgrade of raw documents of one core model
+
+    Applies to documents with from_version <= schema_version < to_version, and
+    leaves them at to_version. Migrations change the document in place and return it.
+    """
+
+    model: Type[DataCoreModel]
+    from_version: str
+    to_version: str
+    function: MigrationFunction
+
+    def applies_to(self, version: Version) -> bool:
+        """True if a document at version needs this migration"""
+        return parse_version(self.from_version) <= version < parse_version(self.to_version)
+
+
+class MigrationRegistry:
+    """
+    Migrations for each core model, composed to bring a document up to the current version
+
+    Versions between registered migrations are assumed to be compatible, so a document
+    only runs the migrations for the versions it is older than. Crossing a major version
+    requires a registered migration.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty registry"""
+        self._migrations: Dict[Type[DataCoreModel], List[Migration]] = {}
+
+    def register(
+        self, model: Type[DataCoreModel], from_version: str, to_version: str
+    ) -> Callable[[MigrationFunction], MigrationFunction]:
+        """
+        Decorator registering a function as the migration of a model between two versions
+
+        Parameters
+        ----------
+        model : Type[DataCoreModel]
+            Core model of the documents the function upgrades
+        from_version : str
+            Oldest version the function upgrades
+        to_version : str
+            Version of the upgraded documents
+        """
+        if parse_version(from_version) >= parse_version(to_version):
+            raise ValueError(
+                f"Migration of {model.__name__} must go to a newer version, not {from_version} -> {to_version}"
+            )
+
+        def decorator(function: MigrationFunction) -> MigrationFunction:
+            """Add the migration, keeping each model's migrations in version order"""
+            migrations = self._migrations.setdefault(model, [])
+            migrations.append(Migration(model, from_version, to_version, function))
+            migrations.sort(key=lambda migration: parse_version(migration.from_version))
+            return function
+
+        return decorator
+
+    def migrations(self, model: Type[DataCoreModel]) -> List[Migration]:
+        """Registered migrations of a model in version order"""
+        return list(self._migrations.get(model, []))
+
+    def plan(self, model: Type[DataCoreModel], version: str) -> List[Migration]:
+        """
+        Migrations that bring a document from version up to the current version, in order
+
+        Raises
+        ------
+        ValueError
+            If the version is newer than the current one, or an older major version can't be upgraded
+        """
+        target = parse_version(current_version(model))
+        position = parse_version(version)
+        if position > target:
+            raise ValueError(f"{model.__name__} version {version} is newer than {current_version(model)}")
+        steps = []
+        for migration in self._migrations.get(model, []):
+            if migration.applies_to(position):
+                steps.append(migration)
+                position = parse_version(migration.to_version)
+        if position[0] != target[0]:
+            raise ValueError(f"No migration of {model.__name__} from version {version} to {current_version(model)}")
+        return steps
+
+    def upgrade(self, model: Type[DataCoreModel], document: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Upgrade a raw document of a core model to the current version
+
+        The document is changed in place and returned. Documents already at the current
+        version are returned unchanged, without running any migration.
+        """
+        version = document.get("schema_version")
+        if version == current_version(model):
+            return document
+        for migration in self.plan(model, version):
+            document = migration.function(document)
+        document["schema_version"] = current_version(model)
+        return document
+
+    def upgrade_document(self, document: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+        """
+        Upgrade a core document, detecting its model from its object_type
+
+        The core files inside a Metadata document are upgraded as well.
+
+        Returns
+        -------
+        Optional[Tuple[str, str]]
+            The versions before and after, or None if the document isn't a core document
+        """
+        model = CORE_MODELS.get(document.get("object_type")) if isinstance(document, dict) else None
+        if model is None:
+            return None
+        version = document.get("schema_version")
+        if model is Metadata:
+            for field_name in CORE_FILES:
+                core_document = document.get(field_name)
+                if isinstance(core_document, dict):
+                    self.upgrade(CORE_FILE_MODELS[field_name], core_document)
+        self.upgrade(model, document)
+        return version, document["schema_version"]
+
+
+CORE_MODELS: Dict[str, Type[DataCoreModel]] = {
+    model._object_type_from_name(): model for model in [Metadata, *CORE_FILE_MODELS.values()]
+}
+
+MIGRATIONS = MigrationRegistry()
+
+
+def _walk_objects(value: Any, object_type: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """Every nested dict, or only those with the given object_type"""
+    stack = [value]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            if object_type is None or value.get("object_type") == object_type:
+                yield value
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+
+
+@MIGRATIONS.register(QualityControl, "2.0.0", "2.3.0")
+def _quality_control_tag_dicts(document: Dict[str, Any]) -> Dict[str, Any]:
+    """QCMetric.tags changed from a list of strings to a dict, and default_grouping to a list of groups"""
+    metrics = document.get("metrics") or []
+    if metrics and isinstance(metrics[0], dict) and isinstance(metrics[0].get("tags"), list):
+        if all(isinstance(item, str) for item in document.get("default_grouping") or []):
+            document["default_grouping"] = [["modality"], ["tag_1"]]
+    for metric in metrics:
+        if isinstance(metric, dict) and isinstance(metric.get("tags"), list):
+            metric["tags"] = {f"tag_{i + 1}": tag for i, tag in enumerate(metric["tags"])}
+    return document
+
+
+@MIGRATIONS.register(Acquisition, "2.0.0", "2.5.0")
+def _acquisition_stimulus_name_typo(document: Dict[str, Any]) -> Dict[str, Any]:
+    """Auditory stimulation parameters written with the 'sitmulus_name' typo
+
+    AuditoryStimulation is a GenericModel without an object_type, so any object with the typo is fixed.
+    """
+    for stimulus in _walk_objects(document):
+        if "sitmulus_name" in stimulus and "stimulus_name" not in stimulus:
+            stimulus["stimulus_name"] = stimulus.pop("sitmulus_name")
+    return document
+
+
+@MIGRATIONS.register(Instrument, "2.0.0", "2.2.4")
+def _instrument_daq_channel_ports(document: Dict[str, Any]) -> Dict[str, Any]:
+    """DAQChannel.channel_index was replaced by DAQChannel.port"""
+    for channel in _walk_objects(document, "DAQ channel"):
+        if channel.get("channel_index") is not None and channel.get("port") is None:
+            channel["port"] = channel.pop("channel_index")
+    return document
+
+
+@MIGRATIONS.register(Procedures, "2.0.0", "2.2.0")
+def _procedures_planar_sections(document: Dict[str, Any]) -> Dict[str, Any]:
+    """Sections with coordinates became PlanarSections"""
+    for section in _walk_objects(document, "Section"):
+        has_extent = section.get("end_coordinate") is not None or section.get("thickness") is not None
+        has_start = section.get("coordinate_system_name") is not None and section.get("start_coordinate") is not None
+        if has_start and has_extent:
+            section["object_type"] = "Planar section"
+    return document
+
+
+def _write_json(path: Union[str, Path], document: Dict[str, Any]) -> None:
+    """Replace a file with a document, so readers never see it half written"""
+    temporary_path = f"{path}.upgrade"
+    with open(temporary_path, "w") as f:
+        json.dump(document, f, indent=3)
+    os.replace(temporary_path, path)
+
+
+def upgrade_file(path: Union[str, Path], registry: MigrationRegistry = MIGRATIONS) -> UpgradeResult:
+    """
+    Upgrade a core JSON file in place, files already at the current version are not written
+
+    Files that can't be read, aren't valid JSON or can't be upgraded are left as they
+    are and reported in the result, so one bad file doesn't stop an archive upgrade.
+
+    Returns
+    -------
+    UpgradeResult
+        The path, the versions before and after, and the error if the file failed
+    """
+    try:
+        with open(path, "r") as f:
+            document = json.load(f)
+        versions_before = _document_versions(document) if isinstance(document, dict) else None
+        versions = registry.upgrade_document(document)
+        if versions is None:
+            return UpgradeResult(str(path), None, None, None)
+        if _document_versions(document) != versions_before:
+            _write_json(path, document)
+    except (OSError, ValueError) as error:
+        # json.JSONDecodeError is a ValueError, as are invalid versions and missing migrations
+        return UpgradeResult(str(path), None, None, f"{type(error).__name__}: {error}")
+    return UpgradeResult(str(path), versions[0], versions[1], None)
+
+
+def _document_versions(document: Dict[str, Any]) -> List[Any]:
+    """Schema version of a document and of the core files inside it"""
+    versions = [document.get("schema_version")]
+    for field_name in CORE_FILES:
+        core_document = document.get(field_name)
+        versions.append(core_document.get("schema_version") if isinstance(core_document, dict) else None)
+    return versions
+
+
+def _upgrade_batch(paths: List[str], registry: MigrationRegistry) -> List[UpgradeResult]:
+    """Upgrade a batch of files, run in worker processes"""
+    return [upgrade_file(path, registry) for path in paths]
+
+
+def upgrade_files(
+    paths: Iterable[Union[str, Path]],
+    processes: int = 1,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    registry: MigrationRegistry = MIGRATIONS,
+) -> Iterator[UpgradeResult]:
+    """
+    Upgrade a stream of core JSON files in place, e.g. every file of an archive
+
+    Paths are read lazily and results are yielded in order as batches finish, with at
+    most two batches per process in flight, so any number of files can be upgraded.
+    Files that fail are reported in their result's error and the stream continues.
+
+    Parameters
+    ----------
+    paths : Iterable[Union[str, Path]]
+        Files to upgrade, e.g. from catalog.find_metadata_files
+    processes : int
+        Worker processes, files are upgraded in this process when 1
+    batch_size : int
+        Files sent to a worker at once
+    registry : MigrationRegistry
+        Migrations to run, its functions must be importable by the workers
+    """
+    paths = (str(path) for path in paths)
+    batches = iter(lambda: list(islice(paths, batch_size)), [])
+    if processes <= 1:
+        for batch in batches:
+            yield from _upgrade_batch(batch, registry)
+        return
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        pending = deque()
+        for batch in batches:
+            pending.append(executor.submit(_upgrade_batch, batch, registry))
+            if len(pending) >= 2 * processes:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
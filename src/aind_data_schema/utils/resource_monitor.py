@@ -0,0 +1,296 @@
+"""Background sampler that records ResourceUsage for a running process"""
+
+import logging
+import os
+import platform
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from aind_data_schema_models.system_architecture import CPUArchitecture, OperatingSystem
+from aind_data_schema_models.units import MemoryUnit, UnitlessUnit
+
+from aind_data_schema.core.processing import ResourceTimestamped, ResourceUsage
+
+logger = logging.getLogger(__name__)
+
+BYTES_PER_GB = 1024**3
+
+_ARCHITECTURES = {
+    "x86_64": CPUArchitecture.X86_64,
+    "amd64": CPUArchitecture.X86_64,
+    "i386": CPUArchitecture.X86_32,
+    "i686": CPUArchitecture.X86_32,
+    "aarch64": CPUArchitecture.ARM64,
+    "arm64": CPUArchitecture.ARM64,
+    "armv7l": CPUArchitecture.ARM,
+    "riscv64": CPUArchitecture.RISC_V,
+}
+
+
+def _read_text(path: Path) -> Optional[str]:
+    """Read a small text file, returning None if it is unavailable"""
+    try:
+        with open(path, "r") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def detect_os() -> str:
+    """Return the OperatingSystem value for this machine, or a free-text description"""
+    try:
+        release = platform.freedesktop_os_release()
+    except (AttributeError, OSError):
+        release = {}
+    name = release.get("NAME", "")
+    version = release.get("VERSION_ID", "")
+    for operating_system in OperatingSystem:
+        if operating_system.value == f"{name} {version}":
+            return operating_system.value
+    return release.get("PRETTY_NAME") or platform.platform()
+
+
+def detect_architecture() -> str:
+    """Return the CPUArchitecture value for this machine, or the raw machine name"""
+    machine = platform.machine()
+    architecture = _ARCHITECTURES.get(machine.lower())
+    return architecture.value if architecture else machine
+
+
+def detect_cpu_name(proc_root: Path = Path("/proc")) -> Optional[str]:
+    """Return the CPU model name from /proc/cpuinfo, falling back to platform.processor()"""
+    cpuinfo = _read_text(proc_root / "cpuinfo") or ""
+    for line in cpuinfo.splitlines():
+        if line.startswith("model name"):
+            return line.split(":", 1)[1].strip()
+    return platform.processor() or None
+
+
+def read_cgroup_limits(cgroup_root: Path = Path("/sys/fs/cgroup")) -> Tuple[Optional[float], Optional[int]]:
+    """Read the (cpu quota in cores, memory limit in bytes) of the current cgroup
+
+    Supports cgroup v2 (cpu.max, memory.max) and cgroup v1 (cpu.cfs_quota_us,
+    memory.limit_in_bytes). Either value is None when no limit is set.
+    """
+    cpu_limit = None
+    memory_limit = None
+
+    cpu_max = _read_text(cgroup_root / "cpu.max")
+    if cpu_max is not None:
+        quota, period = cpu_max.split()[:2]
+        if quota != "max":
+            cpu_limit = int(quota) / int(period)
+    else:
+        quota = _read_text(cgroup_root / "cpu" / "cpu.cfs_quota_us")
+        period = _read_text(cgroup_root / "cpu" / "cpu.cfs_period_us")
+        if quota is not None and period is not None and int(quota) > 0:
+            cpu_limit = int(quota) / int(period)
+
+    memory_max = _read_text(cgroup_root / "memory.max")
+    if memory_max is None:
+        memory_max = _read_text(cgroup_root / "memory" / "memory.limit_in_bytes")
+    if memory_max is not None and memory_max.strip() != "max":
+        memory_limit = int(memory_max)
+        # cgroup v1 reports "unlimited" as a huge page-aligned number
+        if memory_limit >= 2**62:
+            memory_limit = None
+
+    return cpu_limit, memory_limit
+
+
+class ResourceMonitor:
+    """Context manager that samples CPU and RAM usage of a process in a background thread
+
+    Each sample reads /proc/<pid>/stat and /proc/<pid>/statm, so a sample costs
+    tens of microseconds of CPU. ``sampler_cpu_time`` and ``overhead`` report the
+    measured cost of a run; at the default one-second interval the overhead is
+    well below 0.01% of one core.
+
+    Memory is bounded by ``max_samples``: when the buffer is full, every other
+    sample is dropped and the sampling interval doubles, so the series always
+    spans the whole run at a resolution that adapts to its length.
+
+    Example
+    -------
+    >>> with ResourceMonitor(interval=1.0) as monitor:
+    ...     run_step()
+    >>> process = DataProcess(..., resources=monitor.resource_usage)
+    """
+
+    def __init__(
+        self,
+        pid: Optional[int] = None,
+        interval: float = 1.0,
+        max_samples: int = 1000,
+        include_cgroup_limits: bool = True,
+        proc_root: Path = Path("/proc"),
+        cgroup_root: Path = Path("/sys/fs/cgroup"),
+    ) -> None:
+        """Initialize the monitor
+
+        Parameters
+        ----------
+        pid : Optional[int]
+            Process to monitor, defaults to the current process
+        interval : float
+            Initial seconds between samples
+        max_samples : int
+            Maximum number of samples kept per series, must be at least 2
+        include_cgroup_limits : bool
+            Report usage relative to cgroup CPU quota and memory limit, if set
+        proc_root : Path
+            Location of procfs
+        cgroup_root : Path
+            Location of the cgroup filesystem
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive.")
+        if max_samples < 2:
+            raise ValueError("max_samples must be at least 2.")
+
+        self.pid = pid if pid is not None else os.getpid()
+        self.interval = interval
+        self.max_samples = max_samples
+        self.proc_root = Path(proc_root)
+        self.cgroup_root = Path(cgroup_root)
+
+        self._clock_ticks = os.sysconf("SC_CLK_TCK")
+        self._page_size = os.sysconf("SC_PAGE_SIZE")
+        self.cpu_cores = os.cpu_count() or 1
+        self.system_memory = self._read_mem_total()
+
+        cpu_limit, memory_limit = read_cgroup_limits(self.cgroup_root) if include_cgroup_limits else (None, None)
+        self.cpu_capacity = min(cpu_limit, self.cpu_cores) if cpu_limit else float(self.cpu_cores)
+        self.memory_limit = memory_limit
+        memory_candidates = [m for m in (self.system_memory, memory_limit) if m]
+        self.memory_capacity = min(memory_candidates) if memory_candidates else None
+
+        self.timestamps: List[datetime] = []
+        self.cpu_samples: List[float] = []
+        self.ram_samples: List[float] = []
+        self.sampler_cpu_time = 0.0
+        self._stride = 1
+        self._last_cpu: Optional[Tuple[float, float]] = None
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._start_time: Optional[float] = None
+        self._end_time: Optional[float] = None
+
+    def _read_mem_total(self) -> Optional[int]:
+        """Total system memory in bytes from /proc/meminfo"""
+        meminfo = _read_text(self.proc_root / "meminfo") or ""
+        for line in meminfo.splitlines():
+            if line.startswith("MemTotal:"):
+                return int(line.split()[1]) * 1024
+        return None
+
+    def _read_cpu_seconds(self) -> Optional[float]:
+        """User + system CPU seconds consumed by the process"""
+        stat = _read_text(self.proc_root / str(self.pid) / "stat")
+        if stat is None:
+            return None
+        # The command name may contain spaces, so split after its closing parenthesis
+        fields = stat.rsplit(")", 1)[1].split()
+        return (int(fields[11]) + int(fields[12])) / self._clock_ticks
+
+    def _read_rss(self) -> Optional[int]:
+        """Resident set size of the process in bytes"""
+        statm = _read_text(self.proc_root / str(self.pid) / "statm")
+        if statm is None:
+            return None
+        return int(statm.split()[1]) * self._page_size
+
+    def sample(self) -> None:
+        """Record one CPU and RAM sample"""
+        thread_start = time.thread_time()
+        now = time.monotonic()
+        cpu_seconds = self._read_cpu_seconds()
+        rss = self._read_rss()
+
+        if cpu_seconds is not None and rss is not None:
+            if self._last_cpu is not None:
+                last_now, last_cpu_seconds = self._last_cpu
+                elapsed = now - last_now
+                cpu_percent = 100 * (cpu_seconds - last_cpu_seconds) / (elapsed * self.cpu_capacity) if elapsed else 0.0
+                ram_percent = 100 * rss / self.memory_capacity if self.memory_capacity else 0.0
+                self.timestamps.append(datetime.now().astimezone())
+                self.cpu_samples.append(cpu_percent)
+                self.ram_samples.append(ram_percent)
+                if len(self.timestamps) >= self.max_samples:
+                    self._downsample()
+            self._last_cpu = (now, cpu_seconds)
+
+        self.sampler_cpu_time += time.thread_time() - thread_start
+
+    def _downsample(self) -> None:
+        """Drop every other sample and halve the sampling rate"""
+        del self.timestamps[1::2]
+        del self.cpu_samples[1::2]
+        del self.ram_samples[1::2]
+        self._stride *= 2
+
+    def _run(self) -> None:
+        """Sampling loop executed in the background thread"""
+        while not self._stop_event.wait(self.interval * self._stride):
+            self.sample()
+
+    def start(self) -> "ResourceMonitor":
+        """Start sampling in a background thread"""
+        if self._read_cpu_seconds() is None:
+            logger.warning(f"Cannot read {self.proc_root / str(self.pid)}, resource usage will not be sampled.")
+        self._start_time = time.monotonic()
+        self._end_time = None
+        self.sample()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="ResourceMonitor", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> ResourceUsage:
+        """Stop sampling, record a final sample and return the ResourceUsage"""
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
+            self.sample()
+            self._end_time = time.monotonic()
+        return self.resource_usage
+
+    def __enter__(self) -> "ResourceMonitor":
+        """Start sampling"""
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Stop sampling"""
+        self.stop()
+
+    @property
+    def overhead(self) -> float:
+        """Fraction of one core spent sampling over the monitored wall time"""
+        if self._start_time is None:
+            return 0.0
+        end_time = self._end_time if self._end_time is not None else time.monotonic()
+        elapsed = end_time - self._start_time
+        return self.sampler_cpu_time / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def resource_usage(self) -> ResourceUsage:
+        """ResourceUsage for the samples collected so far"""
+        cpu_usage = [ResourceTimestamped(timestamp=t, usage=u) for t, u in zip(self.timestamps, self.cpu_samples)]
+        ram_usage = [ResourceTimestamped(timestamp=t, usage=u) for t, u in zip(self.timestamps, self.ram_samples)]
+        return ResourceUsage(
+            os=detect_os(),
+            architecture=detect_architecture(),
+            cpu=detect_cpu_name(self.proc_root),
+            cpu_cores=self.cpu_cores,
+            system_memory=self.system_memory / BYTES_PER_GB if self.system_memory else None,
+            system_memory_unit=MemoryUnit.GB,
+            ram=self.memory_limit / BYTES_PER_GB if self.memory_limit else None,
+            ram_unit=MemoryUnit.GB,
+            cpu_usage=cpu_usage or None,
+            ram_usage=ram_usage or None,
+            usage_unit=UnitlessUnit.PERCENT,
+        )
@@ -0,0 +1,101 @@
+"""Registry of validation rules that apply to some modalities or core files only"""
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Tuple, Union
+
+from aind_data_schema_models.modalities import Modality
+
+# Key of a compiled plan: (modality abbreviations, core files present)
+PlanKey = Tuple[FrozenSet[str], FrozenSet[str]]
+
+
+def _abbreviation(modality: Union[Modality.ONE_OF, str]) -> str:
+    """Abbreviation of a modality, given as a Modality or its abbreviation"""
+    return modality if isinstance(modality, str) else modality.abbreviation
+
+
+@dataclass(frozen=True)
+class Rule:
+    """
+    A validation rule and the assets it applies to
+
+    A rule applies if any of its modalities is present, or to every asset if it lists
+    none, and only if all of its core files are present.
+    """
+
+    function: Callable[[Any], None]
+    modalities: FrozenSet[str]
+    core_files: FrozenSet[str]
+
+    def applies_to(self, modalities: FrozenSet[str], core_files: FrozenSet[str]) -> bool:
+        """True if the rule applies to an asset with these modalities and core files"""
+        if self.modalities and not self.modalities & modalities:
+            return False
+        return self.core_files <= core_files
+
+
+class RuleRegistry:
+    """
+    Rules dispatched by modality and core files
+
+    The rules that apply to a combination of modalities and core files are worked out
+    once and kept, so rules for other modalities add no cost to an asset.
+    """
+
+    def __init__(self) -> None:
+        """Start without rules"""
+        self._rules: List[Rule] = []
+        self._plans: Dict[PlanKey, Tuple[Rule, ...]] = {}
+        self._lock = threading.Lock()
+
+    def register(
+        self,
+        modalities: Iterable[Union[Modality.ONE_OF, str]] = (),
+        core_files: Iterable[str] = (),
+    ) -> Callable[[Callable[[Any], None]], Callable[[Any], None]]:
+        """
+        Decorator registering a rule, which raises ValueError if the asset is invalid
+
+        Parameters
+        ----------
+        modalities : Iterable[Union[Modality.ONE_OF, str]]
+            Modalities, or their abbreviations, the rule applies to. Empty for all assets.
+        core_files : Iterable[str]
+            Core files that must be present for the rule to apply
+        """
+        rule_modalities = frozenset(_abbreviation(modality) for modality in modalities)
+        rule_core_files = frozenset(core_files)
+
+        def decorate(function: Callable[[Any], None]) -> Callable[[Any], None]:
+            """Register the function"""
+            with self._lock:
+                self._rules.append(Rule(function, rule_modalities, rule_core_files))
+                self._plans.clear()
+            return function
+
+        return decorate
+
+    @property
+    def rules(self) -> List[Rule]:
+        """Registered rules, in registration order"""
+        return list(self._rules)
+
+    def plan(
+        self, modalities: Iterable[Union[Modality.ONE_OF, str, None]], core_files: Iterable[str]
+    ) -> Tuple[Rule, ...]:
+        """Rules that apply to an asset with these modalities and core files, in registration order"""
+        key = (frozenset(_abbreviation(m) for m in modalities if m is not None), frozenset(core_files))
+        plan = self._plans.get(key)
+        if plan is None:
+            with self._lock:
+                plan = tuple(rule for rule in self._rules if rule.applies_to(*key))
+                self._plans[key] = plan
+        return plan
+
+    def run(
+        self, target: Any, modalities: Iterable[Union[Modality.ONE_OF, str, None]], core_files: Iterable[str]
+    ) -> None:
+        """Run the rules that apply to the target, the first invalid rule raises"""
+        for rule in self.plan(modalities, core_files):
+            rule.function(target)
@@ -0,0 +1,139 @@
+"""Split the core model schemas into a shared definitions file and thin per-model schemas, and bundle them back"""
+
+import json
+from copy import deepcopy
+from pathlib import Path
+from typing import Any, Dict, Sequence, Set, Tuple, Type, Union
+
+from pydantic.json_schema import models_json_schema
+
+from aind_data_schema.base import DataCoreModel
+from aind_data_schema.utils.schema_diff import DEFS_PREFIX, canonical_hash, find_references
+
+DEFINITIONS_FILE_PREFIX = "definitions_"
+DEFINITIONS_HASH_LENGTH = 12
+
+
+def build_shared_definitions(
+    models: Sequence[Type[DataCoreModel]],
+) -> Tuple[Dict[str, Any], Dict[Type[DataCoreModel], str]]:
+    """
+    Generate one set of $defs for all models
+
+    Definition names are unique across all models, so a definition that is
+    used by several models appears once.
+
+    Parameters
+    ----------
+    models : Sequence[Type[DataCoreModel]]
+        Models to generate definitions for
+
+    Returns
+    -------
+    Tuple[Dict[str, Any], Dict[Type[DataCoreModel], str]]
+        The shared definitions, and the name of each model's own definition
+    """
+    for model in models:
+        model.model_rebuild()
+    json_schemas_map, json_schema = models_json_schema([(model, "validation") for model in models])
+    model_definitions = {
+        model: json_schemas_map[(model, "validation")]["$ref"].replace(DEFS_PREFIX, "", 1) for model in models
+    }
+    return json_schema["$defs"], model_definitions
+
+
+def definitions_filename(definitions: Dict[str, Any]) -> str:
+    """File name for a set of definitions, including a hash of their content for caching"""
+    return f"{DEFINITIONS_FILE_PREFIX}{canonical_hash(definitions)[:DEFINITIONS_HASH_LENGTH]}.json"
+
+
+def _rewrite_refs(value: Any, old_prefix: str, new_prefix: str) -> Any:
+    """Replace the prefix of every $ref that starts with old_prefix, in place"""
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if key == "$ref" and isinstance(item, str) and item.startswith(old_prefix):
+                value[key] = new_prefix + item.replace(old_prefix, "", 1)
+            else:
+                _rewrite_refs(item, old_prefix, new_prefix)
+    elif isinstance(value, list):
+        for item in value:
+            _rewrite_refs(item, old_prefix, new_prefix)
+    return value
+
+
+def thin_schema(definitions: Dict[str, Any], name: str, definitions_uri: str) -> Dict[str, Any]:
+    """
+    Schema for one model that references the shared definitions instead of inlining them
+
+    Parameters
+    ----------
+    definitions : Dict[str, Any]
+        Shared definitions from build_shared_definitions
+    name : str
+        Name of the model's definition
+    definitions_uri : str
+        Location of the definitions file relative to the thin schema, e.g. definitions_0123456789ab.json
+    """
+    return _rewrite_refs(deepcopy(definitions[name]), DEFS_PREFIX, f"{definitions_uri}{DEFS_PREFIX}")
+
+
+def _external_refs(value: Any, found: Set[str]) -> Set[str]:
+    """Collect every $ref that points into another file"""
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if key == "$ref" and isinstance(item, str) and not item.startswith("#") and DEFS_PREFIX in item:
+                found.add(item)
+            elif key != "examples":
+                _external_refs(item, found)
+    elif isinstance(value, list):
+        for item in value:
+            _external_refs(item, found)
+    return found
+
+
+def bundle_schema(schema: Dict[str, Any], definitions: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Re-inline the shared definitions used by a thin schema
+
+    Parameters
+    ----------
+    schema : Dict[str, Any]
+        Thin schema from thin_schema
+    definitions : Dict[str, Any]
+        The shared definitions it references
+
+    Returns
+    -------
+    Dict[str, Any]
+        A self-contained schema with the definitions it uses under $defs
+    """
+    bundled = deepcopy(schema)
+    pending = []
+    for ref in _external_refs(bundled, set()):
+        uri, name = ref.split(DEFS_PREFIX, 1)
+        _rewrite_refs(bundled, f"{uri}{DEFS_PREFIX}", DEFS_PREFIX)
+        pending.append(name)
+
+    used = set()
+    while pending:
+        name = pending.pop()
+        if name not in used:
+            used.add(name)
+            pending.extend(find_references(definitions[name], set()))
+
+    if not used:
+        return bundled
+    return {"$defs": {name: deepcopy(definitions[name]) for name in sorted(used)}, **bundled}
+
+
+def load_bundled_schema(path: Union[str, Path]) -> Dict[str, Any]:
+    """Read a thin schema and the definitions files it references, and bundle them into one schema"""
+    path = Path(path)
+    with open(path, "r") as f:
+        schema = json.load(f)
+
+    definitions = {}
+    for uri in sorted({ref.split("#", 1)[0] for ref in _external_refs(schema, set())}):
+        with open(path.parent / uri, "r") as f:
+            definitions.update(json.load(f)["$defs"])
+    return bundle_schema(schema, definitions)
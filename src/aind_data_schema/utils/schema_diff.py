@@ -0,0 +1,238 @@
+"""Structural diff of the JSON schemas generated from the core models"""
+
+import hashlib
+import json
+from collections import defaultdict
+from enum import Enum
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from pydantic import BaseModel, Field
+
+ROOT_DEFINITION = "#"
+DEFS_PREFIX = "#/$defs/"
+
+# Keywords that document a schema without changing what it accepts
+ANNOTATION_KEYWORDS = {"title", "description", "examples", "default", "deprecated"}
+# Keywords that a definition uses to describe its fields, compared field by field
+FIELD_KEYWORDS = {"properties", "required"}
+
+
+class ChangeType(str, Enum):
+    """Kind of change found in a definition"""
+
+    DEFINITION_ADDED = "definition added"
+    DEFINITION_REMOVED = "definition removed"
+    FIELD_ADDED = "field added"
+    FIELD_REMOVED = "field removed"
+    TYPE_NARROWED = "type narrowed"
+    TYPE_WIDENED = "type widened"
+    TYPE_CHANGED = "type changed"
+    DEFAULT_CHANGED = "default changed"
+    REQUIRED_CHANGED = "required changed"
+    OTHER = "other"
+
+
+class SchemaChange(BaseModel):
+    """A single change to a definition, or to one of its fields"""
+
+    definition: str = Field(..., title="Definition name")
+    change_type: ChangeType = Field(..., title="Change type")
+    field: Optional[str] = Field(default=None, title="Field name")
+
+
+class SchemaDiff(BaseModel):
+    """Changes between two versions of a schema"""
+
+    changes: List[SchemaChange] = Field(default=[], title="Changes")
+    dependents: Dict[str, List[str]] = Field(
+        default={},
+        title="Dependents",
+        description="Definitions, including the root schema, that transitively reference each changed definition",
+    )
+
+    @property
+    def has_changes(self) -> bool:
+        """True if the schemas differ"""
+        return bool(self.changes)
+
+    @property
+    def changed_definitions(self) -> List[str]:
+        """Names of the definitions that changed, in the order they were found"""
+        return list(dict.fromkeys(change.definition for change in self.changes))
+
+
+def canonical_hash(value: Any) -> str:
+    """Hash of a JSON value that does not depend on the order of object keys"""
+    return hashlib.sha256(json.dumps(value, sort_keys=True, separators=(",", ":")).encode()).hexdigest()
+
+
+def _root_name(schema: dict) -> str:
+    """Name used for the top-level schema, its title unless that is also a definition"""
+    title = schema.get("title")
+    if isinstance(title, str) and title not in schema.get("$defs", {}):
+        return title
+    return ROOT_DEFINITION
+
+
+def _definitions(schema: dict, root_name: str) -> Dict[str, Any]:
+    """Split a schema into its top-level schema and its $defs, by name"""
+    definitions = {root_name: {key: value for key, value in schema.items() if key != "$defs"}}
+    definitions.update(schema.get("$defs", {}))
+    return definitions
+
+
+def find_references(value: Any, found: Set[str]) -> Set[str]:
+    """Collect the names of the definitions referenced anywhere in a JSON value"""
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if key == "$ref" and isinstance(item, str) and item.startswith(DEFS_PREFIX):
+                found.add(item.replace(DEFS_PREFIX, "", 1))
+            elif key != "examples":
+                find_references(item, found)
+    elif isinstance(value, list):
+        for item in value:
+            find_references(item, found)
+    return found
+
+
+def find_dependents(definitions: Iterable[Dict[str, Any]], names: Iterable[str]) -> Dict[str, List[str]]:
+    """Map each name to the definitions that reference it directly or transitively"""
+    referenced_by = defaultdict(set)
+    for group in definitions:
+        for name, definition in group.items():
+            for reference in find_references(definition, set()):
+                referenced_by[reference].add(name)
+
+    dependents = {}
+    for name in names:
+        visited = set()
+        pending = [name]
+        while pending:
+            for parent in referenced_by[pending.pop()]:
+                if parent not in visited:
+                    visited.add(parent)
+                    pending.append(parent)
+        visited.discard(name)
+        dependents[name] = sorted(visited)
+    return dependents
+
+
+def _alternatives(schema: Any) -> Set[str]:
+    """Hashes of the alternatives a schema accepts, ignoring annotations and field lists
+
+    Unions, enums and lists of types are expanded so that a change can be classified as
+    narrowing (fewer alternatives) or widening (more alternatives).
+    """
+    if not isinstance(schema, dict):
+        return {canonical_hash(schema)}
+    schema = {key: value for key, value in schema.items() if key not in ANNOTATION_KEYWORDS | FIELD_KEYWORDS}
+    for union_keyword in ("anyOf", "oneOf"):
+        if union_keyword in schema and len(schema) == 1:
+            return set().union(*(_alternatives(member) for member in schema[union_keyword]))
+    if set(schema) == {"enum"} or set(schema) == {"enum", "type"}:
+        return {canonical_hash({"const": value}) for value in schema["enum"]}
+    if set(schema) == {"type"} and isinstance(schema["type"], list):
+        return {canonical_hash({"type": value}) for value in schema["type"]}
+    if set(schema) == {"type", "items"} and schema["type"] == "array":
+        return {f"array:{alternative}" for alternative in _alternatives(schema["items"])}
+    return {canonical_hash(schema)}
+
+
+def _type_change(old: Any, new: Any) -> Optional[ChangeType]:
+    """Classify how the accepted values changed, or None if they did not"""
+    old_alternatives = _alternatives(old)
+    new_alternatives = _alternatives(new)
+    if old_alternatives == new_alternatives:
+        return None
+    if new_alternatives < old_alternatives:
+        return ChangeType.TYPE_NARROWED
+    if new_alternatives > old_alternatives:
+        return ChangeType.TYPE_WIDENED
+    return ChangeType.TYPE_CHANGED
+
+
+def _default_hash(schema: Any) -> Optional[str]:
+    """Hash of a schema's default value, or None if it has no default"""
+    if isinstance(schema, dict) and "default" in schema:
+        return canonical_hash(schema["default"])
+    return None
+
+
+def _classify(name: str, old: Any, new: Any, field: Optional[str] = None) -> List[SchemaChange]:
+    """Changes between two versions of a definition, or of one field when field is given"""
+    changes = []
+    type_change = _type_change(old, new)
+    if type_change:
+        changes.append(SchemaChange(definition=name, change_type=type_change, field=field))
+    if _default_hash(old) != _default_hash(new):
+        changes.append(SchemaChange(definition=name, change_type=ChangeType.DEFAULT_CHANGED, field=field))
+
+    if field is None and isinstance(old, dict) and isinstance(new, dict):
+        changes.extend(_classify_fields(name, old, new))
+
+    if not changes:
+        changes.append(SchemaChange(definition=name, change_type=ChangeType.OTHER, field=field))
+    return changes
+
+
+def _classify_fields(name: str, old: dict, new: dict) -> List[SchemaChange]:
+    """Changes to the properties of an object definition"""
+    changes = []
+    old_fields = old.get("properties", {})
+    new_fields = new.get("properties", {})
+    for field in new_fields:
+        if field not in old_fields:
+            changes.append(SchemaChange(definition=name, change_type=ChangeType.FIELD_ADDED, field=field))
+        elif canonical_hash(old_fields[field]) != canonical_hash(new_fields[field]):
+            changes.extend(_classify(name, old_fields[field], new_fields[field], field=field))
+    for field in old_fields:
+        if field not in new_fields:
+            changes.append(SchemaChange(definition=name, change_type=ChangeType.FIELD_REMOVED, field=field))
+
+    old_required = set(old.get("required", []))
+    new_required = set(new.get("required", []))
+    for field in sorted(old_required ^ new_required):
+        if field in old_fields and field in new_fields:
+            changes.append(SchemaChange(definition=name, change_type=ChangeType.REQUIRED_CHANGED, field=field))
+    return changes
+
+
+def diff_schemas(old: dict, new: dict) -> SchemaDiff:
+    """
+    Compare two versions of a JSON schema generated by model_json_schema()
+
+    Each $defs entry, and the top-level schema, is reduced to a canonical hash and only
+    the entries whose hashes differ are compared field by field.
+
+    Parameters
+    ----------
+    old : dict
+        Previous schema, e.g. loaded from the schemas folder
+    new : dict
+        Current schema
+
+    Returns
+    -------
+    SchemaDiff
+        Classified changes and the definitions that depend on each changed definition
+    """
+    if old == new:
+        return SchemaDiff()
+
+    root_name = _root_name(new)
+    old_definitions = _definitions(old, root_name)
+    new_definitions = _definitions(new, root_name)
+
+    changes = []
+    for name, definition in new_definitions.items():
+        if name not in old_definitions:
+            changes.append(SchemaChange(definition=name, change_type=ChangeType.DEFINITION_ADDED))
+        elif canonical_hash(old_definitions[name]) != canonical_hash(definition):
+            changes.extend(_classify(name, old_definitions[name], definition))
+    for name in old_definitions:
+        if name not in new_definitions:
+            changes.append(SchemaChange(definition=name, change_type=ChangeType.DEFINITION_REMOVED))
+
+    changed_names = list(dict.fromkeys(change.definition for change in changes))
+    dependents = find_dependents([old_definitions, new_definitions], changed_names)
+    return SchemaDiff(changes=changes, dependents=dependents)
@@ -1,15 +1,18 @@
 """Module to handle the schema_versions"""
 
 import json
+import logging
 import os
 from pathlib import Path
 from typing import Dict, List
 
-import dictdiffer
 import semver
 
 from aind_data_schema.base import DataCoreModel
-from aind_data_schema.utils.json_writer import SchemaWriter
+from aind_data_schema.utils.json_writer import SchemaWriter, get_json_schemas
+from aind_data_schema.utils.schema_diff import SchemaDiff, diff_schemas
+
+logger = logging.getLogger(__name__)
 
 CURRENT_DIR = Path(os.path.dirname(os.path.realpath(__file__)))
 ROOT_DIR = CURRENT_DIR.parents[2]
@@ -33,6 +36,7 @@ class SchemaVersionHandler:
         """
         self.commit_message = commit_message
         self.json_schemas_location = json_schemas_location
+        self.schema_diffs: Dict[DataCoreModel, SchemaDiff] = {}
 
     def _get_schema_json(self, model: DataCoreModel) -> dict:
         """
@@ -68,17 +72,35 @@ class SchemaVersionHandler:
           A list of DataCoreModels that changed.
         """
         schemas_that_need_updating = []
-        for core_model in SchemaWriter.get_schemas():
-            core_model_json = core_model.model_json_schema()
+        for core_model, core_model_json in get_json_schemas(list(SchemaWriter.get_schemas())).items():
             original_schema = self._get_schema_json(core_model)
 
-            diff_list = list(dictdiffer.diff(original_schema, core_model_json))
+            schema_diff = diff_schemas(original_schema, core_model_json)
 
-            if len(diff_list) > 0:
+            if schema_diff.has_changes:
+                self.schema_diffs[core_model] = schema_diff
                 schemas_that_need_updating.append(core_model)
+                for change in schema_diff.changes:
+                    location = f"{change.definition}.{change.field}" if change.field else change.definition
+                    logger.info(f"{core_model.__name__}: {change.change_type.value} in {location}")
 
         return schemas_that_need_updating
 
+    def get_models_affected_by_definition(self) -> Dict[str, List[DataCoreModel]]:
+        """
+        Map each changed definition to the core models that transitively depend on it.
+        Uses the diffs collected by _get_list_of_models_that_changed.
+        Returns
+        -------
+        Dict[str, List[DataCoreModel]]
+          Changed definition names and the core models whose schemas include them.
+        """
+        affected_models = {}
+        for core_model, schema_diff in self.schema_diffs.items():
+            for definition in schema_diff.changed_definitions:
+                affected_models.setdefault(definition, []).append(core_model)
+        return affected_models
+
     def _get_incremented_versions_map(self, models_that_changed: List[DataCoreModel]) -> Dict[DataCoreModel, str]:
         """
 
@@ -0,0 +1,203 @@
+"""NumPy engine for the affine transforms defined in components.coordinates"""
+
+import math
+from functools import lru_cache
+from typing import Any, Optional, Sequence, Tuple
+
+from aind_data_schema_models.units import SizeUnit
+
+from aind_data_schema.utils.coordinate_conversion import size_unit_scale
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    raise ImportError(
+        "Please run `pip install aind-data-schema[transforms]` to install necessary dependencies for transforms"
+    )
+
+MATRIX_CACHE_SIZE = 1024
+
+
+def _freeze(matrix: np.ndarray) -> np.ndarray:
+    """Mark a cached matrix read-only so that callers cannot modify the shared copy"""
+    matrix.setflags(write=False)
+    return matrix
+
+
+@lru_cache(maxsize=MATRIX_CACHE_SIZE)
+def scale_matrix(scale: Tuple[float, ...]) -> np.ndarray:
+    """Homogeneous (N+1)x(N+1) scale matrix"""
+    return _freeze(np.diag(np.array(scale + (1.0,), dtype=float)))
+
+
+@lru_cache(maxsize=MATRIX_CACHE_SIZE)
+def translation_matrix(translation: Tuple[float, ...]) -> np.ndarray:
+    """Homogeneous (N+1)x(N+1) translation matrix"""
+    matrix = np.eye(len(translation) + 1)
+    matrix[:-1, -1] = translation
+    return _freeze(matrix)
+
+
+@lru_cache(maxsize=MATRIX_CACHE_SIZE)
+def euler_rotation_matrix(angles: Tuple[float, ...]) -> np.ndarray:
+    """3x3 rotation matrix for extrinsic Euler angles in radians, applied in X/Y/Z order
+
+    Equivalent to ``scipy.spatial.transform.Rotation.from_euler("xyz"[:len(angles)], angles)``,
+    i.e. Rz @ Ry @ Rx. Missing trailing angles are treated as zero.
+    """
+    if not 1 <= len(angles) <= 3:
+        raise ValueError(f"Rotations require between one and three angles, got {len(angles)}")
+
+    x, y, z = tuple(angles) + (0.0,) * (3 - len(angles))
+    cx, sx = math.cos(x), math.sin(x)
+    cy, sy = math.cos(y), math.sin(y)
+    cz, sz = math.cos(z), math.sin(z)
+
+    return _freeze(
+        np.array(
+            [
+                [cy * cz, sx * sy * cz - cx * sz, cx * sy * cz + sx * sz],
+                [cy * sz, sx * sy * sz + cx * cz, cx * sy * sz - sx * cz],
+                [-sy, sx * cy, cx * cy],
+            ]
+        )
+    )
+
+
+@lru_cache(maxsize=MATRIX_CACHE_SIZE)
+def rotation_matrix(angles: Tuple[float, ...]) -> np.ndarray:
+    """Homogeneous 4x4 rotation matrix for three extrinsic X/Y/Z Euler angles in radians"""
+    if len(angles) != 3:
+        raise ValueError(f"Homogeneous rotation matrices require three angles, got {len(angles)}")
+    matrix = np.eye(4)
+    matrix[:3, :3] = euler_rotation_matrix(angles)
+    return _freeze(matrix)
+
+
+@lru_cache(maxsize=MATRIX_CACHE_SIZE)
+def affine_matrix(affine_transform: Tuple[Tuple[float, ...], ...]) -> np.ndarray:
+    """Affine matrix as an ndarray"""
+    return _freeze(np.array(affine_transform, dtype=float))
+
+
+def compose_matrices(matrices: Sequence[np.ndarray]) -> np.ndarray:
+    """Multiply a chain of matrices left to right in a single call
+
+    Raises a ValueError if the matrices do not all have the same shape.
+    """
+    if not matrices:
+        raise ValueError("Cannot compose an empty list of transforms")
+
+    shape = matrices[0].shape
+    if not all(matrix.shape == shape for matrix in matrices):
+        raise ValueError("All transforms must be the same size")
+
+    if len(matrices) == 1:
+        return np.array(matrices[0])
+    return np.linalg.multi_dot(matrices)
+
+
+def transforms_to_matrix(transforms: Sequence[Any]) -> np.ndarray:
+    """Compose a TRANSFORM_TYPES chain into a single affine matrix
+
+    The chain follows ``Affine.compose``: for ``[T0, T1, ..., Tn]`` the matrix
+    is ``T0 @ T1 @ ... @ Tn``, so the last transform in the list acts on points first.
+    """
+    for transform in transforms:
+        if not hasattr(transform, "to_numpy"):
+            raise ValueError(f"Cannot apply {type(transform).__name__}, only affine transforms are supported")
+    return compose_matrices([transform.to_numpy() for transform in transforms])
+
+
+def _as_points(points: Any, dimensions: int) -> np.ndarray:
+    """Return points as a float N x D array, checking the dimensions against the transform"""
+    points = np.asarray(points, dtype=float)
+    if points.ndim not in (1, 2) or points.shape[-1] != dimensions:
+        raise ValueError(f"Expected points with {dimensions} columns, got an array of shape {points.shape}")
+    return points
+
+
+def _split_affine(matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Split a (D+1)x(D+1) or Dx(D+1) affine matrix into its linear part and offset"""
+    dimensions = matrix.shape[1] - 1
+    if matrix.shape[0] not in (dimensions, dimensions + 1):
+        raise ValueError(f"Transform matrix of shape {matrix.shape} is not an affine transform")
+    return matrix[:dimensions, :dimensions], matrix[:dimensions, dimensions]
+
+
+def apply_transforms(transforms: Sequence[Any], points: Any) -> np.ndarray:
+    """Map points through a chain of transforms
+
+    Parameters
+    ----------
+    transforms : Sequence[Translation | Rotation | Scale | Affine]
+        Transform chain, e.g. ``DevicePosition.transform``, composed as in ``Affine.compose``
+    points : array-like
+        A single point of length D or an N x D array of points
+
+    Returns
+    -------
+    np.ndarray
+        Transformed points, with the same shape as the input
+    """
+    linear, offset = _split_affine(transforms_to_matrix(transforms))
+    points = _as_points(points, len(offset))
+    return points @ linear.T + offset
+
+
+def apply_inverse_transforms(transforms: Sequence[Any], points: Any) -> np.ndarray:
+    """Map points backwards through a chain of transforms, undoing ``apply_transforms``
+
+    Parameters
+    ----------
+    transforms : Sequence[Translation | Rotation | Scale | Affine]
+        Transform chain, composed as in ``Affine.compose``
+    points : array-like
+        A single point of length D or an N x D array of points
+
+    Returns
+    -------
+    np.ndarray
+        Points in the source coordinate system, with the same shape as the input
+    """
+    linear, offset = _split_affine(transforms_to_matrix(transforms))
+    points = _as_points(points, len(offset))
+    return (points - offset) @ np.linalg.inv(linear).T
+
+
+def atlas_shape(atlas: Any) -> np.ndarray:
+    """Size of an Atlas in voxels along each axis"""
+    size = np.asarray(atlas.size, dtype=float)
+    if atlas.size_unit == SizeUnit.PX:
+        return size
+    return size * size_unit_scale(atlas.size_unit, atlas.resolution_unit) / np.asarray(atlas.resolution, dtype=float)
+
+
+def points_to_atlas_indices(
+    atlas: Any, points: Any, transforms: Optional[Sequence[Any]] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Map points into voxel indices of an Atlas, e.g. ``AtlasLibrary.CCFv3_10um``
+
+    Parameters
+    ----------
+    atlas : Atlas
+        Target atlas, points are in its axis order and axis_unit
+    points : array-like
+        A single point of length D or an N x D array of points
+    transforms : Optional[Sequence[Translation | Rotation | Scale | Affine]]
+        Optional chain applied first, mapping points into the atlas coordinate system
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Integer voxel indices (voxel i spans [i, i + 1) * resolution) and a boolean
+        mask of the points that fall inside the atlas volume
+    """
+    if transforms:
+        points = apply_transforms(transforms, points)
+    points = _as_points(points, len(atlas.axes))
+
+    voxel_size = np.asarray(atlas.resolution, dtype=float) * size_unit_scale(atlas.resolution_unit, atlas.axis_unit)
+    indices = np.floor(points / voxel_size).astype(np.int64)
+    in_bounds = np.all((indices >= 0) & (indices < atlas_shape(atlas)), axis=-1)
+    return indices, in_bounds
@@ -0,0 +1,339 @@
+"""Build models from already validated documents without running validation"""
+
+import json
+import logging
+import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from pathlib import Path
+from types import UnionType
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import AwareDatetime, BaseModel, NaiveDatetime, TypeAdapter, ValidationError
+from pydantic.fields import FieldInfo
+
+logger = logging.getLogger(__name__)
+
+Builder = Callable[[Any], Any]
+ModelType = TypeVar("ModelType", bound=BaseModel)
+
+_IDENTITY_TYPES = (Any, str, int, float, bool, type(None))
+_ISO_PARSERS: Dict[Any, Callable[[str], Any]] = {
+    datetime: datetime.fromisoformat,
+    AwareDatetime: datetime.fromisoformat,
+    NaiveDatetime: datetime.fromisoformat,
+    date: date.fromisoformat,
+    time: time.fromisoformat,
+}
+_MODEL_BUILDERS: Dict[type, Builder] = {}
+_MODEL_BUILDERS_LOCK = threading.RLock()
+_construct = BaseModel.model_construct.__func__
+
+
+def _identity(value: Any) -> Any:
+    """Values that are stored as they are read"""
+    return value
+
+
+def _adapter_builder(annotation: Any) -> Builder:
+    """Validate values of a type without a fast path, the adapter is built on first use"""
+    adapters = []
+
+    def build(value: Any) -> Any:
+        """Validate the value"""
+        if not adapters:
+            adapters.append(TypeAdapter(annotation))
+        return adapters[0].validate_python(value)
+
+    return build
+
+
+def _iso_builder(annotation: Any) -> Builder:
+    """Parse ISO strings, other inputs are validated"""
+    parse = _ISO_PARSERS[annotation]
+    fallback = _adapter_builder(annotation)
+
+    def build(value: Any) -> Any:
+        """Parse the value"""
+        if isinstance(value, str):
+            try:
+                return parse(value)
+            except ValueError:
+                pass
+        return fallback(value)
+
+    return build
+
+
+def _literal_builder(values: Tuple[Any, ...], enum_values: bool) -> Builder:
+    """Literals are stored as read, except enum members of models that don't store enum values"""
+    members = {value.value: value for value in values if isinstance(value, Enum)}
+    if enum_values or not members:
+        return _identity
+    return lambda value: members.get(value, value) if isinstance(value, (str, int)) else value
+
+
+def _decimal(value: Any) -> Decimal:
+    """Decimal from a JSON number or string, through str like pydantic does for floats"""
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
+
+def _container_builder(origin: Any, args: Tuple[Any, ...], enum_values: bool) -> Optional[Builder]:
+    """Builder for lists, tuples, sets and dicts, or None for other types"""
+    if origin in (list, set, frozenset):
+        item = _builder(args[0], enum_values) if args else _identity
+        return lambda value: origin(item(v) for v in value) if isinstance(value, (list, tuple, set)) else value
+    if origin is tuple:
+        if len(args) == 2 and args[1] is Ellipsis:
+            item = _builder(args[0], enum_values)
+            return lambda value: tuple(item(v) for v in value) if isinstance(value, (list, tuple)) else value
+        items = [_builder(arg, enum_values) for arg in args]
+        return lambda value: (
+            tuple(build(v) for build, v in zip(items, value)) if isinstance(value, (list, tuple)) else value
+        )
+    if origin is dict:
+        item = _builder(args[1], enum_values) if args else _identity
+        return lambda value: {k: item(v) for k, v in value.items()} if isinstance(value, dict) else value
+    return None
+
+
+def _builder(annotation: Any, enum_values: bool, discriminator: Optional[str] = None) -> Builder:
+    """
+    Function building the stored form of a JSON value of a type, without validating it
+
+    enum_values is the use_enum_values setting of the model holding the value.
+    """
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return _builder(get_args(annotation)[0], enum_values, _discriminator(annotation) or discriminator)
+    if origin is Literal:
+        return _literal_builder(get_args(annotation), enum_values)
+    if annotation in _IDENTITY_TYPES:
+        return _identity
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _model_builder(annotation)
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        return _identity if enum_values else annotation
+    if origin in (Union, UnionType):
+        return _union_builder(annotation, enum_values, discriminator)
+    if annotation in _ISO_PARSERS:
+        return _iso_builder(annotation)
+    if annotation is Decimal:
+        return _decimal
+    container = _container_builder(origin, get_args(annotation), enum_values)
+    return container or _adapter_builder(annotation)
+
+
+def _discriminator(annotation: Any) -> Optional[str]:
+    """Field name discriminating the members of an Annotated union, e.g. object_type or a registry's name"""
+    for metadata in get_args(annotation)[1:]:
+        if isinstance(metadata, FieldInfo) and isinstance(metadata.discriminator, str):
+            return metadata.discriminator
+    return None
+
+
+def _union_members(annotation: Any) -> Tuple[List[Any], Optional[str]]:
+    """Members of a union, with nested unions flattened, and the discriminator of a nested union"""
+    members, discriminator = [], None
+    for member in get_args(annotation):
+        while get_origin(member) is Annotated:
+            discriminator = _discriminator(member) or discriminator
+            member = get_args(member)[0]
+        if get_origin(member) in (Union, UnionType):
+            nested, nested_discriminator = _union_members(member)
+            members.extend(nested)
+            discriminator = nested_discriminator or discriminator
+        else:
+            members.append(member)
+    return members, discriminator
+
+
+def _union_builder(annotation: Any, enum_values: bool, discriminator: Optional[str] = None) -> Builder:
+    """
+    Builder picking the union member of each value
+
+    Objects are matched to models by their discriminator, object_type unless the union
+    declares another. Otherwise a value goes to the union's only model, or its only
+    other type, and values that are still ambiguous are validated.
+    """
+    members, nested_discriminator = _union_members(annotation)
+    key = discriminator or nested_discriminator or "object_type"
+    models = [member for member in members if isinstance(member, type) and issubclass(member, BaseModel)]
+    by_key = {model.model_fields[key].default: _model_builder(model) for model in models if key in model.model_fields}
+    single_model = _model_builder(models[0]) if len(models) == 1 else None
+    other_builders = [
+        _builder(member, enum_values) for member in members if member not in models and member is not type(None)
+    ]
+    if other_builders and all(builder is _identity for builder in other_builders):
+        # e.g. a union of enums stored as values
+        other_builders = [_identity]
+    single_other = other_builders[0] if len(other_builders) == 1 else None
+    fallback = _adapter_builder(annotation)
+
+    def build(value: Any) -> Any:
+        """Build the value as the matching member"""
+        if value is None:
+            return None
+        if isinstance(value, dict):
+            build_model = by_key.get(value.get(key)) or single_model
+            if build_model is not None:
+                return build_model(value)
+        elif single_other is not None:
+            return single_other(value)
+        return fallback(value)
+
+    return build
+
+
+def _model_builder(model: Type[BaseModel]) -> Builder:
+    """Builder constructing a model and its nested models, compiled once per model"""
+    with _MODEL_BUILDERS_LOCK:
+        builder = _MODEL_BUILDERS.get(model)
+        if builder is not None:
+            return builder
+        fields: Dict[str, Tuple[str, Builder]] = {}
+
+        def build(value: Any) -> Any:
+            """Construct the model from a dict, other values are kept as they are"""
+            if not isinstance(value, dict):
+                return value
+            values = {}
+            for key, item in value.items():
+                field = fields.get(key)
+                if field is None:
+                    values[key] = item
+                else:
+                    values[field[0]] = field[1](item)
+            # Same as model.model_construct, without DataModel's override on every instance
+            if not model.__pydantic_complete__:
+                model.model_rebuild()
+            return _construct(model, **values)
+
+        # Registered before compiling the fields, so recursive models reuse it
+        _MODEL_BUILDERS[model] = build
+        enum_values = bool(model.model_config.get("use_enum_values"))
+        for name, field_info in model.model_fields.items():
+            builder = _builder(field_info.annotation, enum_values, field_info.discriminator)
+            fields[field_info.alias or name] = (name, builder)
+        return build
+
+
+def construct_trusted(model: Type[ModelType], data: Dict[str, Any]) -> ModelType:
+    """
+    Build a model and its nested models from a document that was already validated
+
+    Nested models get their declared types, and union members are picked by object_type.
+    Datetimes, dates and decimals are parsed, and types without a fast path are validated.
+    Validators don't run, so an invalid document gives an invalid model; see promote.
+    """
+    return _model_builder(model)(data)
+
+
+def promote(instance: ModelType) -> ModelType:
+    """
+    Fully validated copy of a model built by construct_trusted
+
+    Raises
+    ------
+    ValidationError
+        If the trusted document wasn't valid
+    """
+    return type(instance).model_validate(instance.model_dump())
+
+
+class TrustedLoader:
+    """
+    Loads documents from a validated store without validating them, checking a sample in the background
+
+    Every verify_every-th document is also validated in full in the executor. Failures
+    are logged and kept in failures, so a store that isn't as valid as assumed is noticed.
+    """
+
+    def __init__(self, model: Type[ModelType], verify_every: int = 0, executor: Optional[Executor] = None) -> None:
+        """
+        Parameters
+        ----------
+        model : Type[ModelType]
+            Model of the documents
+        verify_every : int
+            Validate one document in this many in the background, 0 to never validate
+        executor : Optional[Executor]
+            Executor for the background validation, a single worker thread if None
+        """
+        self.model = model
+        self.verify_every = verify_every
+        self.failures: List[Tuple[str, ValidationError]] = []
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._count = 0
+        self._pending: List[Future] = []
+        self._lock = threading.Lock()
+
+    def construct(self, data: Dict[str, Any], source: str = "") -> ModelType:
+        """Build a model from a document, see construct_trusted"""
+        if self._sampled():
+            # Validation can change its input, so the sample is validated from a copy
+            self._submit(json.dumps(data), source)
+        return construct_trusted(self.model, data)
+
+    def load(self, path: Union[str, Path]) -> ModelType:
+        """Read and build a model from a JSON file"""
+        with open(path, "r") as f:
+            contents = f.read()
+        if self._sampled():
+            self._submit(contents, str(path))
+        return construct_trusted(self.model, json.loads(contents))
+
+    def _sampled(self) -> bool:
+        """True if the next document is one of the sample to validate"""
+        with self._lock:
+            self._count += 1
+            return bool(self.verify_every) and self._count % self.verify_every == 0
+
+    def _submit(self, contents: str, source: str) -> None:
+        """Validate a document in the background"""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1)
+            self._pending = [future for future in self._pending if not future.done() or future.exception()]
+            self._pending.append(self._executor.submit(self._verify, contents, source))
+
+    def _verify(self, contents: str, source: str) -> None:
+        """Validate a document, recording a failure"""
+        try:
+            self.model.model_validate_json(contents)
+        except ValidationError as error:
+            logger.warning(f"Trusted document {source} failed validation: {error}")
+            with self._lock:
+                self.failures.append((source, error))
+
+    def wait(self) -> List[Tuple[str, ValidationError]]:
+        """Wait for the sampled validations submitted so far and return all failures"""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for future in pending:
+            future.result()
+        return list(self.failures)
+
+    def close(self) -> None:
+        """Wait for sampled validations and stop the worker thread if the loader created it"""
+        self.wait()
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
@@ -0,0 +1,107 @@
+"""Validation tiers, for skipping the more expensive validators of a model
+
+Validators are tagged with the tier they belong to:
+
+- STRUCTURAL: the field level schema, and validators that coerce or upgrade input
+- MODEL: checks of a single model, e.g. Acquisition.check_modality_config_requirements
+- CROSS_FILE: checks across core files in Metadata, e.g. device names and time constraints
+
+Validators tagged above the active tier are skipped. The tier is FULL by default and
+can be set for a validation call through its context, or for a block of code:
+
+    Acquisition.model_validate_json(contents, context={VALIDATION_TIER: ValidationTier.STRUCTURAL})
+
+    with validation_tier(ValidationTier.STRUCTURAL):
+        Acquisition.model_validate_json(contents)
+
+Models validated with a lower tier can be invalid; validate them again at FULL when needed.
+"""
+
+import functools
+import inspect
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Any, Callable, Iterator, Optional, Union
+
+from pydantic import ValidationInfo
+
+VALIDATION_TIER = "validation_tier"  # validation context key
+
+
+class ValidationTier(IntEnum):
+    """How much validation to run, each tier includes the ones below it"""
+
+    STRUCTURAL = 1
+    MODEL = 2
+    CROSS_FILE = 3
+
+    FULL = CROSS_FILE
+
+
+_active_tier: ContextVar[ValidationTier] = ContextVar("validation_tier", default=ValidationTier.FULL)
+
+
+def _parse_tier(tier: Union[ValidationTier, str, int]) -> ValidationTier:
+    """Tier from a ValidationTier, its name or its value"""
+    if isinstance(tier, str):
+        try:
+            return ValidationTier[tier.upper()]
+        except KeyError:
+            raise ValueError(f"Unknown validation tier: {tier}")
+    return ValidationTier(tier)
+
+
+def get_validation_tier(context: Optional[Any] = None) -> ValidationTier:
+    """Tier set in a validation context, otherwise the tier set by validation_tier()"""
+    if isinstance(context, dict) and VALIDATION_TIER in context:
+        return _parse_tier(context[VALIDATION_TIER])
+    return _active_tier.get()
+
+
+@contextmanager
+def validation_tier(tier: Union[ValidationTier, str]) -> Iterator[ValidationTier]:
+    """
+    Validate up to a tier inside a with block, in this thread or task
+
+    A tier set in the context of a validation call takes precedence.
+    """
+    token = _active_tier.set(_parse_tier(tier))
+    try:
+        yield _active_tier.get()
+    finally:
+        _active_tier.reset(token)
+
+
+def tiered(tier: ValidationTier) -> Callable[[Callable], Callable]:
+    """
+    Tag a field or model validator with its tier, it is skipped when a lower tier is active
+
+    Apply it directly to the function, under field_validator or model_validator. A
+    skipped validator returns the value it was given, so only validators that check
+    their input without changing it should be tagged. Wrap validators aren't supported.
+    """
+
+    def decorate(function: Callable) -> Callable:
+        """Wrap the validator, adding an info parameter if it doesn't take one"""
+        signature = inspect.signature(function)
+        takes_info = "info" in signature.parameters
+        parameter_count = len(signature.parameters)
+
+        @functools.wraps(function)
+        def validator(*args: Any) -> Any:
+            """Run the validator if its tier is active, otherwise return the value unchanged"""
+            if not takes_info and len(args) == parameter_count:
+                # Called directly rather than by pydantic
+                return function(*args)
+            if get_validation_tier(getattr(args[-1], "context", None)) < tier:
+                return args[-2]
+            return function(*args) if takes_info else function(*args[:-1])
+
+        if not takes_info:
+            info = inspect.Parameter("info", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=ValidationInfo)
+            validator.__signature__ = signature.replace(parameters=[*signature.parameters.values(), info])
+        validator.validation_tier = tier
+        return validator
+
+    return decorate
@@ -0,0 +1,317 @@
+"""Watch a working directory of metadata files and re-validate only what changed
+
+Each folder holding core files (subject.json, acquisition.json, ...) is one asset.
+When a core file changes only that file is validated again, and the cross-file
+Metadata validators run again only for its asset, using the models already
+validated for the asset's other files.
+"""
+
+import ctypes
+import ctypes.util
+import hashlib
+import logging
+import os
+import select
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Type, Union
+
+from pydantic import ValidationError
+
+from aind_data_schema.base import DataCoreModel
+from aind_data_schema.core.metadata import CORE_FILE_MODELS, Metadata
+from aind_data_schema.utils.diagnostics import collect_diagnostics
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DEBOUNCE = 0.1  # seconds without changes before validating
+DEFAULT_POLL_INTERVAL = 0.25
+
+# Core file name -> (Metadata field, core model)
+CORE_FILE_NAMES: Dict[str, Tuple[str, Type[DataCoreModel]]] = {
+    model.default_filename(): (field_name, model) for field_name, model in CORE_FILE_MODELS.items()
+}
+
+_IN_MODIFY = 0x002
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_FROM = 0x040
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+
+# (mtime_ns, size) of a file, compared before hashing its content
+FileStat = Tuple[int, int]
+
+
+@dataclass
+class ValidationResult:
+    """
+    Outcome of validating a core file, or the cross-file validators of an asset
+
+    kind is "file" for a core file, "removed" for a core file that was deleted, and
+    "asset" for the Metadata validators of an asset folder.
+    """
+
+    path: str
+    kind: str
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+
+    @property
+    def valid(self) -> bool:
+        """True if validation raised no errors"""
+        return not self.errors
+
+
+def _error_messages(error: Exception) -> List[str]:
+    """One message per error of a ValidationError, or the message of any other error"""
+    if isinstance(error, ValidationError):
+        return [f"{'.'.join(str(part) for part in item['loc'])}: {item['msg']}" for item in error.errors()]
+    return [f"{type(error).__name__}: {error}"]
+
+
+def find_core_files(directory: Union[str, Path]) -> Dict[str, FileStat]:
+    """Stat of every core file under a directory, metadata.nd.json files are ignored"""
+    found = {}
+    for folder, _, files in os.walk(directory):
+        for name in files:
+            if name in CORE_FILE_NAMES:
+                path = os.path.join(folder, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                found[path] = (stat.st_mtime_ns, stat.st_size)
+    return found
+
+
+class PollingEvents:
+    """Change notifications from comparing the stats of core files at an interval"""
+
+    def __init__(self, directory: Union[str, Path], poll_interval: float = DEFAULT_POLL_INTERVAL) -> None:
+        """Start from the files in the directory now"""
+        self.directory = directory
+        self.poll_interval = poll_interval
+        self._stats = find_core_files(directory)
+
+    def wait(self, timeout: Optional[float]) -> bool:
+        """Wait up to timeout seconds (forever if None), True if core files changed"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = self.poll_interval if deadline is None else min(self.poll_interval, deadline - time.monotonic())
+            time.sleep(max(remaining, 0))
+            stats = find_core_files(self.directory)
+            if stats != self._stats:
+                self._stats = stats
+                return True
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+
+    def close(self) -> None:
+        """Nothing to release"""
+
+
+def _load_libc() -> ctypes.CDLL:
+    """The C library, which provides inotify on Linux"""
+    return ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+
+
+class InotifyEvents:
+    """Change notifications from Linux inotify watches on the directory and its subfolders"""
+
+    def __init__(self, directory: Union[str, Path]) -> None:
+        """
+        Watch a directory
+
+        Raises
+        ------
+        OSError
+            If inotify isn't available
+        """
+        self.directory = directory
+        if sys.platform != "linux":
+            raise OSError(f"inotify is not available on {sys.platform}")
+        self._libc = _load_libc()
+        if not hasattr(self._libc, "inotify_init1"):
+            raise OSError("inotify is not available")
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.watch_folders()
+
+    def watch_folders(self) -> None:
+        """Watch every folder under the directory, watching a folder twice has no effect"""
+        for folder, _, _ in os.walk(self.directory):
+            self._libc.inotify_add_watch(self._fd, os.fsencode(folder), _IN_MASK)
+
+    def wait(self, timeout: Optional[float]) -> bool:
+        """Wait up to timeout seconds (forever if None), True if anything under the directory changed"""
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return False
+        try:
+            while os.read(self._fd, 65536):
+                pass
+        except BlockingIOError:
+            pass
+        # New folders need watches of their own
+        self.watch_folders()
+        return True
+
+    def close(self) -> None:
+        """Release the inotify file descriptor"""
+        os.close(self._fd)
+
+
+class MetadataWatcher:
+    """
+    Incremental validator for a working directory of metadata files
+
+    check() validates the files that changed since the last check, detected by
+    modification time and size and confirmed by a content hash, so saving a file
+    without changing it doesn't validate it again. watch() runs check() whenever
+    files change, after they have stopped changing for the debounce interval.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        debounce: float = DEFAULT_DEBOUNCE,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        use_inotify: bool = True,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        directory : Union[str, Path]
+            Working directory, each folder in it holding core files is an asset
+        debounce : float
+            Seconds without changes to wait for before validating
+        poll_interval : float
+            Seconds between checks when polling
+        use_inotify : bool
+            Use inotify where it is available, otherwise poll
+        """
+        self.directory = str(directory)
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.use_inotify = use_inotify
+        self._stats: Dict[str, FileStat] = {}
+        self._hashes: Dict[str, str] = {}
+        self._models: Dict[str, Optional[DataCoreModel]] = {}
+
+    def _changed_files(self) -> Tuple[List[str], List[str]]:
+        """Core files whose content changed since the last check, and core files that were removed"""
+        stats = find_core_files(self.directory)
+        removed = sorted(set(self._stats) - set(stats))
+        changed = []
+        for path, stat in sorted(stats.items()):
+            if self._stats.get(path) == stat:
+                continue
+            try:
+                with open(path, "rb") as f:
+                    digest = hashlib.sha256(f.read()).hexdigest()
+            except FileNotFoundError:
+                stats.pop(path)
+                removed.append(path)
+                continue
+            if self._hashes.get(path) != digest:
+                self._hashes[path] = digest
+                changed.append(path)
+        for path in removed:
+            self._hashes.pop(path, None)
+            self._models.pop(path, None)
+        self._stats = stats
+        return changed, removed
+
+    def _validate_file(self, path: str) -> ValidationResult:
+        """Validate one core file and keep its model for the asset validators"""
+        _, model = CORE_FILE_NAMES[os.path.basename(path)]
+        result = ValidationResult(path, "file")
+        with collect_diagnostics() as collector:
+            try:
+                self._models[path] = model.model_validate_json(Path(path).read_bytes())
+            except (ValidationError, OSError) as error:
+                self._models[path] = None
+                result.errors = _error_messages(error)
+        result.warnings = [diagnostic.message for diagnostic in collector.diagnostics]
+        return result
+
+    def _validate_asset(self, folder: str) -> Optional[ValidationResult]:
+        """
+        Run the cross-file Metadata validators for an asset folder
+
+        Returns None if the folder has no core files left, or if any of them is invalid.
+        """
+        core_models = {}
+        for path, model in self._models.items():
+            if os.path.dirname(path) == folder:
+                if model is None:
+                    return None
+                core_models[CORE_FILE_NAMES[os.path.basename(path)][0]] = model
+        if not core_models:
+            return None
+        result = ValidationResult(folder, "asset")
+        with collect_diagnostics() as collector:
+            try:
+                Metadata(name=os.path.basename(folder), location=folder, **core_models)
+            except ValidationError as error:
+                result.errors = _error_messages(error)
+        result.warnings = [diagnostic.message for diagnostic in collector.diagnostics]
+        return result
+
+    def check(self) -> Iterator[ValidationResult]:
+        """
+        Validate the core files that changed since the last check, then their assets
+
+        The first check validates every core file. Results are yielded as they are ready.
+        """
+        changed, removed = self._changed_files()
+        for path in removed:
+            yield ValidationResult(path, "removed")
+        for path in changed:
+            yield self._validate_file(path)
+        for folder in sorted({os.path.dirname(path) for path in changed + removed}):
+            result = self._validate_asset(folder)
+            if result is not None:
+                yield result
+
+    def _events(self) -> Union[InotifyEvents, PollingEvents]:
+        """inotify events where available, otherwise polling"""
+        if self.use_inotify:
+            try:
+                return InotifyEvents(self.directory)
+            except (OSError, AttributeError, TypeError) as error:
+                # ctypes can also raise AttributeError or TypeError when the C library is not found
+                logger.info(f"Polling for changes, inotify is not available: {error}")
+        return PollingEvents(self.directory, self.poll_interval)
+
+    def watch(self, stop: Optional[threading.Event] = None) -> Iterator[ValidationResult]:
+        """
+        Validate everything, then stream results for each batch of changes until stop is set
+
+        Parameters
+        ----------
+        stop : Optional[threading.Event]
+            Set from another thread to end the watch, checked at least every poll_interval
+        """
+        stop = stop or threading.Event()
+        events = self._events()
+        try:
+            yield from self.check()
+            while not stop.is_set():
+                if events.wait(self.poll_interval):
+                    _settle(events, self.debounce)
+                    yield from self.check()
+        finally:
+            events.close()
+
+
+def _settle(events: Union[InotifyEvents, PollingEvents], debounce: float) -> None:
+    """Wait until there have been no changes for debounce seconds"""
+    while events.wait(debounce):
+        pass
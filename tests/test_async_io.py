@@ -0,0 +1,113 @@
+"""Tests for async reading and writing of core model files"""
+
+import asyncio
+import json
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from aind_data_schema.core.instrument import Instrument
+from aind_data_schema.core.subject import Subject
+from aind_data_schema.utils.async_io import aload_files, awrite_standard_files, map_bounded
+from aind_data_schema.utils.diagnostics import collect_diagnostics
+from aind_data_schema.utils.validation_tiers import ValidationTier, validation_tier
+from examples.ephys_instrument import inst as instrument
+from examples.subject import s as subject
+
+
+class AsyncFileTests(unittest.IsolatedAsyncioTestCase):
+    """Tests for DataCoreModel.awrite_standard_file and DataCoreModel.aload"""
+
+    async def test_round_trip(self):
+        """Files written asynchronously match write_standard_file and load back"""
+        with tempfile.TemporaryDirectory() as folder:
+            await subject.awrite_standard_file(output_directory=Path(folder), prefix="async")
+            subject.write_standard_file(output_directory=Path(folder), prefix="sync")
+            async_file, sync_file = Path(folder) / "async_subject.json", Path(folder) / "sync_subject.json"
+            self.assertEqual(sync_file.read_text(), async_file.read_text())
+            self.assertEqual(subject, await Subject.aload(async_file))
+
+    async def test_process_executor(self):
+        """Serializing and validating can run in other processes"""
+        with tempfile.TemporaryDirectory() as folder, ProcessPoolExecutor(max_workers=1) as executor:
+            await subject.awrite_standard_file(output_directory=folder, executor=executor)
+            self.assertEqual(subject, await Subject.aload(Path(folder) / "subject.json", executor=executor))
+
+    async def test_caller_context(self):
+        """The caller's validation tier and diagnostics collector apply in the executor"""
+        document = json.loads(instrument.model_dump_json())
+        document["connections"].append({"source_device": "Missing device", "target_device": "Missing device"})
+        document["components"].append(document["components"][0])
+        with tempfile.TemporaryDirectory() as folder:
+            path = Path(folder) / "instrument.json"
+            path.write_text(json.dumps(document))
+            with self.assertRaises(ValidationError):
+                await Instrument.aload(path)
+            with validation_tier(ValidationTier.STRUCTURAL):
+                self.assertEqual(len(document["connections"]), len((await Instrument.aload(path)).connections))
+                self.assertEqual(2, len(await aload_files(Instrument, [path, path])))
+                with ProcessPoolExecutor(max_workers=1) as executor:
+                    await Instrument.aload(path, executor=executor)
+
+            del document["connections"][-1]
+            path.write_text(json.dumps(document))
+            with self.assertNoLogs("aind_data_schema.core.instrument"), collect_diagnostics() as collector:
+                await aload_files(Instrument, [path, path])
+            self.assertEqual(["instrument.duplicate_component_names"], [d.code for d in collector.diagnostics])
+            self.assertEqual([2], list(collector.counts().values()))
+
+
+class BoundedConcurrencyTests(unittest.IsolatedAsyncioTestCase):
+    """Tests for bulk operations"""
+
+    async def test_map_bounded(self):
+        """No more than max_concurrency calls run at once and results keep item order"""
+        running, peak = 0, 0
+
+        async def double(value):
+            """Double a value after yielding to the loop"""
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001 * (value % 3))
+            running -= 1
+            return 2 * value
+
+        self.assertEqual([2 * i for i in range(20)], await map_bounded(double, iter(range(20)), 4))
+        self.assertEqual(4, peak)
+        self.assertEqual([], await map_bounded(double, [], 4))
+        with self.assertRaises(ValueError):
+            await map_bounded(double, [1], 0)
+
+    async def test_map_bounded_error(self):
+        """The first error is raised and remaining calls are cancelled"""
+        started = []
+
+        async def fail_on_second(value):
+            """Raise for the second item"""
+            started.append(value)
+            await asyncio.sleep(0)
+            if value == 1:
+                raise RuntimeError("failed")
+            await asyncio.sleep(1)
+
+        with self.assertRaises(RuntimeError):
+            await map_bounded(fail_on_second, range(10), 2)
+        self.assertEqual([0, 1], started)
+
+    async def test_bulk_files(self):
+        """Many models are written and read back"""
+        with tempfile.TemporaryDirectory() as folder:
+            folders = [Path(folder) / str(i) for i in range(5)]
+            for output_directory in folders:
+                output_directory.mkdir()
+            await awrite_standard_files([(subject, output_directory) for output_directory in folders], 2)
+            loaded = await aload_files(Subject, [output_directory / "subject.json" for output_directory in folders], 2)
+            self.assertEqual([subject] * 5, loaded)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,7 +5,7 @@ import unittest
 import warnings
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Literal, Optional
+from typing import Literal, Optional, Union
 from unittest.mock import MagicMock, call, mock_open, patch
 
 from aind_data_schema_models.brain_atlas import BrainStructureModel
@@ -16,6 +16,7 @@ from aind_data_schema.base import (
     AwareDatetimeWithDefault,
     DataCoreModel,
     DataModel,
+    DiscriminatedList,
     GenericModel,
     is_dict_corrupt,
 )
@@ -210,9 +211,7 @@ class BaseTests(unittest.TestCase):
         s.write_standard_file(output_directory=Path("dir"), suffix=".foo.bar")
 
         mock_open.assert_has_calls([call(Path("dir/subject.foo.bar"), "w")])
-        mock_logger.warning.assert_called_once_with(
-            f"File size exceeds {MAX_FILE_SIZE / 1024} KB: dir/subject.foo.bar"
-        )
+        mock_logger.warning.assert_called_once_with(f"File size exceeds {MAX_FILE_SIZE / 1024} KB: dir/subject.foo.bar")
 
 
 class DataModelTests(unittest.TestCase):
@@ -258,6 +257,51 @@ class DataModelTests(unittest.TestCase):
 
             object_types[subclass.__name__] = object_type
 
+    def test_discriminated_list_dispatch(self):
+        """Test that DiscriminatedList items are validated against the member named by object_type"""
+
+        class FirstItem(DataModel):
+            """First union member"""
+
+            value: int
+
+        class SecondItem(DataModel):
+            """Second union member"""
+
+            value: str
+
+        class ItemContainer(DataModel):
+            """Container with a discriminated list"""
+
+            items: DiscriminatedList[Union[FirstItem, SecondItem]]
+
+        container = ItemContainer.model_validate(
+            {"items": [{"object_type": "First item", "value": 1}, {"object_type": "Second item", "value": "a"}]}
+        )
+        self.assertEqual([type(item) for item in container.items], [FirstItem, SecondItem])
+
+        # The tag selects a single member, so a mismatched value is not retried against other members
+        with self.assertRaises(ValidationError) as context:
+            ItemContainer.model_validate({"items": [{"object_type": "First item", "value": "a"}]})
+        self.assertEqual(context.exception.error_count(), 1)
+        self.assertIn("items.0.First item.value", str(context.exception))
+
+        # Instances are passed through untouched
+        self.assertEqual(ItemContainer(items=[FirstItem(value=2)]).items[0].value, 2)
+
+    def test_model_construct_builds_schema(self):
+        """Test that model_construct builds a deferred schema so the instance can be serialized"""
+
+        class ConstructedItem(DataModel):
+            """Model whose schema has not been built yet"""
+
+            value: int
+
+        self.assertFalse(ConstructedItem.__pydantic_complete__)
+        item = ConstructedItem.model_construct(value=1)
+        self.assertTrue(ConstructedItem.__pydantic_complete__)
+        self.assertEqual({"object_type": "Constructed item", "value": 1}, item.model_dump())
+
 
 class DataCoreModelTests(unittest.TestCase):
     """Tests for DataCoreModel"""
@@ -1,5 +1,6 @@
 """Tests schema_version_bump module"""
 
+import gc
 import unittest
 from pathlib import Path
 from unittest.mock import MagicMock, call, patch
@@ -19,6 +20,10 @@ class SchemaVersionTests(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """Load json files before running tests."""
+        # The mocked file contents line up with the models the handler enumerates later. Models defined
+        # inside other tests (e.g. TestCoreModel in test_base) stay in DataCoreModel.__subclasses__()
+        # until collected, so collect them now or the two enumerations can differ.
+        gc.collect()
         mock_open_return_values = []
         for core_model in SchemaWriter.get_schemas():
             contents = core_model.model_json_schema()
@@ -39,6 +44,9 @@ class SchemaVersionTests(unittest.TestCase):
         models_that_changed = handler._get_list_of_models_that_changed()
         self.assertTrue(Acquisition in models_that_changed)
         self.assertTrue(Subject in models_that_changed)
+        self.assertEqual(
+            {"Acquisition": [Acquisition], "Subject": [Subject]}, handler.get_models_affected_by_definition()
+        )
 
     @patch("aind_data_schema.utils.schema_version_bump.SchemaVersionHandler._get_schema_json")
     def test_get_list_of_incremented_versions(self, mock_get_schema: MagicMock):
@@ -0,0 +1,139 @@
+"""Tests for the SQLite metadata catalog"""
+
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+
+from aind_data_schema.catalog import CATALOG_COLUMNS, MetadataCatalog, extract_columns, qc_overall_status
+from examples.data_description import d as data_description
+from examples.ephys_acquisition import acquisition
+from examples.quality_control import q as quality_control
+from examples.subject import s as subject
+
+
+def metadata_document(name: str, **core_files) -> dict:
+    """Metadata JSON with the example core files, without validating it as a whole"""
+    document = {"name": name, "location": f"s3://bucket/{name}"}
+    for key, model in core_files.items():
+        document[key] = json.loads(model.model_dump_json())
+    return document
+
+
+class ExtractColumnsTests(unittest.TestCase):
+    """Tests for reading catalog columns from documents"""
+
+    def test_extract_columns(self):
+        """Columns are read from the core files"""
+        document = metadata_document(
+            "asset",
+            subject=subject,
+            data_description=data_description,
+            acquisition=acquisition,
+            quality_control=quality_control,
+        )
+        columns = extract_columns(document)
+        self.assertEqual(list(CATALOG_COLUMNS), list(columns))
+        self.assertEqual(subject.subject_id, columns["subject_id"])
+        self.assertEqual(data_description.project_name, columns["project_name"])
+        self.assertEqual(acquisition.instrument_id, columns["instrument_id"])
+        self.assertEqual(
+            acquisition.acquisition_start_time.astimezone(timezone.utc).isoformat(), columns["acquisition_start_time"]
+        )
+        self.assertEqual(",".join(sorted(m.abbreviation for m in data_description.modalities)), columns["modalities"])
+        self.assertEqual(quality_control.evaluate_status().value, columns["qc_status"])
+
+    def test_missing_core_files(self):
+        """Documents without core files have empty columns"""
+        columns = extract_columns({"name": "asset", "acquisition": {"acquisition_start_time": "not a time"}})
+        self.assertEqual("asset", columns["name"])
+        self.assertEqual("not a time", columns["acquisition_start_time"])
+        self.assertIsNone(columns["subject_id"])
+        self.assertEqual("", columns["modalities"])
+
+    def test_qc_overall_status(self):
+        """The worst stage status is the overall status"""
+        self.assertIsNone(qc_overall_status(None))
+        self.assertIsNone(qc_overall_status({"status": {"tag:value": "Fail"}}))
+        self.assertEqual("Pass", qc_overall_status({"status": {"Raw data": "Pass", "tag:value": "Fail"}}))
+        self.assertEqual("Pending", qc_overall_status({"status": {"Raw data": "Pass", "Processing": "Pending"}}))
+        self.assertEqual("Fail", qc_overall_status({"status": {"Raw data": "Fail", "Processing": "Pending"}}))
+
+
+class MetadataCatalogTests(unittest.TestCase):
+    """Tests for MetadataCatalog"""
+
+    def setUp(self):
+        """Write two metadata files"""
+        self.folder = tempfile.TemporaryDirectory()
+        self.root = Path(self.folder.name)
+        self.write("ephys", subject=subject, data_description=data_description, acquisition=acquisition)
+        self.write("qc", quality_control=quality_control)
+        self.catalog = MetadataCatalog()
+
+    def tearDown(self):
+        """Close the catalog and remove the files"""
+        self.catalog.close()
+        self.folder.cleanup()
+
+    def write(self, name: str, **core_files) -> Path:
+        """Write a metadata.nd.json file in its own asset folder"""
+        path = self.root / name / "metadata.nd.json"
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(json.dumps(metadata_document(name, **core_files)))
+        return path
+
+    def test_ingest_incremental(self):
+        """Unchanged and touched files are skipped, changed files are updated and deleted files pruned"""
+        self.assertEqual({"changed": 2, "unchanged": 0, "failed": 0, "removed": 0}, self.catalog.ingest(self.root))
+        self.assertEqual(2, len(self.catalog))
+
+        path = self.root / "qc" / "metadata.nd.json"
+        os.utime(path, ns=(0, 0))
+        (self.root / "broken").mkdir()
+        (self.root / "broken" / "metadata.nd.json").write_text("{")
+        self.assertEqual({"changed": 0, "unchanged": 2, "failed": 1, "removed": 0}, self.catalog.ingest(self.root))
+
+        self.write("qc", subject=subject)
+        self.assertEqual({"changed": 1, "unchanged": 0, "failed": 0, "removed": 0}, self.catalog.ingest(path))
+        self.assertEqual(subject.subject_id, self.catalog.query(name="qc")[0]["subject_id"])
+
+        path.unlink()
+        counts = self.catalog.ingest([self.root / "ephys" / "metadata.nd.json"], prune=True)
+        self.assertEqual(1, counts["removed"])
+        self.assertEqual(["ephys"], [row["name"] for row in self.catalog.query(["name"])])
+
+    def test_query(self):
+        """Filters use the indexed columns and projections can read from the stored documents"""
+        self.catalog.ingest(self.root, batch_size=1)
+        ephys = self.catalog.query(["name", "subject.subject_id", "path"], subject_id=subject.subject_id)
+        self.assertEqual(1, len(ephys))
+        self.assertEqual(subject.subject_id, ephys[0]["subject.subject_id"])
+        self.assertTrue(ephys[0]["path"].endswith("metadata.nd.json"))
+
+        modality = data_description.modalities[0].abbreviation
+        self.assertEqual(["ephys"], [row["name"] for row in self.catalog.query(["name"], modality=modality)])
+        self.assertEqual(2, len(self.catalog.query(name=["ephys", "qc", "other"])))
+        self.assertEqual(
+            ["qc"], [row["name"] for row in self.catalog.query(["name"], qc_status=quality_control.evaluate_status())]
+        )
+
+        start = acquisition.acquisition_start_time
+        self.assertEqual(1, len(self.catalog.query(acquired_after=start, acquired_before=datetime.now(timezone.utc))))
+        self.assertEqual([], self.catalog.query(acquired_before=start))
+
+        with self.assertRaises(ValueError):
+            self.catalog.query(modalities=modality)
+
+    def test_get_document(self):
+        """Full documents are returned from the compressed copy"""
+        with MetadataCatalog(self.root / "catalog.sqlite") as catalog:
+            catalog.ingest(self.root)
+            self.assertEqual(metadata_document("qc", quality_control=quality_control), catalog.get_document("qc"))
+            self.assertIsNone(catalog.get_document("missing"))
+
+
+if __name__ == "__main__":
+    unittest.main()
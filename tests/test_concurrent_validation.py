@@ -0,0 +1,105 @@
+"""Tests for validating documents on a thread pool"""
+
+import copy
+import json
+import unittest
+
+from pydantic import BaseModel, ValidationError
+
+from aind_data_schema.components.devices import Monitor
+from aind_data_schema.components.stimulus import AuditoryStimulation
+from aind_data_schema.components.subjects import CalibrationObject
+from aind_data_schema.core.instrument import Instrument
+from aind_data_schema.core.metadata import Metadata
+from aind_data_schema.core.quality_control import QualityControl
+from aind_data_schema.core.subject import Subject
+from aind_data_schema.utils.concurrent_validation import build_schemas, validate_document, validate_documents
+from aind_data_schema.utils.validation_tiers import ValidationTier, validation_tier
+from examples.data_description import d as data_description
+from examples.ephys_instrument import inst as instrument
+
+
+class Leaf(BaseModel):
+    """Nested model"""
+
+    value: int = 0
+
+
+class Branch(BaseModel):
+    """Model nesting another in a container"""
+
+    leaves: list[Leaf | None] = []
+
+
+class ConcurrentValidationTests(unittest.TestCase):
+    """Tests for validate_documents"""
+
+    def test_build_schemas(self):
+        """The schemas of nested models are built"""
+        build_schemas(Branch)
+        self.assertTrue(Leaf.__pydantic_complete__)
+        build_schemas(Instrument)
+        self.assertTrue(type(instrument.components[0]).__pydantic_complete__)
+
+    def test_validate_documents(self):
+        """Documents are validated in order, JSON strings or dictionaries"""
+        document = instrument.model_dump_json()
+        results = validate_documents(Instrument, [document, json.loads(document)] * 4, max_workers=4)
+        self.assertEqual(8, len(results))
+        self.assertTrue(all(result.model == instrument for result in results))
+
+        invalid = json.loads(document)
+        invalid["connections"].append({"source_device": "Missing device", "target_device": "Missing device"})
+        with self.assertRaises(ValidationError):
+            validate_documents(Instrument, [document, json.dumps(invalid)], max_workers=2)
+        with validation_tier(ValidationTier.STRUCTURAL):
+            results = validate_documents(Instrument, [json.dumps(invalid)] * 2, max_workers=2)
+        self.assertEqual(2, len(results))
+
+    def test_shared_models(self):
+        """Validators don't modify models shared between documents, and diagnostics are per document"""
+        dd = data_description.model_copy(update={"tags": None})
+        subject = Subject(subject_id="calibration", subject_details=CalibrationObject(description="Calibration"))
+        documents = [
+            {"name": f"asset_{i}", "location": "location", "subject": subject, "data_description": dd}
+            for i in range(32)
+        ]
+        results = validate_documents(Metadata, documents, max_workers=8)
+        self.assertIsNone(dd.tags)
+        for result in results:
+            self.assertEqual(["calibration"], result.model.data_description.tags)
+            self.assertIn("metadata.calibration_tag_added", [d.code for d in result.diagnostics])
+        self.assertEqual(
+            results[0].diagnostics, validate_document(Metadata, documents[0], context={"other": 1}).diagnostics
+        )
+
+    def test_input_unchanged(self):
+        """Before validators don't change the caller's input, which threads may share"""
+        metric = {
+            "object_type": "QC metric",
+            "name": "metric",
+            "modality": {"name": "Extracellular electrophysiology", "abbreviation": "ecephys"},
+            "stage": "Processing",
+            "value": 1,
+            "status_history": [{"evaluator": "Automated", "timestamp": "2020-10-10T00:00:00Z", "status": "Pass"}],
+            "tags": ["probe_a"],
+        }
+        document = {"object_type": "Quality control v2", "metrics": [metric], "default_grouping": ["probe"]}
+        original = copy.deepcopy(document)
+        results = validate_documents(QualityControl, [document] * 16, max_workers=8)
+        self.assertEqual(original, document)
+        self.assertEqual({"tag_1": "probe_a"}, results[0].model.metrics[0].tags)
+        self.assertEqual("Quality control", results[0].model.object_type)
+
+        for model, validator, values in [
+            (Monitor, Monitor.add_units_if_needed, {"contrast": 1, "brightness": 1}),
+            (AuditoryStimulation, AuditoryStimulation.correct_typo, {"sitmulus_name": "tone"}),
+        ]:
+            with self.subTest(model=model.__name__):
+                original = dict(values)
+                self.assertNotEqual(original, validator(values))
+                self.assertEqual(original, values)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+"""Tests for conversion between coordinate systems"""
+
+import unittest
+
+import numpy as np
+from aind_data_schema_models.coordinates import AxisName, Direction, Origin
+from aind_data_schema_models.units import SizeUnit
+
+from aind_data_schema.components.coordinates import Axis, CoordinateSystem, CoordinateSystemLibrary
+from aind_data_schema.utils.coordinate_conversion import (
+    convert_points,
+    coordinate_systems_equivalent,
+    get_conversion,
+    size_unit_scale,
+)
+
+
+class CoordinateConversionTests(unittest.TestCase):
+    """Tests for get_conversion and convert_points"""
+
+    def test_ari_to_ras(self):
+        """Swap AP/ML and flip SI between BREGMA_ARI and BREGMA_RAS"""
+        conversion = get_conversion(CoordinateSystemLibrary.BREGMA_ARI, CoordinateSystemLibrary.BREGMA_RAS)
+        self.assertEqual(conversion.permutation, (1, 0, 2))
+        self.assertEqual(conversion.signs, (1, 1, -1))
+        self.assertFalse(conversion.is_identity)
+
+        points = np.array([[1.0, 2.0, 3.0], [-4.0, 5.0, -6.0]])
+        converted = convert_points(points, CoordinateSystemLibrary.BREGMA_ARI, CoordinateSystemLibrary.BREGMA_RAS)
+        self.assertEqual(converted.tolist(), [[2.0, 1.0, -3.0], [5.0, -4.0, 6.0]])
+
+        back = convert_points(converted, CoordinateSystemLibrary.BREGMA_RAS, CoordinateSystemLibrary.BREGMA_ARI)
+        np.testing.assert_array_equal(back, points)
+
+        matrix = np.array(conversion.to_matrix())
+        np.testing.assert_array_equal((matrix[:3, :3] @ points.T).T, converted)
+
+    def test_cached(self):
+        """Conversions are derived once per pair of geometries"""
+        first = get_conversion(CoordinateSystemLibrary.BREGMA_ARID, CoordinateSystemLibrary.BREGMA_RASD)
+        copy = CoordinateSystemLibrary.BREGMA_ARID.model_copy(deep=True)
+        self.assertIs(get_conversion(copy, CoordinateSystemLibrary.BREGMA_RASD), first)
+        self.assertEqual(first.permutation, (1, 0, 2, 3))
+
+    def test_units(self):
+        """Unit differences become a scale factor"""
+        source = CoordinateSystemLibrary.BREGMA_ARI
+        target = source.model_copy(update={"axis_unit": SizeUnit.UM})
+        self.assertEqual(convert_points([1.0, 2.0, 3.0], source, target).tolist(), [1000.0, 2000.0, 3000.0])
+
+        with self.assertRaises(ValueError):
+            convert_points([[1.0, 2.0]], source, target)
+
+    def test_positive_negative_directions(self):
+        """Positive/Negative axes match by axis name"""
+        flipped = CoordinateSystem(
+            name="IMAGE_XYZ_FLIPPED",
+            origin=Origin.ORIGIN,
+            axis_unit=SizeUnit.PX,
+            axes=[
+                Axis(name=AxisName.Z, direction=Direction.POS),
+                Axis(name=AxisName.Y, direction=Direction.NEG),
+                Axis(name=AxisName.X, direction=Direction.POS),
+            ],
+        )
+        converted = convert_points([1.0, 2.0, 3.0], CoordinateSystemLibrary.IMAGE_XYZ, flipped)
+        self.assertEqual(converted.tolist(), [3.0, -2.0, 1.0])
+
+    def test_incompatible_systems(self):
+        """Systems that cannot be related by a permutation raise errors"""
+        library = CoordinateSystemLibrary
+        with self.assertRaises(ValueError):
+            get_conversion(library.BREGMA_ARI, library.SPIM_RPI)  # different origin
+        with self.assertRaises(ValueError):
+            get_conversion(library.BREGMA_ARI, library.BREGMA_ARID)  # different axis count
+        with self.assertRaises(ValueError):
+            get_conversion(library.SPIM_IJK, library.SPIM_RPI)  # no shared axes
+        with self.assertRaises(ValueError):
+            get_conversion(library.IMAGE_XYZ, library.IMAGE_XYZ.model_copy(update={"axis_unit": SizeUnit.MM}))
+
+        duplicated = library.BREGMA_ARI.model_copy(
+            update={"axes": [library.BREGMA_ARI.axes[0], library.BREGMA_ARI.axes[0], library.BREGMA_ARI.axes[2]]}
+        )
+        with self.assertRaises(ValueError):
+            get_conversion(duplicated, library.BREGMA_ARI)
+
+        other = library.BREGMA_ARI.model_copy(
+            update={"axes": [Axis(name=AxisName.AP, direction=Direction.OTHER)] + library.BREGMA_ARI.axes[1:]}
+        )
+        with self.assertRaises(ValueError):
+            get_conversion(other, library.BREGMA_ARI)
+
+    def test_equivalent(self):
+        """Equivalence ignores names but not geometry"""
+        library = CoordinateSystemLibrary
+        self.assertTrue(coordinate_systems_equivalent(library.SPIM_LPS, library.MRI_LPS))
+        self.assertTrue(coordinate_systems_equivalent(library.SPIM_IJK, library.IMAGE_XYZ))
+        self.assertFalse(coordinate_systems_equivalent(library.BREGMA_ARI, library.BREGMA_RAS))
+        self.assertFalse(coordinate_systems_equivalent(library.BREGMA_ARI, library.SPIM_RPI))
+
+        renamed_axes = library.BREGMA_ARI.model_copy(
+            update={
+                "axes": [
+                    Axis(name=AxisName.X, direction=Direction.PA),
+                    Axis(name=AxisName.Y, direction=Direction.LR),
+                    Axis(name=AxisName.Z, direction=Direction.SI),
+                ]
+            }
+        )
+        self.assertTrue(coordinate_systems_equivalent(library.BREGMA_ARI, renamed_axes))
+
+    def test_size_unit_scale(self):
+        """Physical units convert exactly, pixels cannot be converted"""
+        self.assertEqual(size_unit_scale(SizeUnit.MM, SizeUnit.UM), 1000.0)
+        self.assertEqual(size_unit_scale(SizeUnit.PX, SizeUnit.PX), 1.0)
+        with self.assertRaises(ValueError):
+            size_unit_scale(SizeUnit.PX, SizeUnit.MM)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,22 +1,28 @@
 """Tests for the coordinates module"""
 
+import sys
 import unittest
+from unittest.mock import patch
 
 import numpy as np
 from aind_data_schema_models.atlas import AtlasName
-from aind_data_schema_models.units import SizeUnit
+from aind_data_schema_models.units import AngleUnit, SizeUnit
 from scipy.spatial.transform import Rotation as R
 
 from aind_data_schema.components.coordinates import (
     Affine,
     Atlas,
+    AtlasLibrary,
     Axis,
     AxisName,
+    CoordinateSystem,
+    CoordinateSystemLibrary,
     Direction,
     Origin,
     Rotation,
     Scale,
     Translation,
+    _LazyConstant,
 )
 
 
@@ -56,9 +62,27 @@ class TestTranslation(unittest.TestCase):
         self.assertEqual(translation.to_matrix(), expected_matrix)
 
 
+class TestMatricesWithoutNumpy(unittest.TestCase):
+    """Scale and Translation matrices don't need the transforms extra"""
+
+    def test_to_matrix(self):
+        """to_matrix builds plain lists without numpy"""
+        with patch.dict(sys.modules, {"numpy": None, "aind_data_schema.utils.transforms": None}):
+            self.assertEqual([[2.0, 0.0], [0.0, 1.0]], Scale(scale=[2]).to_matrix())
+            self.assertEqual([[1.0, 2.0], [0.0, 1.0]], Translation(translation=[2]).to_matrix())
+            with self.assertRaises(ImportError):
+                Scale(scale=[2]).to_numpy()
+
+
 class TestRotation(unittest.TestCase):
     """Tests for the Rotation class"""
 
+    def assertMatrixAlmostEqual(self, matrix, expected_matrix):
+        """Compare (possibly ragged) list-of-list matrices to within floating point error"""
+        self.assertEqual(len(matrix), len(expected_matrix))
+        for row, expected_row in zip(matrix, expected_matrix):
+            np.testing.assert_allclose(row, expected_row, rtol=0, atol=1e-12)
+
     def test_to_matrix_default_order(self):
         """Test to_matrix method with default axis order"""
 
@@ -67,8 +91,7 @@ class TestRotation(unittest.TestCase):
         )
         expected_matrix = R.from_euler("xyz", [90, 45, 30], degrees=True).as_matrix().tolist()
         expected_matrix = [row + [0.0] for row in expected_matrix] + [[0.0, 0.0, 0.0, 1.0]]
-        self.maxDiff = None
-        self.assertEqual(rotation.to_matrix(), expected_matrix)
+        self.assertMatrixAlmostEqual(rotation.to_matrix(), expected_matrix)
 
     def test_to_matrix_negative_directions(self):
         """Test to_matrix method with inverted rotation directions"""
@@ -78,7 +101,7 @@ class TestRotation(unittest.TestCase):
         )
         expected_matrix = R.from_euler("xyz", [-90, -45, -30], degrees=True).as_matrix().tolist()
         expected_matrix = [row + [0.0] for row in expected_matrix] + [[0.0, 0.0, 0.0, 1.0]]
-        self.assertEqual(rotation.to_matrix(), expected_matrix)
+        self.assertMatrixAlmostEqual(rotation.to_matrix(), expected_matrix)
 
     def test_to_matrix_partial_axes(self):
         """Test to_matrix method with partial axes"""
@@ -87,7 +110,7 @@ class TestRotation(unittest.TestCase):
         )
         expected_matrix = R.from_euler("xy", [90, 45], degrees=True).as_matrix().tolist()
         expected_matrix = [row + [0.0] for row in expected_matrix] + [[0.0, 0.0, 1.0]]
-        self.assertEqual(rotation.to_matrix(), expected_matrix)
+        self.assertMatrixAlmostEqual(rotation.to_matrix(), expected_matrix)
 
     def test_to_matrix_no_rotation(self):
         """Test to_matrix method with no rotation"""
@@ -101,7 +124,49 @@ class TestRotation(unittest.TestCase):
         )
         expected_matrix = R.from_euler("xyz", [0, 0, 0], degrees=True).as_matrix().tolist()
         expected_matrix = [row + [0.0] for row in expected_matrix] + [[0.0, 0.0, 0.0, 1.0]]
-        self.assertEqual(rotation.to_matrix(), expected_matrix)
+        self.assertMatrixAlmostEqual(rotation.to_matrix(), expected_matrix)
+
+    def test_to_matrix_radians(self):
+        """Test to_matrix method with angles in radians"""
+        rotation = Rotation(angles=[np.pi / 2, 0, np.pi / 6], angles_unit=AngleUnit.RAD)
+        expected_matrix = R.from_euler("xyz", [90, 0, 30], degrees=True).as_matrix()
+        np.testing.assert_allclose(rotation.to_numpy()[:3, :3], expected_matrix, atol=1e-12)
+
+    def test_to_numpy(self):
+        """Test that to_numpy returns a cached, read-only homogeneous matrix"""
+        rotation = Rotation(angles=[90, 45, 30])
+        matrix = rotation.to_numpy()
+        self.assertEqual(matrix.shape, (4, 4))
+        np.testing.assert_allclose(matrix, rotation.to_matrix())
+        self.assertIs(Rotation(angles=[90, 45, 30]).to_numpy(), matrix)
+        self.assertFalse(matrix.flags.writeable)
+
+        with self.assertRaises(ValueError):
+            Rotation(angles=[90, 45]).to_numpy()
+        with self.assertRaises(ValueError):
+            Rotation(angles=[90, 45, 30, 10]).to_matrix()
+
+
+class TestToNumpy(unittest.TestCase):
+    """Tests for the to_numpy methods"""
+
+    def test_scale_translation_affine(self):
+        """to_numpy matches to_matrix for each transform type"""
+        transforms = [
+            Scale(scale=[2, 3, 4]),
+            Translation(translation=[2, 3]),
+            Affine(affine_transform=[[1.0, 0.0, 5.0], [0.0, 1.0, 6.0], [0.0, 0.0, 1.0]]),
+        ]
+        for transform in transforms:
+            self.assertEqual(transform.to_numpy().tolist(), transform.to_matrix())
+            self.assertFalse(transform.to_numpy().flags.writeable)
+
+    def test_cache_follows_values(self):
+        """Mutating a transform changes its matrix"""
+        translation = Translation(translation=[1, 2, 3])
+        self.assertEqual(translation.to_numpy()[0, 3], 1.0)
+        translation.translation[0] = 5
+        self.assertEqual(translation.to_numpy()[0, 3], 5.0)
 
 
 class TestAffineWithAffineTransforms(unittest.TestCase):
@@ -205,6 +270,19 @@ class TestAffineWithAffineTransforms(unittest.TestCase):
             affine_transform.compose([rotation, translation, scale])
         self.assertIn("All transforms must be the same size", str(context.exception))
 
+    def test_compose_empty(self):
+        """Raise error when composing an empty list"""
+        with self.assertRaises(ValueError):
+            Affine.compose([])
+
+    def test_compose_long_chain(self):
+        """Composing a chain matches sequential multiplication"""
+        chain = [Translation(translation=[1, 2, 3]), Rotation(angles=[10, 20, 30]), Scale(scale=[2, 2, 2])] * 4
+        expected_matrix = np.eye(4)
+        for transform in chain:
+            expected_matrix = expected_matrix @ np.array(transform.to_matrix())
+        np.testing.assert_allclose(Affine.compose(chain).affine_transform, expected_matrix, atol=1e-12)
+
 
 class TestMultiplyMatrix(unittest.TestCase):
     """Tests for the multiply_matrix function"""
@@ -238,6 +316,30 @@ class TestMultiplyMatrix(unittest.TestCase):
         self.assertEqual(np.matmul(matrix1, matrix2).tolist(), expected_result)
 
 
+class TestLibraries(unittest.TestCase):
+    """Tests for the lazily built library constants"""
+
+    def test_constants_are_cached(self):
+        """Library constants are built once and shared"""
+        self.assertIs(CoordinateSystemLibrary.BREGMA_ARI, CoordinateSystemLibrary.BREGMA_ARI)
+        self.assertIsInstance(CoordinateSystemLibrary.BREGMA_ARI, CoordinateSystem)
+        self.assertIsInstance(AtlasLibrary.CCFv3_10um, Atlas)
+        self.assertEqual(AtlasLibrary.CCFv3_10um.resolution, [10, 10, 10])
+
+    def test_built_on_first_access(self):
+        """The factory only runs when the constant is first accessed"""
+        calls = []
+
+        class Library:
+            """Test library"""
+
+            VALUE = _LazyConstant(lambda: calls.append(1) or Scale(scale=[1, 2]))
+
+        self.assertEqual(calls, [])
+        self.assertIs(Library.VALUE, Library().VALUE)
+        self.assertEqual(calls, [1])
+
+
 class TestAtlas(unittest.TestCase):
     """Tests for the Atlas class"""
 
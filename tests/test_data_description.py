@@ -10,7 +10,7 @@ from aind_data_schema_models.modalities import Modality
 from aind_data_schema_models.organizations import Organization
 from pydantic import ValidationError
 
-from aind_data_schema.core.data_description import DataDescription, Funding, build_data_name
+from aind_data_schema.core.data_description import DataDescription, Funding, _parse_name, build_data_name
 from aind_data_schema.components.identifiers import Person
 
 from examples.data_description import d as example_data_description
@@ -268,6 +268,40 @@ class DataDescriptionTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             DataDescription.parse_name(self.BAD_NAME, DataLevel.DERIVED)
 
+    def test_parse_name_cached(self):
+        """Repeated names are parsed once and callers can't modify the cached result"""
+        toks = DataDescription.parse_name(self.BASIC_NAME, "raw")
+        toks["label"] = "changed"
+        hits = _parse_name.cache_info().hits
+        self.assertEqual("1234", DataDescription.parse_name(self.BASIC_NAME, DataLevel.RAW)["label"])
+        self.assertEqual(hits + 1, _parse_name.cache_info().hits)
+
+    def test_parse_names(self):
+        """tests for parsing many names at once"""
+
+        columns = DataDescription.parse_names([self.BASIC_NAME, "5678_2020-01-02_03-04-05"])
+        self.assertEqual(["1234", "5678"], columns["label"])
+        self.assertEqual(
+            [datetime.datetime(3033, 12, 21, 4, 22, 11), datetime.datetime(2020, 1, 2, 3, 4, 5)],
+            columns["creation_time"],
+        )
+
+        columns = DataDescription.parse_names([self.DERIVED_NAME], DataLevel.DERIVED)
+        self.assertEqual(
+            {k: [v] for k, v in DataDescription.parse_name(self.DERIVED_NAME, DataLevel.DERIVED).items()}, columns
+        )
+        self.assertEqual(
+            {"input": [], "process_name": [], "creation_time": []}, DataDescription.parse_names([], "derived")
+        )
+
+        with self.assertRaises(ValueError):
+            DataDescription.parse_names([self.BASIC_NAME, self.BAD_NAME])
+
+        columns = DataDescription.parse_names(
+            [self.BAD_NAME, "1234_2020-02-30_00-00-00", self.BASIC_NAME], strict=False
+        )
+        self.assertEqual([None, None, "1234"], columns["label"])
+
     def test_unique_abbreviations(self):
         """Tests that abbreviations are unique"""
         modality_abbreviations = [m().abbreviation for m in Modality.ALL]
@@ -0,0 +1,120 @@
+"""Tests for structured validation diagnostics"""
+
+import threading
+import unittest
+import warnings
+from unittest.mock import MagicMock, patch
+
+from aind_data_schema.components.identifiers import Code
+from aind_data_schema.core.instrument import Instrument
+from aind_data_schema.utils.diagnostics import (
+    Diagnostic,
+    DiagnosticsCollector,
+    collect_diagnostics,
+    logging_sink,
+    report,
+    warnings_sink,
+)
+
+
+class DiagnosticsCollectorTests(unittest.TestCase):
+    """Tests for DiagnosticsCollector"""
+
+    def test_record(self):
+        """Repeated diagnostics are recorded once with a count"""
+        sink = MagicMock()
+        collector = DiagnosticsCollector(sink)
+        for _ in range(3):
+            collector.record("a.code", "message", "path")
+        collector.record("b.code", "other message")
+
+        first = Diagnostic("a.code", "path", "message")
+        second = Diagnostic("b.code", "", "other message")
+        self.assertEqual([first, second], collector.diagnostics)
+        self.assertEqual({first: 3, second: 1}, collector.counts())
+        self.assertEqual({second: 1}, collector.counts("b.code"))
+        self.assertEqual(2, sink.call_count)
+        sink.assert_any_call(first)
+
+        collector.clear()
+        self.assertEqual([], collector.diagnostics)
+
+    def test_sinks(self):
+        """The sinks warn or log each diagnostic"""
+        diagnostic = Diagnostic("a.code", "path", "message")
+        with self.assertWarnsRegex(UserWarning, r"\[a.code\] message"):
+            warnings_sink(diagnostic)
+        log = MagicMock()
+        logging_sink(log, level=10)(diagnostic)
+        log.log.assert_called_once_with(10, "[a.code] path: message")
+
+    def test_category(self):
+        """Diagnostics keep their warning category, so sinks warn deprecations as DeprecationWarning"""
+        with self.assertWarnsRegex(DeprecationWarning, r"\[a.code\] deprecated"):
+            with collect_diagnostics(sink=warnings_sink) as collector:
+                report("a.code", "deprecated", category=DeprecationWarning)
+        self.assertEqual(DeprecationWarning, collector.diagnostics[0].category)
+        self.assertEqual(UserWarning, Diagnostic("a.code", "", "message").category)
+
+    def test_collector_and_sink(self):
+        """A sink can't be added to an existing collector"""
+        with self.assertRaises(ValueError):
+            with collect_diagnostics(DiagnosticsCollector(), sink=warnings_sink):
+                pass  # pragma: no cover
+
+    def test_threads(self):
+        """Worker threads share a collector by entering collect_diagnostics with it"""
+        collector = DiagnosticsCollector()
+
+        def work():
+            """Report from a worker thread"""
+            with collect_diagnostics(collector):
+                for _ in range(100):
+                    report("a.code", "message")
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual({Diagnostic("a.code", "", "message"): 800}, collector.counts())
+
+
+class ReportTests(unittest.TestCase):
+    """Tests for report"""
+
+    def test_fallback(self):
+        """Outside a collector diagnostics are warned or logged"""
+        with self.assertWarnsRegex(DeprecationWarning, "message"):
+            report("a.code", "message", category=DeprecationWarning)
+        log = MagicMock()
+        report("a.code", "message", log=log)
+        log.assert_called_once_with("message")
+
+    def test_collected(self):
+        """Inside a collector diagnostics are recorded and not warned or logged"""
+        log = MagicMock()
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            with collect_diagnostics() as collector:
+                report("a.code", "message", log=log)
+                Code(url="https://github.com/AllenNeuralDynamics/aind-data-schema")
+        log.assert_not_called()
+        self.assertEqual(["a.code", "code.missing_version"], [d.code for d in collector.diagnostics])
+        report("a.code", "message", log=log)
+        log.assert_called_once_with("message")
+
+    def test_validator(self):
+        """Validators report their code and path"""
+        instrument = Instrument.model_construct(components=[])
+        with patch.object(Instrument, "get_component_names", return_value=["a", "b", "a"]):
+            with collect_diagnostics() as collector:
+                instrument.validate_unique_component_names()
+        diagnostic = collector.diagnostics[0]
+        self.assertEqual("instrument.duplicate_component_names", diagnostic.code)
+        self.assertEqual("components", diagnostic.path)
+        self.assertIn("['a']", diagnostic.message)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,281 @@
+"""Tests for incremental documentation generation"""
+
+import json
+import os
+import tempfile
+import unittest
+from enum import Enum
+from pathlib import Path
+from types import SimpleNamespace
+from typing import List, Literal, Optional, Union
+from unittest.mock import patch
+
+from pydantic import BaseModel, Field
+
+from aind_data_schema.base import DataModel, _GenericModel
+from aind_data_schema.components.identifiers import Person
+from aind_data_schema.utils.docs import model_generator, registries_generator
+from aind_data_schema.utils.docs.model_generator import (
+    BUILD_CACHE_NAME,
+    build_module_docs,
+    check_for_union,
+    generate_markdown_table,
+    generate_model_docs,
+    get_type_string,
+    module_definition_hash,
+    process_module,
+)
+from aind_data_schema.utils.docs.utils import load_build_cache, write_if_changed
+
+SRC_FOLDER = Path(model_generator.__file__).parents[3]
+IDENTIFIERS_PATH = SRC_FOLDER / "aind_data_schema" / "components" / "identifiers.py"
+
+
+class Extra(_GenericModel):
+    """Generic model subclass"""
+
+
+class Unknown:
+    """Registry without instances"""
+
+
+class Old(DataModel):
+    """Model with a deprecated field"""
+
+    value: int = Field(default=0, title="Value", deprecated="Use other")
+
+
+class WriteIfChangedTests(unittest.TestCase):
+    """Tests for write_if_changed"""
+
+    def test_write_if_changed(self):
+        """Files are only written when their content changes"""
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "doc.md")
+            self.assertTrue(write_if_changed(path, "a"))
+            os.utime(path, (0, 0))
+            self.assertFalse(write_if_changed(path, "a"))
+            self.assertEqual(0, os.path.getmtime(path))
+            self.assertTrue(write_if_changed(path, "b"))
+
+
+class TypeStringTests(unittest.TestCase):
+    """Tests for the memoized get_type_string"""
+
+    def test_cached_type_string(self):
+        """Repeated annotations are formatted once, unhashable ones are formatted directly"""
+        self.assertEqual("List[{Person}]", get_type_string(List[Person]))
+        self.assertEqual("Optional[str]", get_type_string(Optional[str]))
+        hits = model_generator._cached_type_string.cache_info().hits
+        get_type_string(List[Person])
+        self.assertEqual(hits + 1, model_generator._cached_type_string.cache_info().hits)
+
+        with patch.object(model_generator, "_cached_type_string", side_effect=TypeError("unhashable")):
+            self.assertEqual("List[{Person}]", get_type_string(List[Person]))
+
+    def test_type_strings(self):
+        """Unions, literals and generic models are formatted"""
+        self.assertEqual("int or str", get_type_string(Union[int, str]))
+        self.assertEqual('"a"', get_type_string(Literal["a"]))
+        self.assertEqual('"a" or 1', get_type_string(Literal["a", 1]))
+        self.assertEqual("{Extra}", get_type_string(Extra))
+        self.assertIsNone(model_generator._handle_class_types("str"))
+        with patch.object(model_generator, "issubclass", side_effect=TypeError, create=True):
+            self.assertIsNone(model_generator._handle_class_types(Person))
+
+    def test_check_for_union(self):
+        """Pipes are replaced with 'or' and annotated unions are reduced to class names"""
+        self.assertEqual("List[float or str]", check_for_union("List[float | str]"))
+        self.assertEqual("float or str", check_for_union("float | str"))
+        self.assertEqual("List[{B} or {C}]", check_for_union("List[typing.Annotated[a.B | C, FieldInfo()"))
+        self.assertEqual("Annotated[int, x]", check_for_union("Annotated[int, x]"))
+
+    def test_deprecated_field(self):
+        """Deprecated fields are struck through"""
+        table = generate_markdown_table(Old, DataModel)
+        self.assertIn("<del>`value`</del>", table)
+        self.assertIn("**[DEPRECATED]** Use other. Value", table)
+
+
+class ModelDocsBuildCacheTests(unittest.TestCase):
+    """Tests for the model documentation build cache"""
+
+    def test_module_definition_hash(self):
+        """A module's hash covers the local modules it imports"""
+        base_hash = module_definition_hash(IDENTIFIERS_PATH, str(SRC_FOLDER))
+        self.assertEqual(base_hash, module_definition_hash(IDENTIFIERS_PATH, str(SRC_FOLDER)))
+        self.assertIn(
+            os.path.abspath(SRC_FOLDER / "aind_data_schema" / "base.py"),
+            model_generator.local_dependencies(str(IDENTIFIERS_PATH), str(SRC_FOLDER)),
+        )
+
+    def test_build_module_docs(self):
+        """Unchanged modules are skipped, stale files are removed and failures are not cached"""
+        with tempfile.TemporaryDirectory() as doc_folder:
+            args = ("aind_data_schema.components.identifiers", str(IDENTIFIERS_PATH), str(SRC_FOLDER), doc_folder)
+            entry = build_module_docs(*args)
+            self.assertIn("aind_data_schema/components/identifiers/Person.md", entry["files"])
+            self.assertIn("{Person}", entry["links"])
+
+            stale_file = Path(doc_folder) / "aind_data_schema" / "components" / "identifiers" / "Removed.md"
+            stale_file.write_text("removed model")
+            with patch.object(model_generator, "process_module") as process_module:
+                self.assertEqual(entry, build_module_docs(*args, cached=entry))
+                process_module.assert_not_called()
+
+            build_module_docs(*args, cached=dict(entry, key="outdated"))
+            self.assertFalse(stale_file.exists())
+
+            with patch.object(model_generator, "process_module", return_value=None):
+                self.assertIsNone(build_module_docs(*args)["key"])
+
+    def test_generate_model_docs(self):
+        """Modules removed from the source tree have their documentation removed"""
+        with tempfile.TemporaryDirectory() as doc_folder:
+            identifiers = ("aind_data_schema.components.identifiers", str(IDENTIFIERS_PATH))
+            removed_file = os.path.join("aind_data_schema", "removed", "Removed.md")
+            os.makedirs(os.path.join(doc_folder, "aind_data_schema", "removed"))
+            write_if_changed(os.path.join(doc_folder, removed_file), "removed model")
+            cache_file = os.path.join(doc_folder, ".build_cache", f"{BUILD_CACHE_NAME}.json")
+            os.makedirs(os.path.dirname(cache_file))
+            write_if_changed(cache_file, json.dumps({"aind_data_schema.removed": {"files": [removed_file]}}))
+
+            with patch.object(model_generator, "find_modules", return_value=[identifiers]):
+                model_link_map = generate_model_docs(str(SRC_FOLDER), doc_folder)
+
+            self.assertFalse(os.path.exists(os.path.join(doc_folder, removed_file)))
+            cache = load_build_cache(doc_folder, BUILD_CACHE_NAME)
+            self.assertEqual(["aind_data_schema.components.identifiers"], list(cache))
+            with open(os.path.join(doc_folder, "model_links.json"), "r") as f:
+                self.assertEqual(model_link_map, json.load(f))
+
+    def test_generate_model_docs_processes(self):
+        """Modules can be documented by a pool of worker processes"""
+        with tempfile.TemporaryDirectory() as doc_folder:
+            identifiers = ("aind_data_schema.components.identifiers", str(IDENTIFIERS_PATH))
+            with patch.object(model_generator, "find_modules", return_value=[identifiers]):
+                model_link_map = generate_model_docs(str(SRC_FOLDER), doc_folder, processes=2)
+            self.assertIn("{Person}", model_link_map)
+
+    def test_process_module(self):
+        """Generic models and enums are documented, modules that fail to load are skipped"""
+        with tempfile.TemporaryDirectory() as folder:
+            module_path = os.path.join(folder, "package", "models.py")
+            os.makedirs(os.path.dirname(module_path))
+            with open(module_path, "w") as f:
+                f.write(
+                    "from enum import Enum\n"
+                    "from aind_data_schema.base import _GenericModel\n"
+                    "class Extra(_GenericModel):\n    'Generic model'\n"
+                    "class Color(str, Enum):\n    'Colors'\n    RED = 'red'\n"
+                )
+            doc_folder = os.path.join(folder, "docs")
+            written = process_module("package.models", module_path, folder, doc_folder, {})
+            self.assertEqual(
+                [os.path.join("package", "models", "Color.md"), os.path.join("package", "models", "Extra.md")],
+                written,
+            )
+            with patch.object(model_generator, "issubclass", side_effect=TypeError, create=True):
+                self.assertEqual([], process_module("package.models", module_path, folder, doc_folder, {}))
+            with patch("builtins.print") as mock_print:
+                self.assertIsNone(process_module("package.missing", "missing.py", folder, doc_folder, {}))
+            mock_print.assert_called_once()
+
+    def test_find_modules(self):
+        """Every module is found except the generator itself"""
+        module_names = [name for name, _ in model_generator.find_modules(str(SRC_FOLDER))]
+        self.assertIn("aind_data_schema.core.subject", module_names)
+        self.assertNotIn("aind_data_schema.utils.docs.model_generator", module_names)
+
+
+class RegistryDocsBuildCacheTests(unittest.TestCase):
+    """Tests for the registry documentation build cache"""
+
+    def test_generate_registry_docs(self):
+        """Registries are rendered once and their links are kept on the next run"""
+        with tempfile.TemporaryDirectory() as doc_folder:
+            with patch.object(
+                registries_generator,
+                "registries",
+                [registries_generator.AtlasName, registries_generator.Organization, registries_generator.PIDName],
+            ):
+                registries_generator.generate_registry_docs(doc_folder)
+                with patch.object(registries_generator, "render_registry") as render_registry:
+                    registries_generator.generate_registry_docs(doc_folder)
+                    render_registry.assert_not_called()
+
+            with open(os.path.join(doc_folder, "model_links.json"), "r") as f:
+                self.assertEqual(3, len(json.load(f)))
+
+    def test_default_folder_and_errors(self):
+        """Registries are documented in docs/base/models by default, and a failing registry is skipped"""
+        with (
+            patch.object(registries_generator, "registries", [registries_generator.AtlasName]),
+            patch.object(registries_generator, "render_registry", side_effect=ValueError("bad")),
+            patch.object(registries_generator, "load_build_cache", return_value={}) as load_build_cache,
+            patch.object(registries_generator, "save_build_cache"),
+            patch.object(registries_generator, "update_model_links") as update_model_links,
+            patch("builtins.print") as mock_print,
+        ):
+            registries_generator.generate_registry_docs()
+        doc_folder = load_build_cache.call_args.args[0]
+        self.assertTrue(doc_folder.endswith(os.path.join("docs", "base", "models")))
+        update_model_links.assert_called_once_with(doc_folder, {})
+        mock_print.assert_any_call("Error processing registry AtlasName: bad")
+
+    def test_unknown_registry(self):
+        """Registries of an unknown type are skipped"""
+        with tempfile.TemporaryDirectory() as doc_folder:
+            with patch.object(registries_generator, "registries", [Unknown]), patch("builtins.print") as mock_print:
+                registries_generator.generate_registry_docs(doc_folder)
+            mock_print.assert_any_call("Unknown registry type for Unknown")
+            self.assertEqual([".build_cache", "model_links.json"], sorted(os.listdir(doc_folder)))
+
+
+class RegistryTablesTests(unittest.TestCase):
+    """Tests for the registry table helpers"""
+
+    def test_model_instance_table(self):
+        """Registries without instances only get a header, registry values link to the registries page"""
+        with patch("builtins.print") as mock_print:
+            self.assertEqual(
+                "### Unknown\n\nRegistry without instances\n\n",
+                registries_generator.generate_model_instance_table(Unknown),
+            )
+        mock_print.assert_called_once()
+
+        instance = SimpleNamespace(abbreviation="AI", registry="ROR")
+        self.assertEqual(
+            ["name", "abbreviation", "registry"],
+            registries_generator.ensure_organization_fields(["name"], [("AI", instance)]),
+        )
+        table = registries_generator.create_table_structure(["registry"], [("AI", instance)])
+        self.assertIn("| `AI` | [ROR](aind_data_schema_models/registries.md#registry) |", table)
+
+    def test_model_schema_table(self):
+        """Schema tables describe each field, models without fields only get a header"""
+
+        class Empty(BaseModel):
+            """Model without fields"""
+
+        class Described(BaseModel):
+            """Model with a described field"""
+
+            value: int = Field(description="A value")
+
+        with patch("builtins.print") as mock_print:
+            self.assertNotIn("| Field |", registries_generator.generate_model_schema_table(Empty))
+            self.assertNotIn("| Field |", registries_generator.generate_model_schema_table(Enum))
+        self.assertEqual(2, mock_print.call_count)
+        self.assertIn("| `value` | `int` | A value |", registries_generator.generate_model_schema_table(Described))
+
+    def test_detect_registry_type(self):
+        """Registries that can't be checked as subclasses are still detected"""
+        with patch.object(registries_generator, "issubclass", side_effect=TypeError, create=True):
+            self.assertEqual(
+                "model_instance", registries_generator.detect_registry_type(registries_generator.Organization)
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
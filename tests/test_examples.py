@@ -6,8 +6,9 @@ import unittest
 import tempfile
 import shutil
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
-from aind_data_schema.utils.examples_generator import ExamplesGenerator
+from aind_data_schema.utils.examples_generator import MANIFEST_FILENAME, ExamplesGenerator
 
 EXAMPLES_DIR = Path(__file__).parents[1] / "examples"
 
@@ -43,5 +44,57 @@ class ExampleTests(unittest.TestCase):
                 self.assertIsInstance(json_data, dict, f"{example_file} does not contain valid JSON.")
 
 
+class ExamplesGeneratorTests(unittest.TestCase):
+    """tests for ExamplesGenerator modes"""
+
+    def setUp(self):
+        """Generate two examples into a temporary directory"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_path = Path(self.temp_dir.name)
+        self.example_files = [str(EXAMPLES_DIR / "subject.py"), str(EXAMPLES_DIR / "data_description.py")]
+        self.patcher = patch.object(ExamplesGenerator, "get_example_files", return_value=self.example_files)
+        self.patcher.start()
+        ExamplesGenerator().generate_all_examples(output_directory=self.temp_path)
+
+    def tearDown(self):
+        """Remove the temporary directory"""
+        self.patcher.stop()
+        self.temp_dir.cleanup()
+
+    @patch("aind_data_schema.utils.examples_generator.run_example_in_process")
+    def test_skip_unchanged(self, mock_run: MagicMock):
+        """Examples are only rerun when their output is missing or modified"""
+        self.assertTrue((self.temp_path / MANIFEST_FILENAME).exists())
+        ExamplesGenerator().generate_all_examples(output_directory=self.temp_path)
+        mock_run.assert_not_called()
+
+        with open(self.temp_path / "subject.json", "a") as f:
+            f.write(" ")
+        ExamplesGenerator().generate_all_examples(output_directory=self.temp_path)
+        mock_run.assert_called_once_with(self.example_files[0], self.temp_path)
+
+        mock_run.reset_mock()
+        ExamplesGenerator(skip_unchanged=False).generate_all_examples(output_directory=self.temp_path)
+        self.assertEqual(2, mock_run.call_count)
+
+    @patch("subprocess.run")
+    def test_subprocess(self, mock_run: MagicMock):
+        """Examples can still run in a new python process"""
+        ExamplesGenerator(in_process=False).generate_example("example.py", self.temp_path)
+        mock_run.assert_called_once_with(["python", "example.py", "--output-dir", str(self.temp_path)], check=True)
+
+        mock_run.reset_mock()
+        ExamplesGenerator(in_process=False).generate_example("example.py")
+        mock_run.assert_called_once_with(["python", "example.py"], check=True)
+
+    def test_process_pool(self):
+        """Examples run in a pool of worker processes"""
+        os.remove(self.temp_path / "subject.json")
+        os.remove(self.temp_path / "data_description.json")
+        ExamplesGenerator(processes=2, skip_unchanged=False).generate_all_examples(output_directory=self.temp_path)
+        self.assertTrue((self.temp_path / "subject.json").exists())
+        self.assertTrue((self.temp_path / "data_description.json").exists())
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,53 @@
+"""Tests for import-time behavior"""
+
+import json
+import subprocess
+import sys
+import unittest
+
+
+def run_in_subprocess(code: str) -> dict:
+    """Run code in a fresh interpreter and return the JSON object it prints"""
+    output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True)
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+class ImportTimeTests(unittest.TestCase):
+    """Tests that importing the package stays cheap"""
+
+    def test_deferred_schema_build(self):
+        """Importing metadata does not build model schemas, the first validation does"""
+        result = run_in_subprocess("""
+import json
+from aind_data_schema.core.metadata import Metadata
+from aind_data_schema.core.instrument import Instrument
+from aind_data_schema.core.data_description import DataDescription
+from aind_data_schema.components.devices import Laser
+deferred = [Metadata.__pydantic_complete__, Instrument.__pydantic_complete__, Laser.__pydantic_complete__]
+DataDescription.model_json_schema()
+print(json.dumps({
+    "deferred": deferred,
+    "built": DataDescription.__pydantic_complete__,
+    "instrument_after": Instrument.__pydantic_complete__,
+}))
+""")
+        self.assertEqual(result["deferred"], [False, False, False])
+        self.assertTrue(result["built"])
+        self.assertFalse(result["instrument_after"])
+
+    def test_model_construct(self):
+        """Instances created without validation build their class, so they serialize inside other models"""
+        result = run_in_subprocess("""
+import json
+from aind_data_schema.components.devices import Laser
+from aind_data_schema.core.instrument import Instrument
+laser = Laser.model_construct(name="Laser", wavelength=488)
+instrument = Instrument.model_construct(instrument_id="instrument", components=[laser])
+components = json.loads(instrument.model_dump_json())["components"]
+print(json.dumps({"built": Laser.__pydantic_complete__, "name": components[0]["name"]}))
+""")
+        self.assertEqual({"built": True, "name": "Laser"}, result)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+"""Tests for reading selected fields of JSON documents"""
+
+import json
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from aind_data_schema.core.data_description import DataDescription
+from aind_data_schema.core.metadata import Metadata
+from aind_data_schema.utils.json_projection import field_adapter, read_json_paths
+from examples.data_description import d as data_description
+from examples.ephys_acquisition import acquisition
+from examples.ephys_instrument import inst as instrument
+
+DOCUMENT = {
+    "name": "asset",
+    'escaped "key"': "value with } and ]",
+    "list": [{"a": [1, {"b": "}"}]}, "x"],
+    "empty": {},
+    "nested": {"first": 1, "inner": {"value": True, "other": None}, "last": [1.5, -2e3]},
+    "null": None,
+}
+
+
+class ReadJsonPathsTests(unittest.TestCase):
+    """Tests for read_json_paths"""
+
+    def test_paths(self):
+        """Values are read at any depth, around strings, lists and escapes that contain brackets"""
+        for indent in (None, 3):
+            text = json.dumps(DOCUMENT, indent=indent)
+            self.assertEqual(
+                {
+                    'escaped "key"': "value with } and ]",
+                    "nested.inner.value": True,
+                    "nested.last": [1.5, -2e3],
+                    "empty": {},
+                },
+                read_json_paths(text, ['escaped "key"', "nested.inner.value", "nested.last", "empty"]),
+            )
+
+    def test_missing_paths(self):
+        """Missing paths, and paths through values that aren't objects, are None"""
+        text = json.dumps(DOCUMENT)
+        self.assertEqual(
+            {"missing": None, "null.value": None, "list.a": None, "empty.value": None, "nested.missing": None},
+            read_json_paths(text, ["missing", "null.value", "list.a", "empty.value", "nested.missing"]),
+        )
+
+    def test_overlapping_paths(self):
+        """A path inside another requested path is read from the enclosing value"""
+        text = json.dumps(DOCUMENT)
+        for paths in (["nested.inner.value", "nested"], ["nested", "nested.inner.value", "nested.inner.value"]):
+            values = read_json_paths(text, paths)
+            self.assertEqual(DOCUMENT["nested"], values["nested"])
+            self.assertTrue(values["nested.inner.value"])
+
+    def test_stops_when_found(self):
+        """Reading stops once every path is found, so later content is not parsed"""
+        self.assertEqual({"name": "asset"}, read_json_paths('{"name": "asset", "rest": [not json', ["name"]))
+        with self.assertRaises(ValueError):
+            read_json_paths('{"name" "asset"}', ["name"])
+        with self.assertRaises(ValueError):
+            read_json_paths('{"name": "asset" "rest": 1}', ["rest"])
+        with self.assertRaises(ValueError):
+            read_json_paths("{name: 1}", ["name"])
+
+
+class LoadFieldsTests(unittest.TestCase):
+    """Tests for DataCoreModel.load_fields"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Write a metadata file"""
+        cls.folder = tempfile.TemporaryDirectory()
+        cls.path = Path(cls.folder.name) / "metadata.nd.json"
+        document = {"name": "asset", "location": "s3://bucket/asset"}
+        for key, model in (
+            ("instrument", instrument),
+            ("acquisition", acquisition),
+            ("data_description", data_description),
+        ):
+            document[key] = json.loads(model.model_dump_json())
+        cls.path.write_text(json.dumps(document, indent=3))
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the metadata file"""
+        cls.folder.cleanup()
+
+    def test_load_fields(self):
+        """Values are validated against their field types"""
+        values = Metadata.load_fields(
+            self.path,
+            ["data_description.modalities", "acquisition.acquisition_start_time", "name", "subject.subject_id"],
+        )
+        self.assertEqual(data_description.modalities, values["data_description.modalities"])
+        self.assertIsInstance(values["acquisition.acquisition_start_time"], datetime)
+        self.assertEqual(acquisition.acquisition_start_time, values["acquisition.acquisition_start_time"])
+        self.assertEqual("asset", values["name"])
+        self.assertIsNone(values["subject.subject_id"])
+
+        raw = Metadata.load_fields(self.path, ["acquisition.acquisition_start_time"], validate=False)
+        self.assertIsInstance(raw["acquisition.acquisition_start_time"], str)
+
+    def test_field_adapter(self):
+        """Constraints are enforced and paths must go through single model fields"""
+        with self.assertRaises(ValidationError):
+            field_adapter(DataDescription, "subject_id").validate_python("has_underscores")
+        with self.assertRaises(ValueError):
+            field_adapter(Metadata, "acquisition.data_streams.modalities")
+        with self.assertRaises(ValueError):
+            field_adapter(Metadata, "acquisition.missing")
+        with self.assertRaises(ValueError):
+            field_adapter(Metadata, "missing.field")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,11 +2,21 @@
 
 import json
 import os
+import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import MagicMock, call, mock_open, patch
 
-from aind_data_schema.utils.json_writer import SchemaWriter
+from aind_data_schema.core.model import Model
+from aind_data_schema.core.processing import Processing
+from aind_data_schema.utils import json_writer
+from aind_data_schema.utils.json_writer import (
+    SchemaWriter,
+    _generate_schemas_from_paths,
+    generate_schemas,
+    get_json_schemas,
+    model_definitions_hash,
+)
 
 
 class SchemaWriterTests(unittest.TestCase):
@@ -38,6 +48,15 @@ class SchemaWriterTests(unittest.TestCase):
         self.assertEqual(expected_output, sw.configs.output)
         self.assertEqual(self.TEST_ARGS, sw.args)
         self.assertEqual(os.getcwd(), sw2.configs.output)
+        self.assertEqual(1, sw2.configs.processes)
+        self.assertIsNone(sw2.configs.cache_dir)
+
+    def test_parse_args_split(self):
+        """--split writes shared definitions directly, without the process pool or the cache"""
+        self.assertTrue(SchemaWriter(["--split"]).configs.split)
+        for args in (["--processes", "2"], ["--cache-dir", "cache"]):
+            with self.subTest(args=args), patch("sys.stderr"), self.assertRaises(SystemExit):
+                SchemaWriter(["--split", *args])
 
     @patch("builtins.open", new_callable=mock_open())
     @patch("os.path.exists")
@@ -108,5 +127,69 @@ class SchemaWriterTests(unittest.TestCase):
         file_handle.write.assert_has_calls(write_calls, any_order=True)
 
 
+class SchemaCacheTests(unittest.TestCase):
+    """Tests for shared and cached schema generation"""
+
+    def setUp(self):
+        """Start every test with an empty in-memory cache"""
+        json_writer._SCHEMA_CACHE.clear()
+
+    def test_generate_schemas_matches_model_json_schema(self):
+        """Schemas generated with shared definitions match model_json_schema"""
+        models = list(SchemaWriter.get_schemas())
+        for model, schema in zip(models, generate_schemas(models)):
+            with self.subTest(model=model.__name__):
+                self.assertEqual(json.dumps(model.model_json_schema(), indent=3), json.dumps(schema, indent=3))
+
+    def test_generate_schemas_fallback(self):
+        """Pydantic versions SharedDefinitionsJsonSchema wasn't checked against use model_json_schema"""
+        with (
+            patch.object(json_writer.pydantic, "VERSION", "2.99.0"),
+            patch.object(json_writer.SharedDefinitionsJsonSchema, "generate") as generate,
+        ):
+            self.assertEqual([Model.model_json_schema()], generate_schemas([Model]))
+        generate.assert_not_called()
+
+    def test_generate_schemas_from_paths(self):
+        """Worker processes import models by path"""
+        schemas = _generate_schemas_from_paths(["aind_data_schema.core.model.Model"])
+        self.assertEqual([Model.model_json_schema()], schemas)
+
+    def test_memory_cache(self):
+        """Schemas are only generated once per process"""
+        first = get_json_schemas([Model, Processing])
+        with patch("aind_data_schema.utils.json_writer.generate_schemas") as mock_generate:
+            second = get_json_schemas([Processing, Model])
+        mock_generate.assert_not_called()
+        self.assertEqual(first, second)
+        self.assertEqual([Processing, Model], list(second.keys()))
+
+    def test_disk_cache(self):
+        """Schemas are persisted under the definitions hash and reused"""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            schemas = get_json_schemas([Model], cache_dir=cache_dir)
+            cache_file = Path(cache_dir) / model_definitions_hash() / "aind_data_schema.core.model.Model.json"
+            self.assertTrue(cache_file.exists())
+
+            json_writer._SCHEMA_CACHE.clear()
+            with patch("aind_data_schema.utils.json_writer.generate_schemas") as mock_generate:
+                cached = get_json_schemas([Model], cache_dir=cache_dir)
+            mock_generate.assert_not_called()
+            self.assertEqual(json.dumps(schemas[Model], indent=3), json.dumps(cached[Model], indent=3))
+
+    def test_definitions_hash_changes(self):
+        """The hash depends on the pydantic version"""
+        original = model_definitions_hash()
+        self.assertEqual(original, model_definitions_hash())
+        with patch("pydantic.VERSION", "0.0.0"):
+            self.assertNotEqual(original, model_definitions_hash())
+
+    def test_process_pool(self):
+        """Schemas generated in worker processes match model_json_schema"""
+        schemas = get_json_schemas([Model, Processing], processes=2)
+        self.assertEqual(Model.model_json_schema(), schemas[Model])
+        self.assertEqual(Processing.model_json_schema(), schemas[Processing])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,94 @@
+"""Tests for the data asset lineage index"""
+
+import json
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+from aind_data_schema_models.data_name_patterns import DataLevel
+from aind_data_schema_models.modalities import Modality
+from aind_data_schema_models.organizations import Organization
+
+from aind_data_schema.components.identifiers import Person
+from aind_data_schema.core.data_description import DataDescription, Funding
+from aind_data_schema.utils.lineage import LineageIndex
+
+RAW = "123456_2024-01-01_10-00-00"
+SORTED = f"{RAW}_sorted_2024-01-02_10-00-00"
+# Names of assets derived from derived assets keep the original input, see DataDescription.from_derived
+CURATED = f"{RAW}_curated_2024-01-03_10-00-00"
+OTHER_RAW = "654321_2024-01-01_10-00-00"
+
+
+class LineageIndexTests(unittest.TestCase):
+    """Tests for LineageIndex"""
+
+    def setUp(self):
+        """Index with a raw asset, a chain of derived assets and a combined asset"""
+        self.index = LineageIndex()
+        self.index.add_derived_names([RAW, SORTED])
+        self.index.add(CURATED, [SORTED])
+        self.index.add("combined", [CURATED, OTHER_RAW, CURATED])
+
+    def test_queries(self):
+        """Direct and transitive lineage in both directions"""
+        self.assertEqual(5, len(self.index))
+        self.assertIn(OTHER_RAW, self.index)
+        self.assertEqual([CURATED, OTHER_RAW], self.index.sources("combined"))
+        self.assertEqual([SORTED], self.index.derived(RAW))
+        self.assertEqual([CURATED, OTHER_RAW, SORTED, RAW], self.index.ancestors("combined"))
+        self.assertEqual([SORTED, CURATED, "combined"], self.index.descendants(RAW))
+        self.assertEqual([OTHER_RAW, RAW], self.index.roots("combined"))
+        self.assertEqual([], self.index.ancestors(RAW))
+
+    def test_updates_after_query(self):
+        """Assets added after a query are included in later queries"""
+        self.assertEqual([SORTED, CURATED, "combined"], self.index.descendants(RAW))
+        self.index.add("cycle", ["combined", "cycle"])
+        self.assertEqual([SORTED, CURATED, "combined", "cycle"], self.index.descendants(RAW))
+
+    def test_unknown_asset(self):
+        """Querying an asset that isn't indexed raises a KeyError"""
+        with self.assertRaises(KeyError):
+            self.index.ancestors("missing")
+
+    def test_data_descriptions(self):
+        """source_data is used when present, otherwise the input encoded in a derived name"""
+        raw = DataDescription(
+            creation_time=datetime(2024, 1, 1, 10),
+            institution=Organization.AIND,
+            data_level=DataLevel.RAW,
+            funding_source=[Funding(funder=Organization.NINDS)],
+            modalities=[Modality.ECEPHYS],
+            subject_id="123456",
+            investigators=[Person(name="Jane Smith")],
+            project_name="Test",
+        )
+        derived = DataDescription.from_raw(raw, "sorted", creation_time=datetime(2024, 1, 2, 10))
+        derived_without_sources = derived.model_copy(update={"source_data": None})
+        index = LineageIndex()
+        index.add_data_descriptions([raw, derived])
+        self.assertEqual([derived.name], index.descendants(raw.name))
+
+        index = LineageIndex()
+        index.add_data_descriptions([derived_without_sources])
+        self.assertEqual([raw.name], index.ancestors(derived.name))
+
+    def test_save_and_load(self):
+        """A saved index loads with the same lineage"""
+        with tempfile.TemporaryDirectory() as folder:
+            path = Path(folder) / "lineage.json"
+            self.index.save(path)
+            loaded = LineageIndex.load(path)
+            self.assertEqual(self.index.ancestors("combined"), loaded.ancestors("combined"))
+            self.assertEqual(self.index.descendants(RAW), loaded.descendants(RAW))
+
+            with open(path, "w") as f:
+                json.dump({"version": 0}, f)
+            with self.assertRaises(ValueError):
+                LineageIndex.load(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
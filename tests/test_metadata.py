@@ -4,6 +4,7 @@ import json
 import unittest
 import warnings
 from datetime import datetime, timezone
+from unittest.mock import patch
 
 from aind_data_schema_models.modalities import Modality
 from aind_data_schema_models.organizations import Organization
@@ -20,7 +21,7 @@ from aind_data_schema.core.data_description import DataDescription, Funding
 from aind_data_schema_models.data_name_patterns import DataLevel
 from aind_data_schema.components.connections import Connection
 from aind_data_schema.core.instrument import Instrument
-from aind_data_schema.core.metadata import Metadata, create_metadata_json
+from aind_data_schema.core.metadata import CrossFileContext, Metadata, create_metadata_json
 from aind_data_schema.core.procedures import Procedures, Surgery
 from aind_data_schema.core.processing import DataProcess, Processing, ProcessName, ProcessStage
 from aind_data_schema.core.subject import Subject
@@ -483,6 +484,47 @@ class TestMetadata(unittest.TestCase):
             str(context.exception),
         )
 
+    def test_cross_file_context(self):
+        """The data shared by the cross-file validators is collected once per validation"""
+        instrument = Instrument.model_construct(
+            instrument_id="Test",
+            components=[EphysProbe.model_construct(name="Probe A"), Laser.model_construct(name="Laser A")],
+            modalities=[],
+        )
+        acquisition = Acquisition.model_construct(
+            instrument_id="Test",
+            acquisition_start_time=datetime(2023, 10, 3, 12, 0, 0, tzinfo=timezone.utc),
+            data_streams=[
+                DataStream.model_construct(
+                    active_devices=["Probe A", "Laser A"],
+                    modalities=[],
+                    configurations=[],
+                    connections=[Connection(source_device="Probe A", target_device="Laser A")],
+                ),
+            ],
+            subject_details=AcquisitionSubjectDetails.model_construct(),
+        )
+        with patch("aind_data_schema.core.metadata.CrossFileContext", wraps=CrossFileContext) as context_class:
+            metadata = Metadata(
+                name="Test Metadata",
+                location="Test Location",
+                subject=subject,
+                instrument=instrument,
+                acquisition=acquisition,
+            )
+        self.assertEqual(1, context_class.call_count)
+        self.assertIsNone(metadata._cross_file_context)
+
+        # Outside validation, each call collects the data again
+        context = metadata.cross_file_context()
+        self.assertEqual({"Probe A", "Laser A", "Test"}, context.device_names)
+        self.assertEqual(["Probe A", "Laser A"], context.active_devices)
+        self.assertEqual(1, len(context.connections))
+        self.assertEqual(datetime(2023, 10, 3, 12, 0, 0, tzinfo=timezone.utc), context.acquisition_start_time)
+        self.assertEqual(set(), context.modalities)
+        self.assertEqual([], context.procedures_of_type(TrainingProtocol, subject=True))
+        self.assertIsNot(context, metadata.cross_file_context())
+
     def test_validate_training_protocol_references(self):
         """Tests that training protocol references are validated correctly."""
 
@@ -0,0 +1,205 @@
+"""Tests for the schema migration registry"""
+
+import json
+import os
+import tempfile
+import unittest
+import warnings
+from pathlib import Path
+
+from aind_data_schema.core.instrument import Instrument
+from aind_data_schema.core.metadata import Metadata
+from aind_data_schema.core.procedures import Procedures
+from aind_data_schema.core.quality_control import QualityControl
+from aind_data_schema.core.subject import Subject
+from aind_data_schema.utils.migrations import (
+    MIGRATIONS,
+    MigrationRegistry,
+    _quality_control_tag_dicts,
+    current_version,
+    parse_version,
+    upgrade_file,
+    upgrade_files,
+)
+
+QC_VERSION = current_version(QualityControl)
+
+
+def legacy_quality_control() -> dict:
+    """Quality control document in the v2.2 format, with tags as lists"""
+    return {
+        "object_type": "Quality control",
+        "schema_version": "2.2.1",
+        "metrics": [
+            {
+                "object_type": "QC metric",
+                "name": "Old format metric",
+                "modality": {"name": "Extracellular electrophysiology", "abbreviation": "ecephys"},
+                "stage": "Processing",
+                "value": 42,
+                "status_history": [{"evaluator": "Test", "timestamp": "2020-10-10", "status": "Pass"}],
+                "tags": ["old_tag1", "old_tag2"],
+            }
+        ],
+        "default_grouping": ["group1", "group2"],
+    }
+
+
+class MigrationRegistryTests(unittest.TestCase):
+    """Tests for MigrationRegistry"""
+
+    def test_parse_version(self):
+        """Versions compare as tuples of ints"""
+        self.assertLess(parse_version("2.9.0"), parse_version("2.10.0"))
+        with self.assertRaises(ValueError):
+            parse_version(None)
+        with self.assertRaises(ValueError):
+            parse_version("2.x.0")
+
+    def test_compose(self):
+        """Migrations run in version order, only for the versions a document is older than"""
+        registry = MigrationRegistry()
+        calls = []
+        registry.register(Subject, "2.1.0", "2.2.0")(lambda document: calls.append("2.1") or document)
+        registry.register(Subject, "2.0.0", "2.1.0")(lambda document: calls.append("2.0") or document)
+        with self.assertRaises(ValueError):
+            registry.register(Subject, "2.2.0", "2.2.0")
+
+        document = registry.upgrade(Subject, {"schema_version": "2.0.5"})
+        self.assertEqual(["2.0", "2.1"], calls)
+        self.assertEqual(current_version(Subject), document["schema_version"])
+
+        calls.clear()
+        registry.upgrade(Subject, {"schema_version": "2.1.3"})
+        registry.upgrade(Subject, {"schema_version": current_version(Subject)})
+        self.assertEqual(["2.1"], calls)
+        self.assertEqual([m.from_version for m in registry.migrations(Subject)], ["2.0.0", "2.1.0"])
+
+    def test_plan_errors(self):
+        """Newer versions and older major versions can't be upgraded"""
+        with self.assertRaises(ValueError):
+            MIGRATIONS.plan(Subject, "99.0.0")
+        with self.assertRaises(ValueError):
+            MIGRATIONS.plan(Subject, "1.0.3")
+
+    def test_quality_control(self):
+        """Legacy quality control documents validate without running the legacy shims"""
+        document = MIGRATIONS.upgrade(QualityControl, legacy_quality_control())
+        self.assertEqual(QC_VERSION, document["schema_version"])
+        self.assertEqual([["modality"], ["tag_1"]], document["default_grouping"])
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", DeprecationWarning)
+            quality_control = QualityControl.model_validate(document)
+        self.assertEqual({"tag_1": "old_tag1", "tag_2": "old_tag2"}, quality_control.metrics[0].tags)
+
+    def test_quality_control_2_1(self):
+        """Quality control documents older than 2.2 are migrated too"""
+        document = dict(legacy_quality_control(), schema_version="2.1.0")
+        document = MIGRATIONS.upgrade(QualityControl, document)
+        self.assertEqual(QC_VERSION, document["schema_version"])
+        self.assertEqual({"tag_1": "old_tag1", "tag_2": "old_tag2"}, document["metrics"][0]["tags"])
+
+    def test_component_migrations(self):
+        """Renamed and replaced component fields are moved to their new place"""
+        instrument = {
+            "object_type": "Instrument",
+            "schema_version": "2.0.0",
+            "components": [{"channels": [{"object_type": "DAQ channel", "channel_index": 3}]}],
+        }
+        channel = MIGRATIONS.upgrade(Instrument, instrument)["components"][0]["channels"][0]
+        self.assertEqual({"object_type": "DAQ channel", "port": 3}, channel)
+
+        sections = [
+            {"object_type": "Section", "coordinate_system_name": "BREGMA", "start_coordinate": {}, "thickness": 1},
+            {"object_type": "Section", "coordinate_system_name": "BREGMA", "start_coordinate": {}},
+        ]
+        procedures = MIGRATIONS.upgrade(Procedures, {"schema_version": "2.0.0", "sections": sections})
+        self.assertEqual(["Planar section", "Section"], [s["object_type"] for s in procedures["sections"]])
+
+    def test_upgrade_document(self):
+        """Core files inside a Metadata document are upgraded with it"""
+        document = {
+            "object_type": "Metadata",
+            "schema_version": current_version(Metadata),
+            "quality_control": legacy_quality_control(),
+            "acquisition": {
+                "schema_version": "2.0.0",
+                "stimulus_epochs": [{"code": {"parameters": {"sitmulus_name": "tone"}}}],
+            },
+        }
+        self.assertEqual((current_version(Metadata),) * 2, MIGRATIONS.upgrade_document(document))
+        self.assertEqual(QC_VERSION, document["quality_control"]["schema_version"])
+        self.assertEqual({"stimulus_name": "tone"}, document["acquisition"]["stimulus_epochs"][0]["code"]["parameters"])
+        self.assertIsNone(MIGRATIONS.upgrade_document({"object_type": "QC metric"}))
+        self.assertIsNone(MIGRATIONS.upgrade_document([]))
+
+
+class UpgradeFilesTests(unittest.TestCase):
+    """Tests for upgrading files of an archive"""
+
+    def setUp(self):
+        """Folder with a legacy file, a current file and a file that isn't a core document"""
+        self.folder = tempfile.TemporaryDirectory()
+        self.addCleanup(self.folder.cleanup)
+        folder = Path(self.folder.name)
+        self.legacy, self.current, self.other = folder / "legacy.json", folder / "current.json", folder / "other.json"
+        self.legacy.write_text(json.dumps(legacy_quality_control()))
+        self.current.write_text(json.dumps({"object_type": "Quality control", "schema_version": QC_VERSION}))
+        self.other.write_text(json.dumps({"name": "not a core file"}))
+        for path in (self.current, self.other):
+            os.utime(path, (0, 0))
+
+    def test_upgrade_file(self):
+        """Only files that changed are written"""
+        self.assertEqual((str(self.legacy), "2.2.1", QC_VERSION, None), upgrade_file(self.legacy))
+        self.assertEqual(QC_VERSION, json.loads(self.legacy.read_text())["schema_version"])
+        self.assertEqual((str(self.current), QC_VERSION, QC_VERSION, None), upgrade_file(self.current))
+        self.assertEqual((str(self.other), None, None, None), upgrade_file(self.other))
+        self.assertEqual(0, os.path.getmtime(self.current))
+        self.assertEqual(0, os.path.getmtime(self.other))
+
+    def test_upgrade_files(self):
+        """Files are upgraded in batches, in this process or in a process pool"""
+        paths = [self.legacy, self.current, self.other]
+        results = list(upgrade_files(iter(paths), batch_size=2))
+        self.assertEqual([str(path) for path in paths], [result[0] for result in results])
+        self.assertEqual("2.2.1", results[0][1])
+
+        results = list(upgrade_files(paths * 3, processes=2, batch_size=1))
+        self.assertEqual([str(path) for path in paths] * 3, [result[0] for result in results])
+        self.assertEqual(
+            [QC_VERSION] * 6, [result.version_before for result in results if result.version_before is not None]
+        )
+
+    def test_failed_files(self):
+        """Files that can't be read or upgraded are reported and don't stop the other files"""
+        folder = Path(self.folder.name)
+        unversioned, invalid, missing = folder / "unversioned.json", folder / "invalid.json", folder / "missing.json"
+        unversioned.write_text(json.dumps({"object_type": "Quality control"}))
+        invalid.write_text("{not json")
+        paths = [unversioned, self.legacy, invalid, missing, self.current]
+        for processes in (1, 2):
+            results = list(upgrade_files(paths, processes=processes, batch_size=2))
+            self.assertEqual([str(path) for path in paths], [result.path for result in results])
+            self.assertEqual([QC_VERSION] * 2, [result.version_after for result in results if result.error is None])
+            self.assertIn("Invalid schema version None", results[0].error)
+            self.assertIn("JSONDecodeError", results[2].error)
+            self.assertIn("FileNotFoundError", results[3].error)
+        self.assertEqual("{not json", invalid.read_text())
+        folder.joinpath("list.json").write_text("[]")
+        self.assertEqual((str(folder / "list.json"), None, None, None), upgrade_file(folder / "list.json"))
+
+    def test_registry_in_workers(self):
+        """Registries with module level functions can be sent to worker processes"""
+        registry = MigrationRegistry()
+        registry.register(QualityControl, "2.2.0", "2.3.0")(_quality_control_tag_dicts)
+        results = list(upgrade_files([self.legacy], processes=2, registry=registry))
+        self.assertEqual([(str(self.legacy), "2.2.1", QC_VERSION, None)], results)
+        self.assertEqual(
+            {"tag_1": "old_tag1", "tag_2": "old_tag2"}, json.loads(self.legacy.read_text())["metrics"][0]["tags"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
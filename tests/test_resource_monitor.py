@@ -0,0 +1,182 @@
+"""Tests for the resource monitor"""
+
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from aind_data_schema_models.system_architecture import CPUArchitecture, OperatingSystem
+from aind_data_schema_models.units import MemoryUnit
+
+from aind_data_schema.core.processing import ResourceUsage
+from aind_data_schema.utils.resource_monitor import (
+    ResourceMonitor,
+    detect_architecture,
+    detect_cpu_name,
+    detect_os,
+    read_cgroup_limits,
+)
+
+
+def _write(root: Path, relative: str, contents: str) -> None:
+    """Write a file below root, creating parent directories"""
+    path = root / relative
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(contents)
+
+
+def _fake_proc(root: Path, pid: int, ticks: int, rss_pages: int) -> None:
+    """Write a minimal procfs for one process"""
+    _write(root, "meminfo", "MemTotal:       4194304 kB\nMemFree:        1024 kB\n")
+    _write(root, "cpuinfo", "processor\t: 0\nmodel name\t: Test CPU @ 3.0GHz\n")
+    stat_fields = ["S"] + ["0"] * 10 + [str(ticks), "0"] + ["0"] * 30
+    _write(root, f"{pid}/stat", f"{pid} (my proc (x)) " + " ".join(stat_fields))
+    _write(root, f"{pid}/statm", f"1000 {rss_pages} 0 0 0 0 0")
+
+
+class ResourceMonitorTests(unittest.TestCase):
+    """Tests for ResourceMonitor"""
+
+    def setUp(self):
+        """Create temporary proc and cgroup roots"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.proc_root = Path(self.tmp.name) / "proc"
+        self.cgroup_root = Path(self.tmp.name) / "cgroup"
+        self.cgroup_root.mkdir()
+
+    def tearDown(self):
+        """Remove temporary directories"""
+        self.tmp.cleanup()
+
+    def test_live_process(self):
+        """Sampling the current process produces a valid ResourceUsage"""
+        with ResourceMonitor(interval=0.01) as monitor:
+            deadline = time.monotonic() + 0.1
+            while time.monotonic() < deadline:
+                pass
+
+        usage = monitor.resource_usage
+        self.assertIsInstance(usage, ResourceUsage)
+        self.assertGreater(len(usage.cpu_usage), 1)
+        self.assertEqual(len(usage.cpu_usage), len(usage.ram_usage))
+        self.assertTrue(all(sample.usage >= 0 for sample in usage.cpu_usage))
+        self.assertGreater(usage.ram_usage[-1].usage, 0)
+        self.assertGreater(monitor.overhead, 0)
+        self.assertLess(monitor.overhead, 0.5)
+
+    def test_fake_proc(self):
+        """CPU and RAM percentages are computed relative to capacity"""
+        pid = 42
+        _fake_proc(self.proc_root, pid, ticks=0, rss_pages=1)
+        monitor = ResourceMonitor(pid=pid, proc_root=self.proc_root, cgroup_root=self.cgroup_root)
+        monitor.cpu_capacity = 1.0
+        monitor._page_size = 1024
+
+        with patch("aind_data_schema.utils.resource_monitor.time.monotonic", side_effect=[0.0, 1.0]):
+            monitor.sample()
+            _fake_proc(self.proc_root, pid, ticks=monitor._clock_ticks // 2, rss_pages=1024)
+            monitor.sample()
+
+        self.assertAlmostEqual(monitor.cpu_samples[0], 50.0)
+        self.assertAlmostEqual(monitor.ram_samples[0], 100 * 1024 * 1024 / (4194304 * 1024))
+
+        usage = monitor.resource_usage
+        self.assertEqual(usage.cpu, "Test CPU @ 3.0GHz")
+        self.assertEqual(usage.system_memory, 4.0)
+        self.assertEqual(usage.system_memory_unit, MemoryUnit.GB)
+        self.assertIsNone(usage.ram)
+
+    def test_downsampling(self):
+        """The buffer never exceeds max_samples and the interval grows"""
+        monitor = ResourceMonitor(interval=0.001, max_samples=4)
+        for _ in range(20):
+            monitor.sample()
+
+        self.assertLessEqual(len(monitor.timestamps), 4)
+        self.assertEqual(len(monitor.timestamps), len(monitor.cpu_samples))
+        self.assertGreater(monitor._stride, 1)
+        self.assertEqual(monitor.timestamps, sorted(monitor.timestamps))
+
+    def test_unreadable_process(self):
+        """A process that cannot be read yields an empty series"""
+        self.proc_root.mkdir()
+        monitor = ResourceMonitor(pid=1, interval=0.01, proc_root=self.proc_root, cgroup_root=self.cgroup_root)
+        with self.assertLogs("aind_data_schema.utils.resource_monitor", level="WARNING"):
+            with monitor:
+                pass
+
+        usage = monitor.resource_usage
+        self.assertIsNone(usage.cpu_usage)
+        self.assertIsNone(usage.system_memory)
+        self.assertEqual(monitor.stop(), usage)
+
+    def test_overhead_before_start(self):
+        """Overhead is zero before sampling starts"""
+        monitor = ResourceMonitor()
+        self.assertEqual(monitor.overhead, 0.0)
+        monitor._start_time = time.monotonic() + 1
+        monitor._end_time = monitor._start_time
+        self.assertEqual(monitor.overhead, 0.0)
+
+    def test_invalid_arguments(self):
+        """Invalid sampling settings are rejected"""
+        with self.assertRaises(ValueError):
+            ResourceMonitor(interval=0)
+        with self.assertRaises(ValueError):
+            ResourceMonitor(max_samples=1)
+
+    def test_cgroup_v2_limits(self):
+        """cgroup v2 limits bound the capacity"""
+        _write(self.cgroup_root, "cpu.max", "50000 100000\n")
+        _write(self.cgroup_root, "memory.max", str(1024**3) + "\n")
+        self.assertEqual(read_cgroup_limits(self.cgroup_root), (0.5, 1024**3))
+
+        monitor = ResourceMonitor(cgroup_root=self.cgroup_root)
+        self.assertEqual(monitor.cpu_capacity, 0.5)
+        self.assertEqual(monitor.resource_usage.ram, 1.0)
+
+        monitor = ResourceMonitor(cgroup_root=self.cgroup_root, include_cgroup_limits=False)
+        self.assertEqual(monitor.cpu_capacity, os.cpu_count())
+
+        _write(self.cgroup_root, "cpu.max", "max 100000\n")
+        _write(self.cgroup_root, "memory.max", "max\n")
+        self.assertEqual(read_cgroup_limits(self.cgroup_root), (None, None))
+
+    def test_cgroup_v1_limits(self):
+        """cgroup v1 limits are read, and unlimited values are ignored"""
+        _write(self.cgroup_root, "cpu/cpu.cfs_quota_us", "200000\n")
+        _write(self.cgroup_root, "cpu/cpu.cfs_period_us", "100000\n")
+        _write(self.cgroup_root, "memory/memory.limit_in_bytes", str(2 * 1024**3))
+        self.assertEqual(read_cgroup_limits(self.cgroup_root), (2.0, 2 * 1024**3))
+
+        _write(self.cgroup_root, "cpu/cpu.cfs_quota_us", "-1\n")
+        _write(self.cgroup_root, "memory/memory.limit_in_bytes", "9223372036854771712")
+        self.assertEqual(read_cgroup_limits(self.cgroup_root), (None, None))
+
+    def test_detect_platform(self):
+        """Platform detection maps onto the schema enums"""
+        release = {"NAME": "Ubuntu", "VERSION_ID": "22.04", "PRETTY_NAME": "Ubuntu 22.04.4 LTS"}
+        with patch("platform.freedesktop_os_release", return_value=release):
+            self.assertEqual(detect_os(), OperatingSystem.UBUNTU_22_04.value)
+        with patch("platform.freedesktop_os_release", return_value={"PRETTY_NAME": "Other Linux"}):
+            self.assertEqual(detect_os(), "Other Linux")
+        with (
+            patch("platform.freedesktop_os_release", side_effect=OSError),
+            patch("platform.platform", return_value="Darwin-23"),
+        ):
+            self.assertEqual(detect_os(), "Darwin-23")
+
+        with patch("platform.machine", return_value="aarch64"):
+            self.assertEqual(detect_architecture(), CPUArchitecture.ARM64.value)
+        with patch("platform.machine", return_value="sparc"):
+            self.assertEqual(detect_architecture(), "sparc")
+
+        self.proc_root.mkdir()
+        with patch("platform.processor", return_value=""):
+            self.assertIsNone(detect_cpu_name(self.proc_root))
+
+
+if __name__ == "__main__":
+    unittest.main()
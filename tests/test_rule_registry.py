@@ -0,0 +1,92 @@
+"""Tests for the modality and core file rule registry"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from aind_data_schema_models.modalities import Modality
+
+from aind_data_schema.core.metadata import METADATA_RULES, Metadata, validate_injection_materials
+from aind_data_schema.utils.rule_registry import RuleRegistry
+
+
+class RuleRegistryTests(unittest.TestCase):
+    """Tests for RuleRegistry"""
+
+    def setUp(self):
+        """A registry with rules for ecephys, for any asset with procedures, and for every asset"""
+        self.registry = RuleRegistry()
+        self.calls = []
+        self.names = {}
+        for name, modalities, core_files in [
+            ("ecephys", [Modality.ECEPHYS, "SPIM"], []),
+            ("procedures", [], ["procedures"]),
+            ("all", [], []),
+        ]:
+            rule = self.registry.register(modalities=modalities, core_files=core_files)(
+                lambda target, name=name: self.calls.append((name, target))
+            )
+            self.names[rule] = name
+
+    def planned(self, modalities, core_files):
+        """Names of the planned rules"""
+        return [self.names[rule.function] for rule in self.registry.plan(modalities, core_files)]
+
+    def test_plan(self):
+        """Only the rules for the modalities and core files present are planned, in registration order"""
+        self.assertEqual(["all"], self.planned([Modality.BEHAVIOR], ["subject"]))
+        self.assertEqual(["ecephys", "all"], self.planned(["ecephys", None], []))
+        self.assertEqual(["ecephys", "procedures", "all"], self.planned(["SPIM"], ["procedures"]))
+        self.assertIs(self.registry.plan(["SPIM"], ["procedures"]), self.registry.plan({"SPIM"}, ("procedures",)))
+        self.assertEqual(3, len(self.registry.rules))
+
+    def test_register_clears_plans(self):
+        """Rules registered later are included in plans that were already compiled"""
+        self.assertEqual(1, len(self.registry.plan(["behavior"], [])))
+        self.registry.register(modalities=["behavior"])(lambda target: None)
+        self.assertEqual(2, len(self.registry.plan(["behavior"], [])))
+
+    def test_run(self):
+        """Rules are called with the target and errors are raised"""
+        self.registry.run("asset", ["ecephys"], [])
+        self.assertEqual([("ecephys", "asset"), ("all", "asset")], self.calls)
+        self.registry.register()(MagicMock(side_effect=ValueError("invalid")))
+        with self.assertRaises(ValueError):
+            self.registry.run("asset", [], [])
+
+
+class MetadataRulesTests(unittest.TestCase):
+    """Tests for the rules Metadata runs"""
+
+    def test_registered(self):
+        """The injection materials rule applies to SmartSPIM and ecephys assets with procedures"""
+        self.assertIn(validate_injection_materials, [rule.function for rule in METADATA_RULES.rules])
+        self.assertEqual((), METADATA_RULES.plan(["behavior"], ["procedures"]))
+        self.assertEqual((), METADATA_RULES.plan(["SPIM"], ["data_description"]))
+
+    def test_dispatch(self):
+        """Metadata runs only the rules for its modalities"""
+        registry = RuleRegistry()
+        ecephys_rule = registry.register(modalities=[Modality.ECEPHYS])(MagicMock())
+        subject_rule = registry.register(core_files=["subject"])(MagicMock())
+        metadata = Metadata.model_construct(name="name", location="location", subject=MagicMock())
+        with patch("aind_data_schema.core.metadata.METADATA_RULES", registry):
+            metadata.validate_modality_rules()
+        ecephys_rule.assert_not_called()
+        subject_rule.assert_called_once_with(metadata)
+
+    def test_modality_validators(self):
+        """The former SmartSPIM and ecephys validators call the injection materials rule for their modality"""
+        data_description = MagicMock(modalities=[Modality.SPIM])
+        metadata = Metadata.model_construct(name="name", location="location", data_description=data_description)
+        with patch("aind_data_schema.core.metadata.validate_injection_materials") as rule:
+            self.assertIs(metadata, metadata.validate_smartspim_metadata())
+            rule.assert_called_once_with(metadata)
+            self.assertIs(metadata, metadata.validate_ecephys_metadata())
+            rule.assert_called_once_with(metadata)
+            data_description.modalities = [Modality.ECEPHYS]
+            metadata.validate_ecephys_metadata()
+            self.assertEqual(2, rule.call_count)
+
+
+if __name__ == "__main__":
+    unittest.main()
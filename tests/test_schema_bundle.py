@@ -0,0 +1,84 @@
+"""Tests for splitting and bundling the core model schemas"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from aind_data_schema.core.model import Model
+from aind_data_schema.core.processing import Processing
+from aind_data_schema.utils.json_writer import SchemaWriter
+from aind_data_schema.utils.schema_bundle import (
+    DEFINITIONS_FILE_PREFIX,
+    build_shared_definitions,
+    bundle_schema,
+    definitions_filename,
+    load_bundled_schema,
+    thin_schema,
+)
+
+
+def as_json(value):
+    """Round trip a value through JSON so tuples compare equal to lists"""
+    return json.loads(json.dumps(value))
+
+
+class SchemaBundleTests(unittest.TestCase):
+    """Tests for the shared definitions and thin schemas"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Build shared definitions for two models"""
+        cls.definitions, cls.model_definitions = build_shared_definitions([Model, Processing])
+
+    def test_shared_definitions(self):
+        """Each definition appears once, including the models themselves"""
+        self.assertEqual({Model: "Model", Processing: "Processing"}, self.model_definitions)
+        self.assertIn("DataProcess", self.definitions)
+
+    def test_definitions_filename(self):
+        """The file name changes with the content"""
+        filename = definitions_filename(self.definitions)
+        self.assertTrue(filename.startswith(DEFINITIONS_FILE_PREFIX))
+        self.assertEqual(filename, definitions_filename(dict(reversed(list(self.definitions.items())))))
+        self.assertNotEqual(filename, definitions_filename({"Other": {"type": "string"}}))
+
+    def test_thin_schema_round_trip(self):
+        """Thin schemas reference the definitions file and bundle back to the full schema"""
+        thin = thin_schema(self.definitions, "Processing", "definitions.json")
+        self.assertNotIn("$defs", thin)
+        self.assertEqual("definitions.json#/$defs/DataProcess", thin["properties"]["data_processes"]["items"]["$ref"])
+        self.assertNotIn("definitions.json", json.dumps(self.definitions))
+
+        self.assertEqual(as_json(Processing.model_json_schema()), as_json(bundle_schema(thin, self.definitions)))
+
+    def test_bundle_without_references(self):
+        """A schema without external references is returned unchanged"""
+        schema = {"type": "string"}
+        self.assertEqual(schema, bundle_schema(schema, self.definitions))
+
+
+class SplitSchemaWriterTests(unittest.TestCase):
+    """Tests for SchemaWriter --split"""
+
+    def test_write_split(self):
+        """Split schemas are written next to the definitions file, or relative to it with versions"""
+        with tempfile.TemporaryDirectory() as output:
+            SchemaWriter(["--output", output, "--split"]).write_to_json()
+            definitions_files = list(Path(output).glob(f"{DEFINITIONS_FILE_PREFIX}*.json"))
+            self.assertEqual(1, len(definitions_files))
+            self.assertEqual(
+                as_json(Model.model_json_schema()), load_bundled_schema(Path(output) / "model_schema.json")
+            )
+
+        with tempfile.TemporaryDirectory() as output:
+            SchemaWriter(["--output", output, "--split", "--attach-version"]).write_to_json()
+            version = Model.model_fields["schema_version"].default
+            thin_file = Path(output) / "model" / version / "model_schema.json"
+            with open(thin_file, "r") as f:
+                self.assertIn('"../../definitions_', f.read())
+            self.assertEqual(as_json(Model.model_json_schema()), load_bundled_schema(thin_file))
+
+
+if __name__ == "__main__":
+    unittest.main()
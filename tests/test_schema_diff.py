@@ -0,0 +1,149 @@
+"""Tests for the schema diff engine"""
+
+import json
+import unittest
+from copy import deepcopy
+
+from aind_data_schema.core.subject import Subject
+from aind_data_schema.utils.schema_diff import (
+    ROOT_DEFINITION,
+    ChangeType,
+    SchemaChange,
+    canonical_hash,
+    diff_schemas,
+    find_dependents,
+)
+
+SCHEMA = {
+    "$defs": {
+        "Color": {"enum": ["red", "green"], "title": "Color", "type": "string"},
+        "Leaf": {
+            "properties": {
+                "color": {"$ref": "#/$defs/Color"},
+                "size": {"anyOf": [{"type": "number"}, {"type": "null"}], "default": None, "title": "Size"},
+            },
+            "required": ["color"],
+            "title": "Leaf",
+            "type": "object",
+        },
+        "Branch": {
+            "properties": {"leaves": {"items": {"$ref": "#/$defs/Leaf"}, "title": "Leaves", "type": "array"}},
+            "title": "Branch",
+            "type": "object",
+        },
+    },
+    "properties": {"branch": {"$ref": "#/$defs/Branch"}, "name": {"title": "Name", "type": "string"}},
+    "required": ["branch", "name"],
+    "title": "Tree",
+    "type": "object",
+}
+
+
+class SchemaDiffTests(unittest.TestCase):
+    """Tests for diff_schemas"""
+
+    def setUp(self):
+        """Copy the example schema so tests can modify it"""
+        self.new = deepcopy(SCHEMA)
+
+    def assertChanges(self, expected):
+        """Assert the diff from SCHEMA to self.new contains exactly the expected changes"""
+        self.assertEqual(expected, diff_schemas(SCHEMA, self.new).changes)
+
+    def test_identical(self):
+        """Identical schemas have no changes, regardless of key order or tuples"""
+        reordered = json.loads(json.dumps(SCHEMA, sort_keys=True))
+        reordered["$defs"]["Color"]["enum"] = ("red", "green")
+        self.assertFalse(diff_schemas(SCHEMA, reordered).has_changes)
+        self.assertEqual(canonical_hash(SCHEMA), canonical_hash(json.loads(json.dumps(SCHEMA, sort_keys=True))))
+
+    def test_core_model(self):
+        """A core model's schema does not differ from itself"""
+        schema = Subject.model_json_schema()
+        self.assertFalse(diff_schemas(schema, json.loads(json.dumps(schema))).has_changes)
+
+    def test_type_narrowed_and_widened(self):
+        """Removing enum values narrows a definition, adding union members widens a field"""
+        self.new["$defs"]["Color"]["enum"] = ["red"]
+        self.new["$defs"]["Leaf"]["properties"]["size"]["anyOf"].append({"type": "string"})
+        self.assertChanges(
+            [
+                SchemaChange(definition="Color", change_type=ChangeType.TYPE_NARROWED),
+                SchemaChange(definition="Leaf", change_type=ChangeType.TYPE_WIDENED, field="size"),
+            ]
+        )
+
+    def test_type_changed(self):
+        """Replacing the item type of a list is a type change"""
+        self.new["$defs"]["Branch"]["properties"]["leaves"]["items"] = {"type": "string"}
+        self.assertChanges([SchemaChange(definition="Branch", change_type=ChangeType.TYPE_CHANGED, field="leaves")])
+
+    def test_type_lists_and_boolean_schemas(self):
+        """Lists of types are compared member by member and boolean schemas are supported"""
+        old = {"properties": {"a": {"type": ["string", "null"]}, "b": True}, "title": "Flags", "type": "object"}
+        new = {"properties": {"a": {"type": ["string"]}, "b": {"type": "string"}}, "title": "Flags", "type": "object"}
+        self.assertEqual(
+            [
+                SchemaChange(definition="Flags", change_type=ChangeType.TYPE_NARROWED, field="a"),
+                SchemaChange(definition="Flags", change_type=ChangeType.TYPE_CHANGED, field="b"),
+            ],
+            diff_schemas(old, new).changes,
+        )
+
+    def test_fields_and_defaults(self):
+        """Fields added, removed, made optional and given new defaults are reported"""
+        leaf = self.new["$defs"]["Leaf"]
+        leaf["properties"]["weight"] = {"type": "number"}
+        leaf["properties"]["size"]["default"] = 1.0
+        del self.new["properties"]["name"]
+        self.new["required"] = ["branch"]
+        self.new["$defs"]["Branch"]["required"] = ["leaves"]
+        self.assertChanges(
+            [
+                SchemaChange(definition="Tree", change_type=ChangeType.FIELD_REMOVED, field="name"),
+                SchemaChange(definition="Leaf", change_type=ChangeType.DEFAULT_CHANGED, field="size"),
+                SchemaChange(definition="Leaf", change_type=ChangeType.FIELD_ADDED, field="weight"),
+                SchemaChange(definition="Branch", change_type=ChangeType.REQUIRED_CHANGED, field="leaves"),
+            ]
+        )
+
+    def test_definitions_added_and_removed(self):
+        """New and removed $defs entries are reported, other changes are classified as other"""
+        self.new["$defs"]["Bark"] = {"type": "string"}
+        del self.new["$defs"]["Color"]
+        self.new["description"] = "A tree"
+        self.new["$defs"]["Leaf"]["properties"]["size"]["title"] = "Leaf size"
+        self.assertChanges(
+            [
+                SchemaChange(definition="Tree", change_type=ChangeType.OTHER),
+                SchemaChange(definition="Leaf", change_type=ChangeType.OTHER, field="size"),
+                SchemaChange(definition="Bark", change_type=ChangeType.DEFINITION_ADDED),
+                SchemaChange(definition="Color", change_type=ChangeType.DEFINITION_REMOVED),
+            ]
+        )
+
+    def test_dependents(self):
+        """Changed definitions list everything that transitively references them"""
+        self.new["$defs"]["Color"]["enum"] = ["red", "green", "blue"]
+        schema_diff = diff_schemas(SCHEMA, self.new)
+        self.assertEqual(["Color"], schema_diff.changed_definitions)
+        self.assertEqual({"Color": ["Branch", "Leaf", "Tree"]}, schema_diff.dependents)
+
+    def test_root_name(self):
+        """The top-level schema falls back to '#' when its title is also a definition"""
+        schema = {"title": "Node", "$defs": {"Node": {"type": "object"}}, "type": "object"}
+        new = dict(schema, description="changed")
+        self.assertEqual([ROOT_DEFINITION], diff_schemas(schema, new).changed_definitions)
+
+    def test_find_dependents(self):
+        """References in examples are ignored and cycles terminate"""
+        definitions = {
+            "A": {"$ref": "#/$defs/B"},
+            "B": {"items": {"$ref": "#/$defs/A"}, "examples": [{"$ref": "#/$defs/C"}]},
+            "C": {"type": "string"},
+        }
+        self.assertEqual({"A": ["B"], "C": []}, find_dependents([definitions], ["A", "C"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+"""Tests for the transforms engine"""
+
+import unittest
+
+import numpy as np
+from aind_data_schema_models.units import SizeUnit
+
+from aind_data_schema.components.coordinates import (
+    Affine,
+    AtlasLibrary,
+    NonlinearTransform,
+    Rotation,
+    Scale,
+    Translation,
+)
+from aind_data_schema.utils.transforms import (
+    apply_inverse_transforms,
+    apply_transforms,
+    atlas_shape,
+    points_to_atlas_indices,
+)
+
+
+class ApplyTransformsTests(unittest.TestCase):
+    """Tests for apply_transforms and apply_inverse_transforms"""
+
+    def setUp(self):
+        """Build a transform chain and random points"""
+        self.transforms = [
+            Translation(translation=[1, 2, 3]),
+            Rotation(angles=[10, 20, 30]),
+            Scale(scale=[2, 3, 4]),
+        ]
+        self.points = np.random.default_rng(0).normal(size=(100, 3))
+
+    def test_matches_composed_matrix(self):
+        """Points are mapped by the composed affine matrix"""
+        matrix = np.array(Affine.compose(self.transforms).affine_transform)
+        homogeneous = np.hstack([self.points, np.ones((len(self.points), 1))])
+        expected = (homogeneous @ matrix.T)[:, :3]
+
+        np.testing.assert_allclose(apply_transforms(self.transforms, self.points), expected)
+
+    def test_single_point(self):
+        """A single point keeps its shape"""
+        result = apply_transforms([Translation(translation=[1, 2, 3])], [1, 1, 1])
+        self.assertEqual(result.tolist(), [2.0, 3.0, 4.0])
+
+    def test_inverse_round_trip(self):
+        """The inverse undoes the forward mapping"""
+        forward = apply_transforms(self.transforms, self.points)
+        np.testing.assert_allclose(apply_inverse_transforms(self.transforms, forward), self.points, atol=1e-12)
+
+    def test_non_homogeneous_affine(self):
+        """A 3x4 affine matrix can be applied and inverted"""
+        affine = Affine(affine_transform=[[0.0, 1.0, 0.0, 5.0], [1.0, 0.0, 0.0, 6.0], [0.0, 0.0, 2.0, 7.0]])
+        result = apply_transforms([affine], [[1, 2, 3]])
+        self.assertEqual(result.tolist(), [[7.0, 7.0, 13.0]])
+        self.assertEqual(apply_inverse_transforms([affine], result).tolist(), [[1.0, 2.0, 3.0]])
+
+    def test_invalid_inputs(self):
+        """Mismatched dimensions and nonlinear transforms are rejected"""
+        with self.assertRaises(ValueError):
+            apply_transforms(self.transforms, np.zeros((5, 2)))
+        with self.assertRaises(ValueError):
+            apply_transforms([NonlinearTransform(path="transform.h5")], self.points)
+        with self.assertRaises(ValueError):
+            apply_transforms([Affine(affine_transform=[[1.0, 0.0], [0.0, 1.0], [0.0, 0.0], [0.0, 0.0]])], [1.0])
+
+
+class AtlasIndexTests(unittest.TestCase):
+    """Tests for mapping points to atlas voxels"""
+
+    def test_ccf_indices(self):
+        """Points in micrometers map onto 25um voxels"""
+        atlas = AtlasLibrary.CCFv3_25um
+        indices, in_bounds = points_to_atlas_indices(atlas, [[0, 0, 0], [30, 60, 1000], [-1, 0, 0], [13200, 0, 0]])
+
+        self.assertEqual(indices.tolist(), [[0, 0, 0], [1, 2, 40], [-1, 0, 0], [528, 0, 0]])
+        self.assertEqual(in_bounds.tolist(), [True, True, False, False])
+
+    def test_with_transforms(self):
+        """A transform chain is applied before indexing"""
+        atlas = AtlasLibrary.CCFv3_10um
+        transforms = [Translation(translation=[15, 25, 35])]
+        indices, in_bounds = points_to_atlas_indices(atlas, [[0, 0, 0]], transforms=transforms)
+        self.assertEqual(indices.tolist(), [[1, 2, 3]])
+        self.assertTrue(in_bounds.all())
+
+    def test_physical_size(self):
+        """Atlas sizes in physical units are converted to voxels"""
+        atlas = AtlasLibrary.CCFv3_25um.model_copy(update={"size": [13.2, 8.0, 11.4], "size_unit": SizeUnit.MM})
+        np.testing.assert_allclose(atlas_shape(atlas), [528, 320, 456])
+
+
+if __name__ == "__main__":
+    unittest.main()
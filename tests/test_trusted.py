@@ -0,0 +1,182 @@
+"""Tests for building models from trusted documents"""
+
+import json
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, time, timezone
+from decimal import Decimal
+from enum import Enum
+from pathlib import Path
+from typing import Dict, List, Literal, Optional, Set, Tuple, Union
+
+from pydantic import BaseModel, Field, ValidationError
+
+from aind_data_schema.base import DataModel
+from aind_data_schema.components.reagent import ProbeReagent, ProteinProbe
+from aind_data_schema.core.instrument import Instrument
+from aind_data_schema.core.procedures import Procedures
+from aind_data_schema.utils.trusted import TrustedLoader, construct_trusted, promote
+from examples.ephys_instrument import inst as instrument
+from examples.ophys_procedures import p as procedures
+
+
+class Leaf(BaseModel):
+    """Model without object_type"""
+
+    value: int
+
+
+class Color(str, Enum):
+    """Enum for the enum fields"""
+
+    RED = "red"
+    BLUE = "blue"
+
+
+class Colors(BaseModel):
+    """Model keeping enum members, unlike DataModel which keeps their values"""
+
+    color: Color
+    red: Literal[Color.RED] = Color.RED
+
+
+class Containers(BaseModel):
+    """Model with container, scalar and union fields"""
+
+    times: List[datetime] = []
+    day: Optional[date] = Field(default=None)
+    clock: Optional[time] = Field(default=None)
+    amount: Optional[Decimal] = Field(default=None)
+    pair: Optional[Tuple[int, Leaf]] = Field(default=None)
+    repeated: Tuple[Leaf, ...] = ()
+    unique: Set[int] = set()
+    by_name: Dict[str, Leaf] = {}
+    leaf_or_number: Union[Leaf, int, None] = None
+    ambiguous: Union[int, str, List[int], None] = None
+    path: Optional[Path] = Field(default=None)
+    child: Optional["Containers"] = Field(default=None)
+
+
+class ConstructTrustedTests(unittest.TestCase):
+    """Tests for construct_trusted"""
+
+    def test_matches_validation(self):
+        """Trusted documents give the same models as validation"""
+        for model in (instrument, procedures):
+            data = json.loads(model.model_dump_json())
+            self.assertEqual(
+                type(model).model_validate_json(model.model_dump_json()), construct_trusted(type(model), data)
+            )
+
+    def test_union_by_object_type(self):
+        """Union members are picked by object_type, not by trying each member"""
+        data = {"object_type": "Protein probe", "protein": {"name": "GFP"}, "mass": 1, "mass_unit": "microgram"}
+        reagent = construct_trusted(ProbeReagent, {"name": "probe", "source": {"name": "Other"}, "target": data})
+        self.assertIsInstance(reagent.target, ProteinProbe)
+
+    def test_types(self):
+        """Containers, ISO values and ambiguous unions are built as validation would"""
+        data = {
+            "times": ["2024-01-01T10:00:00Z"],
+            "day": "2024-01-01",
+            "clock": "10:00:00",
+            "amount": 0.1,
+            "pair": [1, {"value": 2}],
+            "repeated": [{"value": 3}],
+            "unique": [1, 1],
+            "by_name": {"a": {"value": 4}},
+            "leaf_or_number": 5,
+            "ambiguous": [6],
+            "path": "a/b.json",
+            "child": {"leaf_or_number": {"value": 7}, "day": "not a date"},
+        }
+        with self.assertRaises(ValidationError):
+            construct_trusted(Containers, data)
+        data["child"]["day"] = "2024-01-02"
+        built = construct_trusted(Containers, data)
+        self.assertEqual(Containers.model_validate(data), built)
+        self.assertEqual(datetime(2024, 1, 1, 10, tzinfo=timezone.utc), built.times[0])
+        self.assertEqual(Decimal("0.1"), built.amount)
+        self.assertIsInstance(built.child.leaf_or_number, Leaf)
+        unexpected = construct_trusted(Containers, {"times": "not a list", "pair": [1, 2], "unknown": 1, "child": None})
+        self.assertEqual(((1, 2), None), (unexpected.pair, unexpected.child))
+        self.assertEqual(
+            construct_trusted(Containers, {"day": date(2024, 1, 3), "amount": Decimal(1)}).day, date(2024, 1, 3)
+        )
+
+    def test_enums(self):
+        """Enum fields hold members or values depending on use_enum_values, as validation gives"""
+        data = {"color": "blue", "red": "red"}
+        self.assertEqual(Colors.model_validate(data), construct_trusted(Colors, data))
+        self.assertIs(Color.RED, construct_trusted(Colors, data).red)
+        self.assertEqual("other", construct_trusted(Colors, {"red": "other"}).red)
+
+    def test_deferred_schema(self):
+        """Models whose deferred schema has not been built yet are built before they are constructed"""
+
+        class TrustedItem(DataModel):
+            """Model whose schema has not been built yet"""
+
+            value: int
+
+        self.assertFalse(TrustedItem.__pydantic_complete__)
+        item = construct_trusted(TrustedItem, {"value": 1})
+        self.assertTrue(TrustedItem.__pydantic_complete__)
+        self.assertEqual({"object_type": "Trusted item", "value": 1}, item.model_dump())
+
+    def test_promote(self):
+        """Trusted instances can be validated later"""
+        trusted = construct_trusted(Instrument, json.loads(instrument.model_dump_json()))
+        self.assertEqual(trusted, promote(trusted))
+        broken = construct_trusted(Instrument, dict(json.loads(instrument.model_dump_json()), location=1))
+        with self.assertRaises(ValidationError):
+            promote(broken)
+
+
+class TrustedLoaderTests(unittest.TestCase):
+    """Tests for TrustedLoader"""
+
+    def test_sampled_verification(self):
+        """One document in verify_every is validated in the background and failures are kept"""
+        valid = json.loads(procedures.model_dump_json())
+        invalid = dict(valid, subject_id=None)
+        with tempfile.TemporaryDirectory() as folder:
+            path = Path(folder) / "procedures.json"
+            path.write_text(json.dumps(invalid))
+            loader = TrustedLoader(Procedures, verify_every=2)
+            self.assertIsNone(loader.load(path).subject_id)
+            loader.load(path)
+            loader.construct(valid, "valid")
+            with self.assertLogs("aind_data_schema.utils.trusted", level="WARNING"):
+                loader.construct(invalid, "invalid")
+                failures = loader.wait()
+            loader.close()
+        self.assertEqual([str(path), "invalid"], [source for source, _ in failures])
+
+    def test_executor(self):
+        """Verification can run in a given executor, which the loader leaves open"""
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            loader = TrustedLoader(Instrument, verify_every=1, executor=executor)
+            data = json.loads(instrument.model_dump_json())
+            for _ in range(3):
+                loader.construct(data)
+            loader.close()
+            self.assertEqual([], loader.failures)
+            self.assertEqual(1, executor.submit(int, 1).result())
+        self.assertEqual([], TrustedLoader(Instrument).wait())
+
+
+class LoadTrustedTests(unittest.TestCase):
+    """Tests for DataCoreModel.load_trusted"""
+
+    def test_load_trusted(self):
+        """Files written by write_standard_file load back without validation"""
+        with tempfile.TemporaryDirectory() as folder:
+            instrument.write_standard_file(output_directory=Path(folder))
+            loaded = Instrument.load_trusted(Path(folder) / "instrument.json")
+        self.assertEqual(Instrument.model_validate_json(instrument.model_dump_json()), loaded)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+"""Tests for validation tiers"""
+
+import json
+import unittest
+import warnings
+
+from pydantic import BaseModel, ValidationError, ValidationInfo, field_validator, model_validator
+
+from aind_data_schema.core.instrument import Instrument
+from aind_data_schema.core.metadata import Metadata
+from aind_data_schema.utils.validation_tiers import (
+    VALIDATION_TIER,
+    ValidationTier,
+    get_validation_tier,
+    tiered,
+    validation_tier,
+)
+from examples.ephys_acquisition import acquisition
+from examples.ephys_instrument import inst as instrument
+
+
+class Checked(BaseModel):
+    """Model with a validator of each kind, each recording that it ran"""
+
+    value: int = 0
+    calls: list = []
+
+    @field_validator("value", mode="before")
+    @tiered(ValidationTier.MODEL)
+    def check_before(cls, value, info: ValidationInfo):
+        """Reject negative values"""
+        if isinstance(value, int) and value < 0:
+            raise ValueError(f"{info.field_name} is negative")
+        return value
+
+    @model_validator(mode="after")
+    @tiered(ValidationTier.CROSS_FILE)
+    def check_after(self):
+        """Record the call"""
+        self.calls.append("after")
+        return self
+
+
+class ValidationTierTests(unittest.TestCase):
+    """Tests for tiered validators"""
+
+    def test_context(self):
+        """Validators above the tier in the validation context are skipped"""
+        self.assertEqual(-1, Checked.model_validate({"value": -1}, context={VALIDATION_TIER: "structural"}).value)
+        checked = Checked.model_validate({"value": 1, "calls": []}, context={VALIDATION_TIER: ValidationTier.MODEL})
+        self.assertEqual([], checked.calls)
+        with self.assertRaises(ValidationError):
+            Checked.model_validate({"value": -1}, context={VALIDATION_TIER: ValidationTier.MODEL})
+        self.assertEqual(["after"], Checked.model_validate({"calls": []}, context={"other": 1}).calls)
+
+    def test_context_manager(self):
+        """validation_tier sets the tier for a block, a tier in the validation context takes precedence"""
+        with validation_tier("structural") as tier:
+            self.assertEqual(ValidationTier.STRUCTURAL, tier)
+            self.assertEqual(-1, Checked(value=-1).value)
+            self.assertEqual(["after"], Checked.model_validate({"calls": []}, context={VALIDATION_TIER: "full"}).calls)
+        self.assertEqual(ValidationTier.FULL, get_validation_tier())
+        with self.assertRaises(ValueError):
+            with validation_tier("everything"):
+                pass  # pragma: no cover
+
+    def test_direct_call(self):
+        """Tagged validators can still be called directly"""
+        checked = Checked.model_construct(calls=[])
+        checked.check_after()
+        self.assertEqual(["after"], checked.calls)
+        self.assertEqual(ValidationTier.CROSS_FILE, Checked.check_after.validation_tier)
+
+    def test_core_models(self):
+        """Per-model checks are skipped below the model tier"""
+        data = json.loads(instrument.model_dump_json())
+        data["connections"].append({"source_device": "Missing device", "target_device": "Missing device"})
+        with self.assertRaises(ValidationError):
+            Instrument.model_validate(json.loads(json.dumps(data)))
+        with validation_tier(ValidationTier.STRUCTURAL):
+            self.assertEqual(len(data["connections"]), len(Instrument.model_validate(data).connections))
+
+    def test_metadata(self):
+        """Cross-file checks are skipped below the cross-file tier, also for the core files Metadata validates"""
+        data = {"name": "asset", "location": "location", "acquisition": json.loads(acquisition.model_dump_json())}
+        with self.assertRaises(ValidationError):
+            Metadata.model_validate(json.loads(json.dumps(data)))
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            Metadata.model_validate(json.loads(json.dumps(data)), context={VALIDATION_TIER: ValidationTier.MODEL})
+        self.assertTrue(any("commit_hash" in str(warning.message) for warning in caught))
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            metadata = Metadata.model_validate(data, context={VALIDATION_TIER: ValidationTier.STRUCTURAL})
+        self.assertFalse(any("commit_hash" in str(warning.message) for warning in caught))
+        self.assertEqual(acquisition.instrument_id, metadata.acquisition.instrument_id)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,174 @@
+"""Tests for the incremental metadata directory validator"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from aind_data_schema.core.metadata import Metadata
+from aind_data_schema.utils import watch
+from aind_data_schema.utils.watch import InotifyEvents, MetadataWatcher, PollingEvents
+from examples.data_description import d as data_description
+from examples.subject import s as subject
+
+
+def summarize(results):
+    """(kind, asset folder name, file name, valid) of each result"""
+    return [
+        (r.kind, *Path(r.path).parts[-2:], r.valid) if r.kind != "asset" else (r.kind, Path(r.path).name, r.valid)
+        for r in results
+    ]
+
+
+class MetadataWatcherTests(unittest.TestCase):
+    """Tests for MetadataWatcher"""
+
+    def setUp(self):
+        """Two asset folders, each with a subject and a data description"""
+        self.folder = tempfile.TemporaryDirectory()
+        self.addCleanup(self.folder.cleanup)
+        self.root = Path(self.folder.name)
+        for asset in ("a", "b"):
+            (self.root / asset).mkdir()
+            subject.write_standard_file(output_directory=self.root / asset)
+            data_description.write_standard_file(output_directory=self.root / asset)
+        (self.root / "a" / "metadata.nd.json").write_text("{}")
+
+    def test_check(self):
+        """Only changed files are validated, and only the assets they belong to"""
+        watcher = MetadataWatcher(self.root)
+        results = list(watcher.check())
+        self.assertEqual(6, len(results))
+        self.assertTrue(all(result.kind == "file" and result.valid for result in results[:4]))
+        self.assertEqual(["a", "b"], [Path(result.path).name for result in results[4:]])
+        self.assertTrue(all(result.kind == "asset" for result in results[4:]))
+        self.assertTrue(results[4].valid)
+        self.assertIn("Metadata missing required file: procedures", results[4].warnings)
+        self.assertEqual([], list(watcher.check()))
+
+        subject_file = self.root / "a" / "subject.json"
+        os.utime(subject_file, (0, 0))
+        self.assertEqual([], list(watcher.check()))
+
+        contents = json.loads(subject_file.read_text())
+        subject_file.write_text(json.dumps(dict(contents, subject_id=None)))
+        results = list(watcher.check())
+        self.assertEqual([("file", "a", "subject.json", False)], summarize(results))
+        self.assertIn("subject_id", results[0].errors[0])
+
+        subject_file.write_text(json.dumps(contents))
+        self.assertEqual([("file", "a", "subject.json", True), ("asset", "a", True)], summarize(watcher.check()))
+
+        subject_file.unlink()
+        results = list(watcher.check())
+        self.assertEqual([("removed", "a", "subject.json", True), ("asset", "a", False)], summarize(results))
+
+        with patch.object(watch, "Metadata", side_effect=lambda **fields: Metadata(**dict(fields, name=None))):
+            (self.root / "a" / "data_description.json").write_text(data_description.model_dump_json())
+            results = list(watcher.check())
+        self.assertEqual([("file", "a", "data_description.json", True), ("asset", "a", False)], summarize(results))
+        self.assertEqual(["name: Input should be a valid string"], results[1].errors)
+
+        (self.root / "a" / "data_description.json").unlink()
+        self.assertEqual([("removed", "a", "data_description.json", True)], summarize(watcher.check()))
+
+    def test_unreadable_file(self):
+        """Files that disappear or can't be read are reported"""
+        watcher = MetadataWatcher(self.root)
+        path = str(self.root / "a" / "subject.json")
+        with patch.object(Path, "read_bytes", side_effect=PermissionError("denied")):
+            result = watcher._validate_file(path)
+        self.assertEqual(["PermissionError: denied"], result.errors)
+
+        with patch("builtins.open", side_effect=FileNotFoundError):
+            changed, removed = watcher._changed_files()
+        self.assertEqual([], changed)
+        self.assertEqual(4, len(removed))
+
+        with patch.object(watch.os, "stat", side_effect=FileNotFoundError):
+            self.assertEqual({}, watch.find_core_files(self.root))
+
+    def _watch_for_change(self, watcher: MetadataWatcher):
+        """Start watching, change a file from another thread and return the results after the change"""
+        stop = threading.Event()
+        results = watcher.watch(stop)
+        initial = [next(results) for _ in range(6)]
+        self.assertEqual(6, len(initial))
+
+        def edit():
+            """Change the subject of asset b"""
+            path = self.root / "b" / "subject.json"
+            path.write_text(json.dumps(dict(json.loads(path.read_text()), subject_id="changed")))
+
+        threading.Timer(0.05, edit).start()
+        changed = [next(results), next(results)]
+        stop.set()
+        self.assertEqual([], list(results))
+        return changed
+
+    def test_watch_inotify(self):
+        """Changes are picked up through inotify"""
+        watcher = MetadataWatcher(self.root, debounce=0.05, poll_interval=0.05)
+        with patch.object(watch, "PollingEvents", side_effect=AssertionError("polling")):
+            changed = self._watch_for_change(watcher)
+        self.assertEqual([("file", "b", "subject.json", True), ("asset", "b", True)], summarize(changed))
+
+    def test_watch_polling(self):
+        """Changes are picked up by polling when inotify isn't used"""
+        watcher = MetadataWatcher(self.root, debounce=0.05, poll_interval=0.02, use_inotify=False)
+        changed = self._watch_for_change(watcher)
+        self.assertEqual([("file", "b", "subject.json", True), ("asset", "b", True)], summarize(changed))
+
+
+class EventsTests(unittest.TestCase):
+    """Tests for the change notification sources"""
+
+    def test_inotify_unavailable(self):
+        """The watcher falls back to polling without inotify"""
+        with tempfile.TemporaryDirectory() as folder:
+            with patch.object(watch, "_load_libc", return_value=object()):
+                self.assertIsInstance(MetadataWatcher(folder)._events(), PollingEvents)
+            for error in (AttributeError, TypeError):
+                with patch.object(watch, "_load_libc", side_effect=error):
+                    self.assertIsInstance(MetadataWatcher(folder)._events(), PollingEvents)
+            with patch.object(watch.sys, "platform", "darwin"), patch.object(watch, "_load_libc") as load_libc:
+                self.assertIsInstance(MetadataWatcher(folder)._events(), PollingEvents)
+            load_libc.assert_not_called()
+            with patch.object(watch, "_load_libc", return_value=MagicMock(**{"inotify_init1.return_value": -1})):
+                with self.assertRaises(OSError):
+                    InotifyEvents(folder)
+
+    def test_inotify_new_folder(self):
+        """Folders created after the watch started are watched too"""
+        with tempfile.TemporaryDirectory() as folder:
+            events = InotifyEvents(folder)
+            self.assertFalse(events.wait(0))
+            os.mkdir(os.path.join(folder, "asset"))
+            self.assertTrue(events.wait(1))
+            Path(folder, "asset", "subject.json").write_text("{}")
+            self.assertTrue(events.wait(1))
+            events.close()
+
+    def test_settle(self):
+        """Validation waits until changes have stopped for the debounce interval"""
+        events = MagicMock(**{"wait.side_effect": [True, True, False]})
+        watch._settle(events, 0.5)
+        self.assertEqual(3, events.wait.call_count)
+        events.wait.assert_called_with(0.5)
+
+    def test_polling_timeout(self):
+        """Polling returns False when nothing changed before the timeout"""
+        with tempfile.TemporaryDirectory() as folder:
+            events = PollingEvents(folder, poll_interval=0.01)
+            start = time.monotonic()
+            self.assertFalse(events.wait(0.03))
+            self.assertLess(time.monotonic() - start, 1)
+            events.close()
+
+
+if __name__ == "__main__":
+    unittest.main()